@@ -0,0 +1,46 @@
+"""Compare drop-frame string formatting via per-element lookups against single-pass `CountingMode.components()`
+
+Formats frames spread across 26 hours of material, which is where the drop-frame math earns its keep.
+
+Usage: python benchmarks/bench_dropframe_format.py [samples]
+"""
+
+import os, sys, timeit
+
+# Run straight from a checkout, without installing the package first
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from timecode.modes import DropFrame
+
+def format_per_element(framenumber:int, rate:int) -> str:
+	"""The previous approach: each element recalculates the dropped frames on its own"""
+
+	sign = '-' if framenumber < 0 else ''
+	framenumber = abs(framenumber)
+
+	return sign + DropFrame.SEPARATOR.join([
+		str(DropFrame.hours(framenumber, rate)).zfill(2),
+		str(DropFrame.minutes(framenumber, rate)).zfill(2),
+		str(DropFrame.seconds(framenumber, rate)).zfill(2),
+		str(DropFrame.frames(framenumber, rate)).zfill(len(str(rate)))
+	])
+
+def main(samples:int=200_000):
+
+	print(f"Formatting {samples:,} DF timecodes spread across 26 hours")
+
+	for rate in (30, 60, 120):
+
+		# 26 hours' worth of frames at this rate, roughly
+		last_frame = rate * 60 * 60 * 26
+		frame_numbers = range(0, last_frame, last_frame // samples)
+
+		assert all(format_per_element(x, rate) == DropFrame._string_from_frame_number(x, rate) for x in frame_numbers[::1000])
+
+		per_element = min(timeit.repeat(lambda: [format_per_element(x, rate) for x in frame_numbers], number=1, repeat=3))
+		single_pass = min(timeit.repeat(lambda: [DropFrame._string_from_frame_number(x, rate) for x in frame_numbers], number=1, repeat=3))
+
+		print(f"{rate:>3} DF: per-element {per_element:.3f}s  single-pass {single_pass:.3f}s  ({per_element/single_pass:.2f}x)")
+
+if __name__ == "__main__":
+	main(*(int(x) for x in sys.argv[1:2]))
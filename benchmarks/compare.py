@@ -0,0 +1,48 @@
+"""Compare two benchmark runs from ``run.py`` and flag regressions
+
+Exits with status 1 if any benchmark got slower by more than the threshold, so it can gate a release.
+
+Usage: python benchmarks/compare.py baseline.json results.json [--threshold 0.10]
+"""
+
+import argparse, json, sys, typing
+
+def load(path:str) -> typing.Dict[typing.Tuple[str, int], float]:
+	"""Best timings by (name, size)"""
+	with open(path) as results_file:
+		return {(result["name"], result["size"]): result["best"] for result in json.load(results_file)["results"]}
+
+def main() -> int:
+
+	parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+	parser.add_argument("baseline")
+	parser.add_argument("results")
+	parser.add_argument("--threshold", type=float, default=0.10, help="slowdown to treat as a regression (default: 0.10 for 10%%)")
+	args = parser.parse_args()
+
+	baseline = load(args.baseline)
+	results = load(args.results)
+
+	regressions = 0
+
+	for key in sorted(baseline.keys() & results.keys()):
+		name, size = key
+		change = results[key] / baseline[key] - 1
+
+		flag = ""
+		if change > args.threshold:
+			flag = "  REGRESSION"
+			regressions += 1
+		elif change < -args.threshold:
+			flag = "  faster"
+
+		print(f"{name:<32} {size:>10,}  {baseline[key]*1000:>10.2f}ms -> {results[key]*1000:>10.2f}ms  {change:>+7.1%}{flag}")
+
+	for name, size in sorted(baseline.keys() - results.keys()):
+		print(f"{name:<32} {size:>10,}  missing from {args.results}")
+
+	print(f"\n{regressions} regression(s) over {args.threshold:.0%}")
+	return 1 if regressions else 0
+
+if __name__ == "__main__":
+	sys.exit(main())
@@ -0,0 +1,210 @@
+"""Benchmark suite for parsing, formatting, drop-frame math, ranges, comparisons, arithmetic and resampling
+
+Each benchmark is timed at each requested size, and the results are written as JSON so that runs can be compared
+with ``compare.py``.
+
+Usage:
+	python benchmarks/run.py [--sizes 1e3,1e4,1e5,1e6] [--repeat 5] [--filter format] [--output results.json]
+	python benchmarks/compare.py baseline.json results.json
+"""
+
+import argparse, datetime, json, os, platform, statistics, subprocess, sys, timeit, typing
+
+# Run straight from a checkout, without installing the package first
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from timecode import Timecode, TimecodeRange, TimecodeIndex, Resampler
+from timecode.modes import CountingMode, DropFrame, NonDropFrame
+
+DEFAULT_SIZES = (1_000, 10_000, 100_000, 1_000_000)
+"""Number of frames for each benchmark, unless given on the command line"""
+
+TIMEBASES = (
+	(NonDropFrame, 24),
+	(NonDropFrame, 30),
+	(NonDropFrame, 60),
+	(NonDropFrame, 120),
+	(DropFrame, 30),
+	(DropFrame, 60),
+	(DropFrame, 120),
+)
+"""Counting modes and rates to parse and format"""
+
+HOURS = 26
+"""Frames are spread across this many hours, to exercise every timecode element (and the drop-frame math)"""
+
+BENCHMARKS:typing.Dict[str, typing.Callable[[int], typing.Callable[[], typing.Any]]] = {}
+"""Benchmark setup functions by name.  Each takes a size, and returns the function to time."""
+
+def benchmark(name:str):
+	"""Register a benchmark setup function"""
+	def register(setup):
+		BENCHMARKS[name] = setup
+		return setup
+	return register
+
+def spread_frames(size:int, rate:int) -> range:
+	"""`size` frame numbers spread evenly across `HOURS` hours"""
+	last_frame = rate * 60 * 60 * HOURS
+	return range(0, last_frame, max(1, last_frame // size))[:size]
+
+def label(mode:typing.Type[CountingMode], rate:int) -> str:
+	return f"{rate}{mode.__name__.replace('NonDropFrame', 'NDF').replace('DropFrame', 'DF')}"
+
+# Parsing and formatting
+
+def _register_timebase_benchmarks(mode:typing.Type[CountingMode], rate:int):
+
+	@benchmark(f"parse/{label(mode, rate)}")
+	def parse(size:int):
+		strings = [mode._string_from_frame_number(x, rate) for x in spread_frames(size, rate)]
+		return lambda: [Timecode(tc, mode=mode(), rate=rate) for tc in strings]
+
+	@benchmark(f"parse_many/{label(mode, rate)}")
+	def parse_many(size:int):
+		strings = [mode._string_from_frame_number(x, rate) for x in spread_frames(size, rate)]
+		return lambda: mode.parse_many(strings, rate)
+
+	@benchmark(f"format/{label(mode, rate)}")
+	def format(size:int):
+		timecodes = [Timecode(x, mode=mode(), rate=rate) for x in spread_frames(size, rate)]
+		return lambda: [str(tc) for tc in timecodes]
+
+for _mode, _rate in TIMEBASES:
+	_register_timebase_benchmarks(_mode, _rate)
+
+for _rate in (30, 60, 120):
+
+	@benchmark(f"dropframe/get_dropped_frames/{_rate}")
+	def get_dropped_frames(size:int, rate:int=_rate):
+		frame_numbers = spread_frames(size, rate)
+		return lambda: [DropFrame.get_dropped_frames(x, rate) for x in frame_numbers]
+
+# Ranges
+
+@benchmark("range/iter")
+def range_iter(size:int):
+	tc_range = TimecodeRange(start=Timecode("01:00:00:00"), duration=size)
+	return lambda: list(tc_range)
+
+@benchmark("range/contains")
+def range_contains(size:int):
+	tc_range = TimecodeRange(start=Timecode(0), duration=size // 2)
+	timecodes = [Timecode(x) for x in range(size)]
+	return lambda: [tc in tc_range for tc in timecodes]
+
+@benchmark("range/getitem")
+def range_getitem(size:int):
+	tc_range = TimecodeRange(start=Timecode(0), duration=size)
+	return lambda: [tc_range[idx] for idx in range(size)]
+
+# Comparisons and arithmetic
+
+@benchmark("compare/lt")
+def compare_lt(size:int):
+	timecodes = [Timecode(x) for x in range(size)]
+	other = Timecode(size // 2)
+	return lambda: [tc < other for tc in timecodes]
+
+@benchmark("compare/sort")
+def compare_sort(size:int):
+	timecodes = [Timecode((x * 7919) % size) for x in range(size)]
+	return lambda: sorted(timecodes)
+
+@benchmark("arithmetic/add_int")
+def arithmetic_add_int(size:int):
+	timecodes = [Timecode(x) for x in range(size)]
+	return lambda: [tc + 24 for tc in timecodes]
+
+@benchmark("arithmetic/add_timecode")
+def arithmetic_add_timecode(size:int):
+	timecodes = [Timecode(x) for x in range(size)]
+	offset = Timecode("01:00:00:00")
+	return lambda: [tc + offset for tc in timecodes]
+
+# Resampling
+
+@benchmark("resample/timecode/24-30")
+def resample_timecode(size:int):
+	timecodes = [Timecode(x) for x in spread_frames(size, 24)]
+	return lambda: [tc.resample(rate=30) for tc in timecodes]
+
+@benchmark("resample/frames/24-25")
+def resample_frames(size:int):
+	resampler = Resampler.get(NonDropFrame.get_timebase(24), NonDropFrame.get_timebase(25))
+	frame_numbers = list(spread_frames(size, 24))
+	return lambda: resampler.resample_frames(frame_numbers)
+
+# Indexes
+
+@benchmark("index/find/spanning")
+def index_find_spanning(size:int):
+	# One long range reaching over all the short ones, which each query has to see past
+	ranges = [TimecodeRange(start=Timecode(x * 10), duration=5) for x in range(size)]
+	index = TimecodeIndex(ranges + [TimecodeRange(start=Timecode(0), duration=size * 10)])
+	queries = [x * 10 + 7 for x in range(0, size, max(1, size // 1000))]
+	return lambda: [index.find(x) for x in queries]
+
+def git_revision() -> typing.Optional[str]:
+	try:
+		return subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, check=True).stdout.strip()
+	except (OSError, subprocess.CalledProcessError):
+		return None
+
+def run(sizes:typing.Iterable[int], repeat:int=5, name_filter:str="") -> typing.Dict[str, typing.Any]:
+	"""Run the matching benchmarks at each size, and return the results"""
+
+	results = []
+
+	for name, setup in BENCHMARKS.items():
+
+		if name_filter not in name:
+			continue
+
+		for size in sizes:
+			func = setup(size)
+			timings = timeit.repeat(func, number=1, repeat=repeat)
+			best = min(timings)
+
+			results.append({
+				"name":        name,
+				"size":        size,
+				"best":        best,
+				"median":      statistics.median(timings),
+				"repeat":      repeat,
+				"ns_per_item": best / size * 1e9,
+			})
+
+			print(f"{name:<32} {size:>10,}  {best*1000:>10.2f}ms  {best / size * 1e9:>8.1f}ns/item", file=sys.stderr)
+
+	return {
+		"meta": {
+			"timestamp": datetime.datetime.now(datetime.timezone.utc).isoformat(),
+			"revision":  git_revision(),
+			"python":    platform.python_version(),
+			"platform":  platform.platform(),
+		},
+		"results": results,
+	}
+
+def main():
+
+	parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+	parser.add_argument("--sizes", default=",".join(str(x) for x in DEFAULT_SIZES), help="comma-separated frame counts (e.g. 1e3,1e4,1e7)")
+	parser.add_argument("--repeat", type=int, default=5, help="timings per benchmark; the best is reported")
+	parser.add_argument("--filter", default="", help="only run benchmarks whose name contains this")
+	parser.add_argument("--output", default="-", help="where to write the JSON results (default: stdout)")
+	args = parser.parse_args()
+
+	sizes = [int(float(x)) for x in args.sizes.split(",")]
+	results = run(sizes, args.repeat, args.filter)
+
+	if args.output == "-":
+		json.dump(results, sys.stdout, indent="\t")
+		print()
+	else:
+		with open(args.output, "w") as output:
+			json.dump(results, output, indent="\t")
+
+if __name__ == "__main__":
+	main()
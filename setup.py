@@ -1,3 +1,3 @@
 from setuptools import setup, find_packages
 
-setup(name="timecode", packages=find_packages())
\ No newline at end of file
+setup(name="timecode", packages=find_packages(), extras_require={"numpy": ["numpy"]})
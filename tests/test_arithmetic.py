@@ -0,0 +1,45 @@
+import pytest
+from timecode import Timecode, TimecodeRange
+from timecode.modes import DropFrame, NonDropFrame
+
+def test_integer_input_is_not_reparsed():
+
+	# A frame number is a frame number, regardless of counting mode
+	assert Timecode(1800, mode=DropFrame()).frame_number == 1800
+	assert Timecode(-86400).frame_number == -86400
+
+	# ...but it still has to be allowed by the counting mode
+	class PositiveOnly(NonDropFrame):
+		ALLOW_NEGATIVE_TIMECODE = False
+
+	with pytest.raises(ValueError):
+		Timecode(-1, mode=PositiveOnly())
+	with pytest.raises(ValueError):
+		Timecode(True)
+
+def test_arithmetic_keeps_timebase():
+
+	tc = Timecode("01:00:00;00", mode=DropFrame(), rate=60)
+
+	for result in (tc + 1, 1 + tc, tc - 1, 216000 - tc, tc * 2, tc / 2):
+		assert type(result.mode) is DropFrame
+		assert result.rate == 60
+
+	assert (tc + 1).frame_number == tc.frame_number + 1
+	assert (tc - Timecode(10, mode=DropFrame(), rate=60)).frame_number == tc.frame_number - 10
+
+def test_resample():
+
+	tc = Timecode("01:00:00:00", rate=24)
+	assert tc.resample(rate=48).frame_number == 172800
+	assert type(tc.resample(rate=30, mode=DropFrame()).mode) is DropFrame
+
+def test_range_iteration():
+
+	tc_range = TimecodeRange(start=Timecode("00:59:59:00"), duration=48)
+	timecodes = list(tc_range)
+
+	assert len(timecodes) == 48
+	assert timecodes[0] == tc_range.start
+	assert timecodes[-1] + 1 == tc_range.end
+	assert all(tc.rate == 24 for tc in timecodes)
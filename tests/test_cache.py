@@ -0,0 +1,59 @@
+import pytest
+from timecode import Timecode, cache
+from timecode.modes import DropFrame
+
+@pytest.fixture
+def enabled_cache():
+	cache.enable(maxsize=2)
+	yield cache
+	cache.disable()
+
+def test_disabled_by_default():
+	assert not cache.is_enabled()
+	assert cache.stats() == {"parse": None, "format": None}
+
+def test_hits_and_misses(enabled_cache):
+
+	for _ in range(3):
+		assert str(Timecode("01:00:00:00")) == "01:00:00:00"
+
+	stats = enabled_cache.stats()
+	assert (stats["parse"]["hits"], stats["parse"]["misses"]) == (2, 1)
+	assert (stats["format"]["hits"], stats["format"]["misses"]) == (2, 1)
+
+def test_keyed_by_timebase(enabled_cache):
+
+	assert Timecode("00:01:00:00", rate=24).frame_number == 1440
+	assert Timecode("00:01:00:00", rate=30).frame_number == 1800
+	assert str(Timecode(1800, rate=30)) == "00:01:00:00"
+	assert str(Timecode(1800, rate=30, mode=DropFrame())) == "00;01;00;02"
+
+def test_keyed_by_strictness(enabled_cache):
+
+	# A nonexistent label parsed leniently mustn't be let through a strict parse later
+	assert Timecode("00;01;00;00", mode=DropFrame()).frame_number == 1800
+	with pytest.raises(ValueError):
+		Timecode("00;01;00;00", mode=DropFrame(), strict=True)
+
+def test_eviction():
+
+	lru = cache.TimecodeCache(maxsize=2, eviction="lru")
+	fifo = cache.TimecodeCache(maxsize=2, eviction="fifo")
+
+	for c in (lru, fifo):
+		c.put("a", 1)
+		c.put("b", 2)
+		c.get("a")
+		c.put("c", 3)
+
+	assert lru.get("a") == 1 and lru.get("b") is None
+	assert fifo.get("a") is None and fifo.get("b") == 2
+	assert lru.evictions == fifo.evictions == 1
+
+def test_bad_settings():
+
+	with pytest.raises(ValueError):
+		cache.TimecodeCache(maxsize=0)
+
+	with pytest.raises(ValueError):
+		cache.TimecodeCache(eviction="random")
@@ -0,0 +1,76 @@
+import array, fractions
+import pytest
+from timecode import Timecode, TimecodeRange, clock
+from timecode.modes import DropFrame, NonDropFrame
+
+def test_real_rate():
+
+	assert DropFrame.get_timebase(30).real_rate == fractions.Fraction(30000, 1001)
+	assert DropFrame.get_timebase(60).real_rate == fractions.Fraction(60000, 1001)
+	assert NonDropFrame.get_timebase(25).real_rate == 25
+
+def test_timecode_seconds():
+
+	tc = Timecode("01;00;00;00", mode=DropFrame())
+	assert tc.to_seconds() == fractions.Fraction(107892 * 1001, 30000)
+	assert Timecode.from_seconds(tc.to_seconds(), mode=DropFrame()) == tc
+
+	# 23.976 isn't a mode of its own, so its real rate is given
+	assert Timecode("01:00:00:00").to_seconds(real_rate=fractions.Fraction(24000, 1001)) == fractions.Fraction("3603.6")
+	assert Timecode.from_seconds("3603.6", real_rate=fractions.Fraction(24000, 1001)) == Timecode("01:00:00:00")
+
+	assert Timecode.from_seconds(fractions.Fraction(1, 48), rate=24, rounding="floor").frame_number == 0
+	assert Timecode.from_seconds(fractions.Fraction(1, 48), rate=24).frame_number == 1
+	assert Timecode.from_seconds(fractions.Fraction(-1, 48), rate=24).frame_number == -1
+
+def test_timecode_samples():
+
+	assert Timecode(1, mode=DropFrame()).to_samples() == 1602
+	assert Timecode(1, mode=DropFrame()).to_samples(rounding="floor") == 1601
+	assert Timecode(24).to_samples(96000) == 96000
+
+	assert Timecode.from_samples(48048, mode=DropFrame()) == Timecode(30, mode=DropFrame())
+
+	with pytest.raises(ValueError):
+		Timecode(1).to_samples(0)
+
+def test_range_conversions():
+
+	tc_range = TimecodeRange(start=Timecode(24), duration=48)
+
+	assert tc_range.to_seconds() == (1, 3)
+	assert tc_range.to_samples() == (48000, 144000)
+
+	tc_range = TimecodeRange.from_seconds("0.1", "0.9", rate=24)
+	assert (tc_range.start, tc_range.end) == (Timecode(2), Timecode(22))
+
+	tc_range = TimecodeRange.from_samples(0, 48048, mode=DropFrame())
+	assert (tc_range.start.frame_number, tc_range.end.frame_number) == (0, 30)
+
+def test_bulk_roundtrip():
+
+	frame_numbers = list(range(-1000, 2589408, 997))
+
+	seconds = clock.to_seconds(frame_numbers, mode=DropFrame())
+	assert isinstance(seconds, array.array) and seconds.typecode == "d"
+	assert clock.from_seconds(seconds, mode=DropFrame()).tolist() == frame_numbers
+
+	samples = clock.to_samples(frame_numbers, mode=DropFrame())
+	assert samples.tolist() == [Timecode(x, mode=DropFrame()).to_samples() for x in frame_numbers]
+	assert clock.from_samples(samples, mode=DropFrame()).tolist() == frame_numbers
+
+	assert clock.to_samples([0, 1, 2], rate=25).tolist() == [0, 1920, 3840]
+
+def test_bulk_numpy():
+
+	numpy = pytest.importorskip("numpy")
+	from timecode.timecodearray import TimecodeArray
+
+	timecodes = TimecodeArray(range(0, 200000, 13), mode=DropFrame())
+
+	assert numpy.allclose(timecodes.to_seconds(), clock.to_seconds(timecodes.frame_numbers.tolist(), mode=DropFrame()))
+	assert (TimecodeArray.from_seconds(timecodes.to_seconds(), mode=DropFrame()) == timecodes).all()
+
+	samples = timecodes.to_samples()
+	assert samples.tolist() == clock.to_samples(timecodes.frame_numbers.tolist(), mode=DropFrame()).tolist()
+	assert (TimecodeArray.from_samples(samples, mode=DropFrame()) == timecodes).all()
@@ -0,0 +1,39 @@
+from timecode import Timecode
+from timecode.continuity import ContinuityChecker, Discontinuity, check_continuity
+from timecode.modes import DropFrame, NonDropFrame
+
+def test_clean_track():
+
+	track = DropFrame.format_many(range(1000, 30000))
+	assert list(check_continuity(track, mode=DropFrame())) == []
+	assert list(check_continuity(range(-10, 10))) == []
+
+def test_discontinuities():
+
+	track = ["00;00;59;28", "00;00;59;29", "00;01;00;00", "00;01;00;03", "00;01;00;03", "00;01;00;10", "garbage", "00;01;00;12", 1811, b"00;01;00;16", "00;01;00;15"]
+
+	assert list(check_continuity(track, mode=DropFrame())) == [
+		Discontinuity(2, 1800, 1800, "invalid"),
+		Discontinuity(4, 1802, 1801, "repeat"),
+		Discontinuity(5, 1802, 1808, "jump"),
+		Discontinuity(6, 1809, None, "invalid"),
+		Discontinuity(9, 1812, 1814, "jump"),
+		Discontinuity(10, 1815, 1813, "backward"),
+	]
+
+def test_checker():
+
+	checker = ContinuityChecker(rate=24)
+
+	assert checker.check("garbage") == Discontinuity(0, None, None, "invalid")
+	assert checker.check("00:59:59:23") is None
+	assert checker.expected == Timecode("01:00:00:00").frame_number
+
+	# Labels written differently still count, if they're the right frame
+	assert checker.check("1:00:00:00") is None
+	assert checker.check(86401) is None
+	assert checker.check("01:00:00:02") is None
+	assert checker.index == 5
+
+	checker.reset()
+	assert checker.check("10:00:00:00") is None
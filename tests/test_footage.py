@@ -0,0 +1,66 @@
+import array, pytest
+from timecode import Footage, Timecode
+from timecode.footage import FilmGauge, GAUGES, GAUGE_16MM, GAUGE_35MM_3PERF, GAUGE_35MM_4PERF
+
+def test_parse_35mm_4perf():
+
+	assert Footage("10+05").frame_number == 165
+	assert Footage("-1+01").frame_number == -17
+	assert Footage("7").frame_number == 7
+	assert str(Footage(16)) == "1+00"
+	assert str(Footage(-17)) == "-1+01"
+	assert Footage(Footage(40)).frame_number == 40
+
+	with pytest.raises(ValueError):
+		Footage("1+2+3")
+	with pytest.raises(ValueError):
+		Footage("one+two")
+
+	# Strictly one optional sign, then digits, with the frames fitting within the foot
+	assert Footage("+1+15").frame_number == 31
+	for bad_footage in ("++5", "+-5", "1++5", "1+", "+", "", "1+-2", "1 + 2", "1+20", "1+16"):
+		with pytest.raises(ValueError):
+			Footage(bad_footage)
+
+def test_gauges():
+
+	assert Footage(40, gauge="16mm").feet == 1
+	assert Footage(40, gauge=GAUGE_16MM).frames == 0
+	assert Footage(16, 16).gauge is GAUGE_35MM_4PERF
+
+	# 3-perf feet don't start on a frame boundary
+	assert [str(Footage(n, gauge=GAUGE_35MM_3PERF)) for n in (21, 22, 43, 64)] == ["0+21", "1+00", "2+00", "3+00"]
+
+	with pytest.raises(ValueError):
+		Footage(0, gauge="8mm")
+	with pytest.raises(ValueError):
+		Footage(0, 16, gauge=GAUGE_16MM)
+
+	# 3-perf feet hold 21 or 22 frames
+	assert Footage("0+21", gauge=GAUGE_35MM_3PERF).frame_number == 21
+	with pytest.raises(ValueError):
+		Footage("1+21", gauge=GAUGE_35MM_3PERF)
+
+@pytest.mark.parametrize("gauge", list(GAUGES.values()) + [FilmGauge("20 fpf", 20, 1)])
+def test_roundtrip(gauge):
+
+	frame_numbers = array.array("q", range(-1000, 1000))
+	footages = Footage.format_many(frame_numbers, gauge)
+	assert footages == [str(Footage(x, gauge=gauge)) for x in frame_numbers]
+	assert Footage.parse_many(footages, gauge) == frame_numbers
+
+def test_parse_many_errors():
+
+	with pytest.raises(ValueError):
+		Footage.parse_many(["1+00", "bad"])
+
+	errors = []
+	assert list(Footage.parse_many(["1+00", "bad", None], errors=errors)) == [16, 0, 0]
+	assert [idx for idx, _ in errors] == [1, 2]
+
+def test_timecode_conversion():
+
+	tc = Timecode("00:00:01:00", rate=24)
+	assert str(Footage.from_timecode(tc)) == "1+08"
+	assert Footage(tc).frame_number == 24
+	assert Footage("1+08").to_timecode(rate=24) == tc
@@ -0,0 +1,81 @@
+import io, pytest
+from timecode import Timecode, TimecodeRange
+from timecode.modes import DropFrame, NonDropFrame
+from timecode.ingest import read_edl, read_csv
+
+EDL = b"""TITLE: TEST SEQUENCE
+FCM: NON-DROP FRAME
+
+001  A001C003 V     C        14:02:11:05 14:02:15:00 01:00:00:00 01:00:03:19
+* FROM CLIP NAME: A001C003.MOV
+002  A002C001 AA/V  C        09:10:00:00 09:10:01:12 01:00:03:19 01:00:05:07
+M2   A002C001       048.0                09:10:00:00
+
+FCM: DROP FRAME
+003  BL       V     C        00:00:00;00 00:00:01;00 00:00:00;00 00:00:01;00
+"""
+
+def test_read_edl(tmp_path):
+
+	path = tmp_path / "test.edl"
+	path.write_bytes(EDL)
+
+	events = list(read_edl(path, batch_size=1))
+	assert [e.number for e in events] == ["001", "002", "003"]
+	assert [e.line_number for e in events] == [4, 6, 10]
+
+	assert events[0].reel == "A001C003"
+	assert (events[0].source.start.frame_number, len(events[0].source)) == (Timecode("14:02:11:05", rate=30).frame_number, 115)
+	assert (events[1].track, events[1].record.start.frame_number) == ("AA/V", Timecode("01:00:03:19", rate=30).frame_number)
+
+	# FCM changes the counting mode, but every event is NTSC
+	assert type(events[0].record.mode) is NonDropFrame and events[0].record.rate == 30
+	assert type(events[2].record.mode) is DropFrame and events[2].record.rate == 30
+
+def test_read_edl_rate():
+
+	events = list(read_edl(io.BytesIO(EDL.split(b"FCM: DROP FRAME")[0]), rate=24))
+	assert {e.record.rate for e in events} == {24}
+
+	# Drop-frame can't be counted at 24
+	with pytest.raises(ValueError, match="Line 10"):
+		list(read_edl(io.BytesIO(EDL), rate=24))
+
+	# Without FCM lines, non-drop-frame events keep the default rate
+	events = list(read_edl(io.BytesIO(b"001  AX V C 01:00:00:00 01:00:01:00 01:00:00:00 01:00:01:00\n")))
+	assert events[0].record.timebase is NonDropFrame.get_timebase()
+
+def test_read_edl_from_file_object():
+
+	edl = io.BytesIO(EDL)
+	events = list(read_edl(edl, mode=DropFrame(), rate=60))
+	assert len(events) == 3
+	assert all(e.source.timebase is DropFrame.get_timebase(60) for e in events)
+	assert not edl.closed
+
+def test_read_edl_reports_bad_lines():
+
+	edl = io.BytesIO(b"001  AX V C 01:00:00:00 01:00:01:00 01:00:00:00 01:0x:01:00\n")
+	with pytest.raises(ValueError, match="Line 1"):
+		list(read_edl(edl))
+
+def test_read_csv():
+
+	csv_file = io.StringIO("name,src_in,src_out,rec_in,rec_out\nA,01:00:00:00,01:00:01:00,00:00:00:00,00:00:01:00\nB,02:00:00:00,02:00:00:12,00:00:01:00,00:00:01:12\n")
+	rows = list(read_csv(csv_file, ("src_in", "src_out"), ("rec_in", "rec_out"), batch_size=1))
+
+	assert len(rows) == 2
+	assert [len(r) for r in rows[1]] == [12, 12]
+	assert rows[1][0].start == Timecode("02:00:00:00")
+
+def test_read_csv_reports_short_rows():
+
+	csv_file = io.StringIO("in,out\n01:00:00:00,01:00:01:00\n01:00:02:00\n")
+	with pytest.raises(ValueError, match="Line 3"):
+		list(read_csv(csv_file, ("in", "out")))
+
+def test_read_csv_detects_drop_frame():
+
+	csv_file = io.StringIO("01:00:00;00,01:00:01;00\n")
+	(tc_range,), = read_csv(csv_file, (0, 1), has_header=False)
+	assert type(tc_range.mode) is DropFrame
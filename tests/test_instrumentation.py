@@ -0,0 +1,78 @@
+import pytest
+from timecode import Timecode, TimecodeRange, instrumentation
+from timecode.modes import CountingMode, DropFrame
+
+@pytest.fixture(autouse=True)
+def disabled():
+	instrumentation.disable()
+	yield
+	instrumentation.disable()
+
+def test_disabled_by_default():
+
+	original = CountingMode.__dict__["_string_from_frame_number"]
+
+	assert not instrumentation.is_enabled()
+	assert instrumentation.snapshot() == {}
+
+	instrumentation.enable()
+	assert CountingMode.__dict__["_string_from_frame_number"] is not original
+
+	instrumentation.disable()
+	assert CountingMode.__dict__["_string_from_frame_number"] is original
+
+def test_counts_per_mode_and_rate():
+
+	instrumentation.enable()
+
+	str(Timecode("01:00:00:00", rate=24))
+	str(Timecode("01:00:00:00", rate=30))
+	str(Timecode("01:00:00;00", mode=DropFrame(), rate=60))
+
+	report = instrumentation.snapshot()
+	assert report["parse"]["24 NDF"]["calls"] == 1
+	assert report["parse"]["30 NDF"]["calls"] == 1
+	assert report["parse"]["60 DF"]["calls"] == 1	# Not counted again when it calls its parent
+	assert report["format"]["60 DF"]["calls"] == 1
+	assert report["dropped_frames"]["60 DF"]["calls"] == 1
+	assert report["timecode_init"]["24 NDF"]["seconds"] is None
+
+	instrumentation.clear()
+	assert instrumentation.snapshot() == {}
+
+def test_measure():
+
+	with instrumentation.measure(timing=True) as report:
+		tc_range = TimecodeRange(start=Timecode(0), duration=Timecode(50))
+		for _ in tc_range:
+			pass
+
+	assert not instrumentation.is_enabled()
+	assert report["range_iter"]["24 NDF"]["calls"] == 1
+	assert report["range_iter"]["24 NDF"]["items"] == 50
+	assert report["range_iter"]["24 NDF"]["seconds"] >= 0
+	assert report["timecode_init"]["24 NDF"]["calls"] == 54	# Including the timecodes it yields
+
+def test_batches():
+
+	with instrumentation.measure() as report:
+		DropFrame.parse_many(["00;01;00;02", "00;01;00;03", "1:00:00;00"])
+		labels = list(DropFrame.iter_strings(-2, 10))
+		Timecode(10) + 5
+
+	assert report["parse"]["30 DF"] == {"calls": 1, "items": 3, "seconds": None}
+	assert report["format"]["30 DF"]["calls"] == 1
+	assert report["format"]["30 DF"]["items"] == len(labels) == 10
+	assert report["timecode_init"]["24 NDF"]["calls"] == 2
+
+def test_measure_keeps_existing_counts():
+
+	instrumentation.enable()
+	Timecode("00:00:01:00")
+
+	with instrumentation.measure() as report:
+		Timecode("00:00:02:00")
+
+	assert report["parse"]["24 NDF"]["calls"] == 1
+	assert instrumentation.is_enabled()
+	assert instrumentation.snapshot()["parse"]["24 NDF"]["calls"] == 2
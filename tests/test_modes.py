@@ -0,0 +1,101 @@
+from timecode import Timecode, TimecodeRange
+from timecode.modes import DropFrame, NonDropFrame
+
+def test_components():
+
+	assert NonDropFrame.components(86400 + 24*61 + 5, 24) == (1, 1, 1, 1, 5)
+	assert NonDropFrame.components(-86400, 24) == (-1, 1, 0, 0, 0)
+
+	assert DropFrame.components(1799, 30) == (1, 0, 0, 59, 29)
+	assert DropFrame.components(1800, 30) == (1, 0, 1, 0, 2)
+	assert DropFrame.components(17982, 30) == (1, 0, 10, 0, 0)
+	assert DropFrame.components(3600, 60) == (1, 0, 1, 0, 4)
+
+def test_components_long_form():
+
+	# 24 hours of 30 DF is 2,589,408 frames
+	assert DropFrame.components(2589408, 30) == (1, 24, 0, 0, 0)
+	assert DropFrame.components(2589408 * 2, 60) == (1, 24, 0, 0, 0)
+
+def test_timecode_uses_components():
+
+	tc = Timecode(1800, mode=DropFrame())
+	assert str(tc) == "00;01;00;02"
+	assert (tc.hours, tc.minutes, tc.seconds, tc.frames) == (0, 1, 0, 2)
+
+	tc = Timecode("-01:02:03:04")
+	assert str(tc) == "-01:02:03:04"
+	assert (tc.hours, tc.minutes, tc.seconds, tc.frames) == (1, 2, 3, 4)
+
+	assert repr(TimecodeRange(start=Timecode(1790, mode=DropFrame()), duration=20)) == "<TimecodeRange 00;00;59;20 - 00;01;00;12 (20) @ 30 DF>"
+
+def test_timebase_is_interned():
+
+	from timecode.modes import Timebase
+
+	assert Timebase(DropFrame, 30) is Timebase(DropFrame(), 30) is DropFrame.get_timebase(30)
+	assert Timebase(NonDropFrame) is Timebase(NonDropFrame, 24)
+	assert Timecode(0, mode=DropFrame()).timebase is Timecode(5, mode=DropFrame(), rate=30).timebase
+
+	timebase = Timebase(DropFrame, 60)
+	assert (timebase.drop_offset, timebase.drop_minute, timebase.drop_segment) == (4, 3596, 3600 + 3596 * 9)
+	assert Timebase(NonDropFrame, 25).drop_offset == 0
+
+def test_timebase_validates_rate():
+
+	import pytest
+	from timecode.modes import Timebase
+
+	with pytest.raises(ValueError):
+		Timebase(DropFrame, 24)
+	
+	with pytest.raises(ValueError):
+		Timecode(0, mode=NonDropFrame(), rate=-1)
+
+def test_drop_frame_parsing():
+
+	assert Timecode("00;00;59;29", mode=DropFrame()).frame_number == 1799
+	assert Timecode("00;01;00;02", mode=DropFrame()).frame_number == 1800
+	assert Timecode("00;10;00;00", mode=DropFrame()).frame_number == 17982
+	assert Timecode("-00;01;00;02", mode=DropFrame()).frame_number == -1800
+	assert Timecode("24;00;00;00", mode=DropFrame()).frame_number == 2589408
+	assert Timecode("01;01;00;04", mode=DropFrame(), rate=60).frame_number == Timecode("01;00;59;59", mode=DropFrame(), rate=60).frame_number + 1
+
+	# Every label roundtrips, at any multiple of 30
+	for rate in (30, 60, 120):
+		for frame_number in range(0, rate * 60 * 60 * 2, 7 * rate // 30 + 1):
+			assert DropFrame._frame_number_from_string(DropFrame._string_from_frame_number(frame_number, rate), rate) == frame_number
+
+def test_drop_frame_skipped_labels():
+
+	import pytest
+
+	# Labels which don't exist count as the next one that does, unless they're strictly rejected
+	assert Timecode("00;01;00;00", mode=DropFrame()).frame_number == 1800
+	assert Timecode("00;01;00;02", mode=DropFrame(), rate=60).frame_number == 3600
+
+	assert DropFrame.is_valid_label(0, 10, 0, 0, 30)
+	assert not DropFrame.is_valid_label(0, 11, 0, 1, 30)
+
+	with pytest.raises(ValueError):
+		Timecode("00;01;00;01", mode=DropFrame(), strict=True)
+	assert Timecode("00;10;00;00", mode=DropFrame(), strict=True).frame_number == 17982
+
+	errors = []
+	DropFrame.parse_many(["00;01;00;00", "00;01;00;02"], errors=errors, strict=True)
+	assert [idx for idx, _ in errors] == [0]
+	assert DropFrame.parse_many(["00;01;00;00", "00;01;00;02"]).tolist() == [1800, 1800]
+
+def test_drop_frame_validate_many():
+
+	labels = DropFrame.format_many(range(0, 108000, 3))
+	assert DropFrame.validate_many(labels) == []
+
+	bad_rows = DropFrame.validate_many(["00;01;00;02", "00;02;00;01", "00;20;00;00", "01;01;00;000", "nope", "3;0;1"], rate=30)
+	assert [idx for idx, _ in bad_rows] == [1, 3, 4, 5]
+
+	assert [idx for idx, _ in DropFrame.validate_many(["00;01;00;04", "00;01;00;03"], rate=60)] == [1]
+
+	# Fixed-width strings which aren't timecodes at all don't slip past on their seconds
+	bad_rows = DropFrame.validate_many(["00x01x23x05", "ab;cd;ef;gh", "00;01;00;00", "00;01;0a;05", "00;01;23;05"])
+	assert [idx for idx, _ in bad_rows] == [0, 1, 2, 3]
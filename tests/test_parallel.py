@@ -0,0 +1,51 @@
+import array, concurrent.futures, pytest
+from timecode import Resampler, parallel
+from timecode.modes import DropFrame, NonDropFrame
+
+FRAMES = list(range(-500, 20000, 7))
+
+def test_format_and_parse_roundtrip():
+
+	timecodes = parallel.format_many(FRAMES, mode=DropFrame(), rate=60, workers=2, chunk_size=500)
+	assert timecodes == DropFrame.format_many(FRAMES, 60)
+
+	frame_numbers = parallel.parse_many(timecodes, mode=DropFrame(), rate=60, workers=2, chunk_size=500)
+	assert list(frame_numbers) == list(DropFrame.parse_many(timecodes, 60))
+
+def test_errors_keep_their_index():
+
+	timecodes = ["00:00:00:00"] * 10 + ["bad"] + ["00:00:00:01"] * 10
+
+	with pytest.raises(ValueError):
+		parallel.parse_many(timecodes, workers=2, chunk_size=4)
+
+	errors = []
+	frame_numbers = parallel.parse_many(timecodes, errors=errors, workers=2, chunk_size=4)
+	assert [idx for idx, _ in errors] == [10]
+	assert len(frame_numbers) == len(timecodes)
+
+def test_resample_with_executor():
+
+	resampler = Resampler.get(NonDropFrame.get_timebase(24), NonDropFrame.get_timebase(25))
+
+	with concurrent.futures.ProcessPoolExecutor(max_workers=2) as executor:
+		resampled = parallel.resample_many(FRAMES, resampler, executor=executor, chunk_size=1000)
+
+	assert list(resampled) == list(resampler.resample_frames(FRAMES))
+
+def test_inline_and_empty():
+
+	assert parallel.format_many([], workers=1) == []
+	assert list(parallel.parse_many(["00:00:01:00"], workers=1)) == [24]
+
+	with pytest.raises(ValueError):
+		parallel.format_many(FRAMES, chunk_size=0)
+
+def test_numpy_input():
+
+	numpy = pytest.importorskip("numpy")
+	assert parallel.format_many(numpy.array(FRAMES), workers=2, chunk_size=1000) == NonDropFrame.format_many(FRAMES)
+
+	# Either byte order comes out as native frame numbers
+	for dtype in ("<i8", ">i8", "<i4", ">i4"):
+		assert parallel._as_frame_array(numpy.array(FRAMES, dtype=dtype)) == array.array("q", FRAMES)
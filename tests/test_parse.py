@@ -0,0 +1,27 @@
+import pytest
+from timecode import Timecode
+from timecode.modes import DropFrame, NonDropFrame
+
+def test_parse_many_matches_timecode():
+
+	for mode, rate in ((NonDropFrame(), 24), (NonDropFrame(), 120), (DropFrame(), 30), (DropFrame(), 60)):
+		timecodes = [str(Timecode(x, mode=mode, rate=rate)).split()[0] for x in range(0, 200000, 331)]
+		timecodes += ["1:00", "-01:00:00:00", "00:00:00:00"[:8]]
+
+		assert mode.parse_many(timecodes, rate).tolist() == [Timecode(tc, mode=mode, rate=rate).frame_number for tc in timecodes]
+
+def test_parse_many_fixed_width():
+
+	assert NonDropFrame.parse_many(["01:00:00:00", "00:00:01:23"], 24).tolist() == [86400, 47]
+	assert NonDropFrame.parse_many(["01:00:00:000"], 120).tolist() == [432000]
+
+def test_parse_many_reports_bad_rows():
+
+	errors = []
+	frame_numbers = NonDropFrame.parse_many(["01:00:00:00", "xx:00:00:00", None, "1:2:3:4:5", "00:00:00:01"], 24, errors=errors)
+
+	assert frame_numbers.tolist() == [86400, 0, 0, 0, 1]
+	assert [idx for idx, _ in errors] == [1, 2, 3]
+
+	with pytest.raises(ValueError, match="rows: 0, 2"):
+		NonDropFrame.parse_many(["nope", "00:00:00:01", "also nope"], 24)
@@ -0,0 +1,83 @@
+import array, fractions, pytest
+from timecode import Timecode, TimecodeRange, Resampler
+from timecode.modes import DropFrame, NonDropFrame
+
+NDF_24 = NonDropFrame().get_timebase(24)
+NDF_25 = NonDropFrame().get_timebase(25)
+NDF_30 = NonDropFrame().get_timebase(30)
+NDF_60 = NonDropFrame().get_timebase(60)
+
+def test_rounding():
+
+	frames = range(-5, 5)
+	assert list(Resampler(NDF_60, NDF_30, "nearest").resample_frames(frames)) == [-3, -2, -2, -1, -1, 0, 1, 1, 2, 2]
+	assert list(Resampler(NDF_60, NDF_30, "floor").resample_frames(frames))   == [-3, -2, -2, -1, -1, 0, 0, 1, 1, 2]
+	assert list(Resampler(NDF_60, NDF_30, "ceil").resample_frames(frames))    == [-2, -2, -1, -1, 0, 0, 1, 1, 2, 2]
+
+	with pytest.raises(ValueError):
+		Resampler(NDF_60, NDF_30, "truncate")
+
+def test_no_drift():
+
+	# 24 hours of 24fps frames land exactly on 24 hours of 30fps frames
+	day = 24 * 60 * 60
+	assert Resampler(NDF_24, NDF_30).resample_frame(day * 24) == day * 30
+	assert Resampler(NDF_25, NDF_24).resample_frame(day * 25 * 1000) == day * 24 * 1000
+
+def test_speed():
+
+	# PAL speed-up plays every film frame as a video frame
+	speedup = Resampler.get(NDF_24, NDF_25, speed=fractions.Fraction(25, 24))
+	assert speedup.ratio == 1
+	assert list(speedup.resample_frames(range(100))) == list(range(100))
+	assert Resampler.get(NDF_24, NDF_25, speed=fractions.Fraction(25, 24)) is speedup
+
+def test_shared_cache():
+
+	assert Resampler.get(NDF_24, NDF_30) is Resampler.get(NDF_24, NDF_30, speed=fractions.Fraction(1))
+	assert Resampler.get(NDF_24, NDF_30, speed=2) is Resampler.get(NDF_24, NDF_30, speed=fractions.Fraction(2))
+
+	# One entry per speed, but only so many of them
+	for numerator in range(Resampler.MAX_CACHED * 2):
+		Resampler.get(NDF_24, NDF_25, speed=fractions.Fraction(numerator + 1, 7))
+	assert len(Resampler._cache) <= Resampler.MAX_CACHED
+
+def test_batch():
+
+	resampler = Resampler.get(NDF_24, NDF_30)
+	timecodes = [Timecode(x, rate=24) for x in range(0, 100, 7)]
+
+	assert resampler.resample_timecodes(timecodes) == [tc.resample(rate=30) for tc in timecodes]
+	assert isinstance(resampler.resample_frames(range(10)), array.array)
+
+	with pytest.raises(ValueError):
+		resampler.resample_timecode(Timecode(0, rate=25))
+
+def test_ranges_stay_contiguous():
+
+	ranges = [TimecodeRange(start=Timecode(x, rate=24), duration=Timecode(5, rate=24)) for x in range(0, 50, 5)]
+	resampled = Resampler.get(NDF_24, NDF_25).resample_ranges(ranges)
+
+	assert resampled[0].start.frame_number == 0
+	assert all(a.end == b.start for a, b in zip(resampled, resampled[1:]))
+	assert resampled[-1].end.frame_number == 52
+	assert [(r.start, r.end) for r in resampled] == [(r.resample(rate=25).start, r.resample(rate=25).end) for r in ranges]
+
+def test_timecode_resample():
+
+	tc = Timecode("01:00:00:00", rate=24)
+	assert tc.resample(rate=30).frame_number == 108000
+	assert type(tc.resample(rate=30, mode=DropFrame()).mode) is DropFrame
+	assert Timecode(1, rate=60).resample(rate=30, rounding="floor").frame_number == 0
+	assert Timecode(1, rate=60).resample(rate=30).frame_number == 1
+
+def test_timecodearray_resample():
+
+	numpy = pytest.importorskip("numpy")
+	from timecode.timecodearray import TimecodeArray
+
+	timecodes = TimecodeArray(range(-100, 100), rate=24)
+	resampled = timecodes.resample(rate=25)
+
+	assert resampled.rate == 25
+	assert resampled.frame_numbers.tolist() == [tc.resample(rate=25).frame_number for tc in timecodes]
@@ -0,0 +1,75 @@
+import pytest
+from timecode import Timecode, smpte
+from timecode.modes import DropFrame, NonDropFrame
+
+def test_ltc_layout():
+
+	word = smpte.encode_ltc([Timecode("01:02:03:04", rate=30).frame_number], rate=30, user_bits=0x12345678)
+
+	assert len(word) == smpte.LTC_WORD_SIZE
+	assert word.hex(" ") == "84 70 63 58 42 30 21 10 fc bf"
+	assert sum(bin(x).count("1") for x in word) % 2 == 0
+
+def test_drop_frame_flag():
+
+	word = smpte.encode_ltc([1800], mode=DropFrame())	# 00;01;00;02
+	assert word[0] == 0x02
+	assert word[1] & 0x04
+
+	decoded = smpte.decode_ltc(word)
+	assert type(decoded.timebase.mode) is DropFrame
+	assert decoded.frame_numbers[0] == 1800
+
+	with pytest.raises(ValueError):
+		smpte.decode_ltc(word + smpte.encode_ltc([0], rate=30))
+
+@pytest.mark.parametrize("rate", [24, 25, 30])
+def test_ltc_roundtrip(rate):
+
+	frame_numbers = list(range(0, rate * 60 * 60 * 24, 997))
+	user_bits = [x * 2654435761 % (1 << 32) for x in range(len(frame_numbers))]
+
+	decoded = smpte.decode_ltc(smpte.encode_ltc(frame_numbers, rate=rate, user_bits=user_bits), mode=NonDropFrame(), rate=rate)
+
+	assert list(decoded.frame_numbers) == frame_numbers
+	assert list(decoded.user_bits) == user_bits
+	assert decoded.timecodes()[1] == Timecode(997, rate=rate)
+
+def test_drop_frame_roundtrip():
+
+	# 24 hours of 30 DF, stepping over plenty of drop minutes
+	frame_numbers = list(range(0, 2589408, 599))
+
+	assert list(smpte.decode_ltc(smpte.encode_ltc(frame_numbers, mode=DropFrame())).frame_numbers) == frame_numbers
+	assert list(smpte.decode_vitc(smpte.encode_vitc(frame_numbers, mode=DropFrame())).frame_numbers) == frame_numbers
+
+@pytest.mark.parametrize("rate", [24, 25, 30])
+def test_vitc_roundtrip(rate):
+
+	frame_numbers = list(range(0, rate * 60 * 60 * 24, 997))
+	words = smpte.encode_vitc(frame_numbers, rate=rate, user_bits=0xDEADBEEF)
+
+	assert len(words) == len(frame_numbers) * smpte.VITC_WORD_SIZE
+
+	decoded = smpte.decode_vitc(memoryview(words), rate=rate)
+	assert list(decoded.frame_numbers) == frame_numbers
+	assert set(decoded.user_bits) == {0xDEADBEEF}
+
+def test_invalid_words():
+
+	with pytest.raises(ValueError):
+		smpte.encode_ltc([-1], rate=30)
+	with pytest.raises(ValueError):
+		smpte.encode_ltc([0], rate=60)
+
+	ltc = bytearray(smpte.encode_ltc([0, 1], rate=30))
+	with pytest.raises(ValueError):
+		smpte.decode_ltc(ltc[:-1])
+	ltc[-1] = 0
+	with pytest.raises(ValueError):
+		smpte.decode_ltc(ltc)
+
+	vitc = bytearray(smpte.encode_vitc([0], rate=30))
+	vitc[4] ^= 0x20
+	with pytest.raises(ValueError):
+		smpte.decode_vitc(vitc, rate=30)
@@ -0,0 +1,70 @@
+import array, pytest
+from timecode import Timecode, TimecodeRange, store
+from timecode.modes import DropFrame
+
+def test_timecodes_roundtrip(tmp_path):
+
+	path = tmp_path / "timecodes.tcs"
+	timecodes = [Timecode(x, mode=DropFrame(), rate=60) for x in range(-10, 1000, 3)]
+
+	assert store.write_timecodes(path, timecodes) == len(timecodes)
+	assert path.stat().st_size == store.HEADER.size + len(timecodes) * 8
+
+	with store.TimecodeStore(path) as stored:
+		assert stored.timebase is DropFrame.get_timebase(60)
+		assert len(stored) == len(timecodes)
+		assert stored.frame_numbers.tolist() == [tc.frame_number for tc in timecodes]
+		assert stored[5] == timecodes[5]
+		assert stored[-1] == timecodes[-1]
+		assert stored[2:4] == timecodes[2:4]
+		assert list(stored) == timecodes
+
+		with pytest.raises(IndexError):
+			stored[len(timecodes)]
+
+def test_frame_numbers(tmp_path):
+
+	path = tmp_path / "frames.tcs"
+	store.write_timecodes(path, array.array("q", range(100_000)), rate=25)
+
+	with store.TimecodeStore(path) as stored:
+		assert stored.rate == 25
+		assert stored.frame_numbers.format == "q"
+		assert stored.frame_numbers[99_999] == 99_999
+
+def test_ranges_roundtrip(tmp_path):
+
+	path = tmp_path / "ranges.tcs"
+	ranges = [TimecodeRange(start=x * 10, duration=x) for x in range(20)]
+
+	assert store.write_ranges(path, ranges) == 20
+
+	with store.TimecodeStore(path) as stored:
+		assert stored.kind == store.KIND_RANGES
+		assert stored.starts.tolist() == [r.start.frame_number for r in ranges]
+		assert stored.durations.tolist() == [r.duration.frame_number for r in ranges]
+		assert [(r.start, r.end) for r in stored] == [(r.start, r.end) for r in ranges]
+
+def test_mismatched_timebase(tmp_path):
+
+	with pytest.raises(ValueError):
+		store.write_timecodes(tmp_path / "bad.tcs", [Timecode(0, rate=24), Timecode(0, rate=25)])
+
+def test_empty_and_invalid(tmp_path):
+
+	path = tmp_path / "empty.tcs"
+	store.write_timecodes(path, [], rate=30)
+	with store.TimecodeStore(path) as stored:
+		assert len(stored) == 0
+		assert stored.rate == 30
+
+	not_a_store = tmp_path / "nope.tcs"
+	not_a_store.write_bytes(b"hello" * 20)
+	with pytest.raises(ValueError):
+		store.TimecodeStore(not_a_store)
+
+	truncated = tmp_path / "truncated.tcs"
+	store.write_timecodes(truncated, range(10))
+	truncated.write_bytes(truncated.read_bytes()[:-8])
+	with pytest.raises(ValueError):
+		store.TimecodeStore(truncated)
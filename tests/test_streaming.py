@@ -0,0 +1,84 @@
+import asyncio, pytest
+from timecode import Timecode
+from timecode.modes import DropFrame
+from timecode.streaming import batches, stream_frame_numbers, stream_strings, stream_timecodes
+
+async def feed(items, delay=0):
+	for item in items:
+		if delay:
+			await asyncio.sleep(delay)
+		yield item
+
+async def collect(stream):
+	return [batch async for batch in stream]
+
+def test_batches():
+
+	result = asyncio.run(collect(batches(feed(range(10)), batch_size=4)))
+	assert result == [[0, 1, 2, 3], [4, 5, 6, 7], [8, 9]]
+
+def test_batches_timeout():
+
+	# A slow feed yields partial batches rather than waiting for them to fill
+	result = asyncio.run(collect(batches(feed(range(3), delay=0.05), batch_size=100, timeout=0.01)))
+	assert result == [[0], [1], [2]]
+
+def test_batches_feed_error():
+
+	async def broken():
+		yield 1
+		raise ConnectionResetError("gone")
+
+	async def run():
+		received = []
+		with pytest.raises(ConnectionResetError):
+			async for batch in batches(broken()):
+				received.append(batch)
+		return received
+
+	assert asyncio.run(run()) == [[1]]
+
+def test_backpressure():
+
+	pulled = []
+
+	async def counting_feed():
+		for x in range(1000):
+			pulled.append(x)
+			yield x
+
+	async def run():
+		stream = batches(counting_feed(), batch_size=10, max_pending=2)
+		await stream.__anext__()
+		await asyncio.sleep(0.01)
+		await stream.aclose()
+
+	asyncio.run(run())
+	assert len(pulled) < 40
+
+def test_stream_timecodes():
+
+	lines = [b"01:00:00:00\n", b"\n", "01:00:00:01", 86402]
+	result = asyncio.run(collect(stream_timecodes(feed(lines))))
+
+	assert result == [[Timecode("01:00:00:00"), Timecode("01:00:00:01"), Timecode("01:00:00:02")]]
+
+def test_stream_strings_and_errors():
+
+	lines = ["00:00:01:00", "garbage", 1800]
+
+	with pytest.raises(ValueError):
+		asyncio.run(collect(stream_strings(feed(lines), mode=DropFrame())))
+
+	result = asyncio.run(collect(stream_strings(feed(lines), mode=DropFrame(), on_error="skip")))
+	assert result == [["00;00;01;00", "00;01;00;02"]]
+
+def test_stream_reader():
+
+	async def run():
+		reader = asyncio.StreamReader()
+		reader.feed_data(b"00:00:00:10\n00:00:00:20\n")
+		reader.feed_eof()
+		return await collect(stream_frame_numbers(reader, batch_size=1))
+
+	assert [list(batch) for batch in asyncio.run(run())] == [[10], [20]]
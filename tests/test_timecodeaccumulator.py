@@ -0,0 +1,48 @@
+import pytest
+from timecode import Timecode, TimecodeRange, TimecodeAccumulator
+
+CLIPS = [TimecodeRange(start=Timecode(x * 100), duration=Timecode(x)) for x in range(1, 50)]
+
+def test_in_place():
+
+	total = TimecodeAccumulator()
+	accumulator = total
+
+	for clip in CLIPS:
+		total += clip.duration
+	total += clip
+	total -= 10
+
+	assert total is accumulator
+	assert total.frame_number == sum(range(1, 50)) + 49 - 10
+	assert total.timecode == Timecode(total.frame_number)
+	assert str(total) == str(total.timecode)
+
+	total.reset()
+	assert int(total) == 0
+
+def test_fixed_timebase():
+
+	total = TimecodeAccumulator(Timecode("01:00:00:00", rate=30))
+	assert total.rate == 30
+
+	with pytest.raises(ValueError):
+		total += Timecode(1, rate=24)
+	with pytest.raises(TypeError):
+		total += "00:00:01:00"
+	with pytest.raises(ValueError):
+		TimecodeAccumulator(Timecode(0, rate=30), rate=24)
+
+def test_sum():
+
+	assert Timecode.sum(clip.duration for clip in CLIPS) == Timecode(sum(range(1, 50)))
+	assert Timecode.sum(CLIPS, start=Timecode(10)) == Timecode(sum(range(1, 50)) + 10)
+	assert Timecode.sum([]) == Timecode(0)
+	assert Timecode.sum([Timecode(1, rate=30)]).rate == 30
+
+	with pytest.raises(ValueError):
+		Timecode.sum([Timecode(1, rate=24), Timecode(1, rate=30)])
+	with pytest.raises(TypeError):
+		Timecode.sum([Timecode(1), 2])
+
+	assert TimecodeAccumulator(5).extend(CLIPS).frame_number == sum(range(1, 50)) + 5
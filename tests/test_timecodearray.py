@@ -0,0 +1,85 @@
+import pytest
+
+numpy = pytest.importorskip("numpy")
+
+from timecode import Timecode
+from timecode.modes import DropFrame, NonDropFrame
+from timecode.timecodearray import TimecodeArray
+
+def test_matches_timecode():
+
+	for mode, rate in ((NonDropFrame(), 24), (NonDropFrame(), 120), (DropFrame(), 30), (DropFrame(), 60)):
+		frame_numbers = list(range(-5000, 500000, 997))
+		tc_array = TimecodeArray(frame_numbers, mode=mode, rate=rate)
+
+		timecodes = [Timecode(x, mode=mode, rate=rate) for x in frame_numbers]
+
+		assert tc_array.hours.tolist()   == [tc.hours for tc in timecodes]
+		assert tc_array.minutes.tolist() == [tc.minutes for tc in timecodes]
+		assert tc_array.seconds.tolist() == [tc.seconds for tc in timecodes]
+		assert tc_array.frames.tolist()  == [tc.frames for tc in timecodes]
+
+def test_components_worked_out_once():
+
+	tc_array = TimecodeArray(range(0, 200000, 7), mode=DropFrame())
+	components = tc_array.components
+
+	assert tc_array.components is components
+	assert tc_array.hours is components[1] and tc_array.frames is components[4]
+	assert not tc_array.minutes.flags.writeable
+
+def test_to_strings():
+
+	tc_array = TimecodeArray([0, 1799, 1800, -5], mode=DropFrame())
+	assert tc_array.to_strings() == ["00;00;00;00", "00;00;59;29", "00;01;00;02", "-00;00;00;05"]
+
+	tc_array = TimecodeArray([86400, 86423], rate=24)
+	assert tc_array.to_strings() == ["01:00:00:00", "01:00:00:23"]
+
+def test_arithmetic_and_comparisons():
+
+	tc_array = TimecodeArray([0, 10, 20])
+
+	assert (tc_array + 5).frame_numbers.tolist() == [5, 15, 25]
+	assert (tc_array + Timecode(1)).frame_numbers.tolist() == [1, 11, 21]
+	assert (100 - tc_array).frame_numbers.tolist() == [100, 90, 80]
+	assert (tc_array - tc_array).frame_numbers.tolist() == [0, 0, 0]
+	assert (tc_array > Timecode(5)).tolist() == [False, True, True]
+	assert (tc_array == 10).tolist() == [False, True, False]
+
+	# Mismatched rates never compare equal, and can't be added
+	assert not (tc_array == Timecode(10, rate=30)).any()
+	with pytest.raises(TypeError):
+		tc_array + Timecode(10, rate=30)
+
+	# Strings aren't sequences of frame numbers, same as with Timecode
+	for other in ("00:00:00:10", b"00:00:00:10"):
+		with pytest.raises(TypeError):
+			tc_array == other
+		with pytest.raises(TypeError):
+			tc_array < other
+		with pytest.raises(TypeError):
+			tc_array + other
+
+def test_indexing():
+
+	tc_array = TimecodeArray(range(100), rate=30)
+
+	assert tc_array[10] == Timecode(10, rate=30)
+	assert isinstance(tc_array[10:20], TimecodeArray)
+	assert len(tc_array[::10]) == 10
+	assert list(tc_array[:2]) == [Timecode(0, rate=30), Timecode(1, rate=30)]
+
+def test_from_timecodes():
+
+	tc_array = TimecodeArray.from_timecodes([Timecode("01:00:00:00"), Timecode("01:00:00:01")])
+	assert tc_array.frame_numbers.tolist() == [86400, 86401]
+
+	with pytest.raises(ValueError):
+		TimecodeArray.from_timecodes([Timecode(0), Timecode(0, rate=30)])
+
+def test_from_strings():
+
+	tc_array = TimecodeArray.from_strings(["01:00:00:00", "01:00:00:01"], rate=24)
+	assert tc_array.frame_numbers.tolist() == [86400, 86401]
+	assert tc_array.to_strings() == ["01:00:00:00", "01:00:00:01"]
@@ -0,0 +1,86 @@
+import pytest
+from timecode import Timecode, TimecodeRange, TimecodeIndex
+
+def make_range(start, end):
+	return TimecodeRange(start=Timecode(start), end=Timecode(end))
+
+EVENTS = [make_range(100, 200), make_range(0, 50), make_range(150, 300), make_range(400, 410)]
+
+def test_find_and_containing():
+
+	index = TimecodeIndex(EVENTS)
+
+	assert [r.start.frame_number for r in index] == [0, 100, 150, 400]
+	assert index.find(10) is EVENTS[1]
+	assert index.find(Timecode(175)) is EVENTS[2]	# Latest-starting of the two
+	assert index.find("00:00:04:04") is EVENTS[0]	# Frame 100
+	assert index.find(50) is None
+	assert index.containing(175) == [EVENTS[0], EVENTS[2]]
+	assert 409 in index and 410 not in index
+
+def test_window():
+
+	index = TimecodeIndex(EVENTS)
+
+	assert index.window((40, 120)) == [EVENTS[1], EVENTS[0]]
+	assert index.window(make_range(300, 400)) == []
+	assert index.window((250, 401)) == [EVENTS[2], EVENTS[3]]
+
+def test_nearest():
+
+	index = TimecodeIndex(EVENTS)
+
+	assert index.nearest(20) is EVENTS[1]
+	assert index.nearest(60) is EVENTS[1]	# 11 frames after 0-50, 40 frames before 100-200
+	assert index.nearest(99) is EVENTS[0]
+	assert index.nearest(349) is EVENTS[2]
+	assert index.nearest(351) is EVENTS[3]
+	assert TimecodeIndex([make_range(0, 10), make_range(21, 30)]).nearest(15).start.frame_number == 0	# A tie goes to the earlier one
+	assert index.nearest(1000) is EVENTS[3]
+	assert TimecodeIndex().nearest(0) is None
+
+def test_timecodes():
+
+	index = TimecodeIndex(Timecode(x) for x in (5, 1, 3))
+	assert index.find(3) == Timecode(3)
+	assert index.find(2) is None
+	assert index.nearest(2) == Timecode(1)
+
+def test_bulk():
+
+	index = TimecodeIndex(EVENTS)
+	queries = [-1, 0, 60, 120, 175, 250, 405, 500]
+
+	assert list(index.find_many(queries)) == [-1, 0, -1, 1, 2, 2, 3, -1]
+	assert index.lookup_many(queries) == [index.find(x) for x in queries]
+
+	numpy = pytest.importorskip("numpy")
+	assert index.find_many(numpy.array(queries)).tolist() == list(index.find_many(queries))
+
+def test_spanning_range():
+
+	import random
+
+	# One long range over many short ones, as well as randomly overlapping ones, checked against a brute-force search
+	rng = random.Random(18)
+	ranges = [make_range(x * 10, x * 10 + 5) for x in range(200)] + [make_range(3, 1990)]
+	ranges += [make_range(start, start + rng.randrange(0, 300)) for start in (rng.randrange(0, 2000) for _ in range(100))]
+	index = TimecodeIndex(ranges)
+
+	for frame_number in range(-5, 2320, 3):
+		containing = [idx for idx, item in enumerate(index) if item.start.frame_number <= frame_number < item.end.frame_number]
+		assert index.containing(frame_number) == [index[idx] for idx in containing]
+		assert index.find(frame_number) is (index[containing[-1]] if containing else None)
+
+	for start in range(-5, 2320, 37):
+		overlapping = [item for item in index if item.start.frame_number < start + 25 and item.end.frame_number > start and len(item)]
+		assert index.window((start, start + 25)) == overlapping
+
+def test_mismatched_timebase():
+
+	with pytest.raises(ValueError):
+		TimecodeIndex([EVENTS[0], TimecodeRange(start=Timecode(0, rate=30), duration=Timecode(1, rate=30))])
+
+	with pytest.raises(ValueError):
+		TimecodeIndex(EVENTS).find(Timecode(0, rate=30))
+	assert Timecode(0, rate=30) not in TimecodeIndex(EVENTS)
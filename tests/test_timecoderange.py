@@ -1,3 +1,4 @@
+import pytest
 from timecode import Timecode, TimecodeRange, modes
 
 def test_creation():
@@ -51,6 +52,94 @@ def test_contains():
 
 	print(f"{tc_sub} in {tc_range}?\t{tc_sub in tc_range}")
 
+def test_getitem():
+
+	tc_range = TimecodeRange(start=Timecode("01:00:00:00"), duration=1000)
+
+	assert tc_range[0] == Timecode("01:00:00:00")
+	assert tc_range[-1] == Timecode("01:00:41:15")
+	assert tc_range[999] == tc_range[-1]
+
+	for bad_index in (1000, -1001):
+		with pytest.raises(IndexError):
+			tc_range[bad_index]
+
+def test_slicing():
+
+	tc_range = TimecodeRange(start=Timecode("01:00:00:00"), duration=1000)
+
+	# Unbroken slices are just ranges
+	sub_range = tc_range[10:20]
+	assert isinstance(sub_range, TimecodeRange)
+	assert (sub_range.start.frame_number, len(sub_range)) == (86410, 10)
+	assert len(tc_range[990:2000]) == 10
+
+	# Stepped slices are lazy views
+	every_100 = tc_range[::100]
+	assert len(every_100) == 10
+	assert [tc.frame_number for tc in every_100][:3] == [86400, 86500, 86600]
+	assert every_100[-1].frame_number == 87300
+	assert every_100.index(tc_range[300]) == 3
+	assert tc_range[301] not in every_100
+	assert [tc.frame_number for tc in every_100[1::3]] == [86500, 86800, 87100]
+
+	backwards = tc_range[::-1]
+	assert [tc.frame_number for tc in backwards[:3]] == [87399, 87398, 87397]
+	assert list(reversed(tc_range)) == list(backwards)
+
+def test_index_and_count():
+
+	tc_range = TimecodeRange(start=Timecode("01:00:00:00"), duration=48)
+
+	assert tc_range.index("01:00:01:00") == 24
+	assert tc_range.count("01:00:01:00") == 1
+	assert tc_range.count("02:00:00:00") == 0
+
+	with pytest.raises(ValueError):
+		tc_range.index("02:00:00:00")
+
+def test_iter_strings():
+
+	# Across drop minutes, a ten minute boundary and an hour
+	tc_range = TimecodeRange(start=Timecode("00;58;59;00", mode=modes.DropFrame()), duration=3700)
+	strings = list(tc_range.iter_strings())
+
+	assert strings == [str(tc) for tc in tc_range]
+	assert "00;59;00;00" not in strings and "01;00;00;00" in strings and "01;01;00;02" in strings
+	assert list(tc_range.iter_bytes()) == [x.encode("ascii") for x in strings]
+
+	# Through zero, at a three-digit rate
+	tc_range = TimecodeRange(start=Timecode(-150, rate=120), duration=300)
+	assert list(tc_range.iter_strings()) == [str(tc) for tc in tc_range]
+
+	assert list(TimecodeRange(start=Timecode(5), duration=0).iter_strings()) == []
+
+def test_equality_and_ordering():
+
+	a = TimecodeRange(start=Timecode(10), duration=5)
+	b = TimecodeRange(start=Timecode(10), end=Timecode(15))
+	c = TimecodeRange(start=Timecode(10), duration=6)
+
+	assert a == b and hash(a) == hash(b)
+	assert a != c and a != TimecodeRange(start=Timecode(10, rate=30), duration=5)
+	assert len({a, b, c}) == 2
+
+	assert a < c < TimecodeRange(start=Timecode(11), duration=1)
+	assert sorted([c, TimecodeRange(start=Timecode(0), duration=100), a]) == [TimecodeRange(start=Timecode(0), duration=100), a, c]
+
+	with pytest.raises(TypeError):
+		a < Timecode(10)
+
+def test_contains_frame_numbers():
+
+	tc_range = TimecodeRange(start=Timecode("01:00:00:00"), duration=24)
+
+	assert 86400 in tc_range and 86424 not in tc_range
+	assert "01:00:00:23" in tc_range
+	assert Timecode(86400, rate=30) not in tc_range
+	assert TimecodeRange(start=Timecode(86401), duration=2) in tc_range
+	assert TimecodeRange(start=Timecode(86401, rate=30), duration=2) not in tc_range
+
 if __name__ == "__main__":
 
 	test_contains()
\ No newline at end of file
@@ -0,0 +1,76 @@
+import pytest
+from timecode import Timecode, TimecodeRange, TimecodeRangeSet
+from timecode.modes import DropFrame
+
+def frames(range_set:TimecodeRangeSet):
+	return [(r.start.frame_number, r.end.frame_number) for r in range_set]
+
+def make(*bounds):
+	return TimecodeRangeSet(TimecodeRange(start=start, end=end) for start, end in bounds)
+
+def test_coalesces():
+
+	range_set = make((0, 10), (20, 30), (10, 15), (28, 40), (100, 110))
+	assert frames(range_set) == [(0, 15), (20, 40), (100, 110)]
+	assert range_set.duration.frame_number == 45
+
+def test_contains_and_overlaps():
+
+	range_set = make((0, 10), (20, 30))
+
+	assert 5 in range_set
+	assert Timecode(10) not in range_set
+	assert TimecodeRange(start=21, end=30) in range_set
+	assert TimecodeRange(start=5, end=25) not in range_set
+
+	assert [(r.start.frame_number, r.end.frame_number) for r in range_set.overlapping(TimecodeRange(start=5, end=25))] == [(0, 10), (20, 30)]
+	assert range_set.overlapping(TimecodeRange(start=10, end=20)) == []
+	assert range_set.overlaps(TimecodeRange(start=29, end=31))
+	assert not range_set.overlaps(TimecodeRange(start=30, end=31))
+
+def test_set_operations():
+
+	a = make((0, 10), (20, 30))
+	b = make((5, 25))
+
+	assert frames(a | b) == [(0, 30)]
+	assert frames(a & b) == [(5, 10), (20, 25)]
+	assert frames(a - b) == [(0, 5), (25, 30)]
+	assert frames(b - a) == [(10, 20)]
+
+def test_gaps():
+
+	range_set = make((0, 10), (20, 30), (40, 50))
+	assert frames(range_set.gaps()) == [(10, 20), (30, 40)]
+	assert frames(range_set.gaps(within=TimecodeRange(start=-5, end=60))) == [(-5, 0), (10, 20), (30, 40), (50, 60)]
+
+def test_find_overlaps():
+
+	events = [TimecodeRange(start=s, end=e) for s, e in ((0, 10), (10, 20), (15, 25), (5, 6), (30, 40))]
+	assert sorted(TimecodeRangeSet.find_overlaps(events)) == [(0, 3), (1, 2)]
+
+def test_mixed_timebases():
+
+	range_set = make((0, 10))
+
+	with pytest.raises(ValueError):
+		range_set.add(TimecodeRange(start=Timecode(0, mode=DropFrame()), duration=10))
+
+	assert Timecode(5, rate=30) not in range_set
+
+def test_queries_leave_an_empty_set_alone():
+
+	range_set = TimecodeRangeSet()
+	df_range = TimecodeRange(start=Timecode(0, mode=DropFrame()), duration=10)
+
+	assert df_range not in range_set
+	assert not range_set.overlaps(df_range)
+	assert range_set.overlapping(df_range) == []
+	assert frames(range_set.gaps(within=df_range)) == [(0, 10)]
+	assert range_set & TimecodeRangeSet([df_range]) == TimecodeRangeSet()
+
+	# Still free to take on any timebase
+	range_set.add(TimecodeRange(start=Timecode(0, rate=30), duration=10))
+	assert range_set.timebase.rate == 30
+
+	assert (TimecodeRangeSet() | df_range).timebase is df_range.timebase
@@ -0,0 +1,126 @@
+import fractions, io
+import pytest
+from timecode import Timecode, TimecodeRange, Timeline, ingest
+from timecode.modes import DropFrame
+
+EDL = """TITLE: TEST
+FCM: NON-DROP FRAME
+
+001  A001     V     C        10:00:00:00 10:00:02:00 01:00:00:00 01:00:02:00
+002  B002     V     C        20:00:10:00 20:00:11:00 01:00:02:00 01:00:03:00
+003  A001     V     C        10:00:01:00 10:00:03:00 01:00:05:00 01:00:07:00
+"""
+
+def make_timeline() -> Timeline:
+	return Timeline.from_edl(ingest.read_edl(io.StringIO(EDL), rate=24))
+
+def test_mixed_fcm():
+
+	# Drop-frame and non-drop-frame events at the same rate go on one timeline, keeping their frame numbers
+	edl = EDL.replace("003  A001", "FCM: DROP FRAME\n003  A001").replace("01:00:05:00 01:00:07:00", "01:00:10;00 01:00:12;00")
+	timeline = Timeline.from_edl(ingest.read_edl(io.StringIO(edl)))
+
+	assert len(timeline) == 3
+	assert timeline.record_timebase.rate == 30
+	assert timeline.record_to_source(Timecode("01:00:10;00", mode=DropFrame()).frame_number).frame_number == Timecode("10:00:01;00", mode=DropFrame()).frame_number
+
+def test_record_to_source():
+
+	timeline = make_timeline()
+
+	assert len(timeline) == 3
+	assert timeline.record_to_source(Timecode("01:00:01:12")) == Timecode("10:00:01:12")
+	assert timeline.record_to_source("01:00:02:05") == Timecode("20:00:10:05")
+	assert timeline.record_to_source("01:00:04:00") is None
+	assert timeline.find("01:00:05:00").reel == "A001"
+
+	mapped = timeline.record_to_source_many([Timecode("01:00:00:00").frame_number + x for x in (0, 50, 100, 121)])
+	assert mapped.positions.tolist() == [0, 1, -1, 2]
+	assert mapped.frame_numbers.tolist() == [Timecode("10:00:00:00").frame_number, Timecode("20:00:10:02").frame_number, 0, Timecode("10:00:01:01").frame_number]
+
+def test_source_to_record():
+
+	timeline = make_timeline()
+
+	# Used twice
+	assert timeline.source_to_record("10:00:01:12") == [Timecode("01:00:01:12"), Timecode("01:00:05:12")]
+	assert timeline.source_to_record("10:00:01:12", reel="B002") == []
+	assert timeline.source_to_record("20:00:10:00", reel="B002") == [Timecode("01:00:02:00")]
+
+	mapped = timeline.source_to_record_many(["10:00:02:12", "11:00:00:00"])
+	assert mapped.frame_numbers[0] == Timecode("01:00:06:12").frame_number
+	assert mapped.positions[1] == -1
+
+def test_reused_source():
+
+	# One long clip reused after many short clips from the same reel
+	timeline = Timeline()
+	for x in range(100):
+		timeline.insert(TimecodeRange(start=Timecode(x * 10), duration=5), TimecodeRange(start=Timecode(x * 10), duration=5), reel="A001")
+	timeline.insert(TimecodeRange(start=Timecode(0), duration=1000), TimecodeRange(start=Timecode(2000), duration=1000), reel="A001")
+
+	for frame_number in range(0, 1000, 7):
+		expected = [frame_number] if frame_number % 10 < 5 else []
+		expected.append(2000 + frame_number)
+		assert [tc.frame_number for tc in timeline.source_to_record(frame_number, reel="A001")] == expected
+
+def test_speed_changes():
+
+	timeline = Timeline()
+	timeline.insert(TimecodeRange(start=Timecode(1000), duration=20), TimecodeRange(start=Timecode(0), duration=10))
+	timeline.insert(TimecodeRange(start=Timecode(2000), duration=5), TimecodeRange(start=Timecode(10), duration=10))
+	timeline.insert(TimecodeRange(start=Timecode(3000), duration=10), TimecodeRange(start=Timecode(20), duration=10), speed=-1)
+
+	assert timeline[0].speed == 2 and timeline[1].speed == fractions.Fraction(1, 2)
+	assert [timeline.record_to_source(x).frame_number for x in (0, 1, 9, 10, 11, 12, 19, 20, 29)] == [1000, 1002, 1018, 2000, 2000, 2001, 2004, 3009, 3000]
+
+	# Held frames map to the first record frame; skipped ones to the next
+	assert timeline.source_to_record(2001) == [Timecode(12)]
+	assert timeline.source_to_record(1001) == [Timecode(1)]
+	assert timeline.source_to_record(3008) == [Timecode(21)]
+	assert timeline.source_to_record(1019) == []
+
+	numpy = pytest.importorskip("numpy")
+	frame_numbers = numpy.arange(-5, 35)
+	assert timeline.record_to_source_many(frame_numbers).frame_numbers.tolist() == timeline.record_to_source_many(frame_numbers.tolist()).frame_numbers.tolist()
+
+def test_reverse_fractional_speed():
+
+	# Played backwards at half speed, each source frame is held for two record frames without reading past the end
+	timeline = Timeline()
+	timeline.insert(TimecodeRange(start=Timecode(100), duration=2), TimecodeRange(start=Timecode(0), duration=4), speed=fractions.Fraction(-1, 2))
+
+	assert [timeline.record_to_source(x).frame_number for x in range(4)] == [101, 101, 100, 100]
+	assert timeline[0].source == TimecodeRange(start=Timecode(100), duration=2)
+	assert timeline.source_to_record(101) == [Timecode(0)]
+	assert timeline.source_to_record(100) == [Timecode(2)]
+	assert timeline.source_to_record(102) == []
+
+	numpy = pytest.importorskip("numpy")
+	assert timeline.record_to_source_many(numpy.arange(4)).frame_numbers.tolist() == [101, 101, 100, 100]
+
+def test_splicing():
+
+	timeline = make_timeline()
+	end = Timecode("01:00:06:23")
+
+	with pytest.raises(ValueError):
+		timeline.insert(TimecodeRange(start=Timecode("09:00:00:00"), duration=48), TimecodeRange(start=Timecode("01:00:04:00"), duration=48))
+	with pytest.raises(ValueError):
+		timeline.insert(TimecodeRange(start=Timecode("09:00:00:00"), duration=10), TimecodeRange(start=Timecode("01:00:01:00"), duration=10), ripple=True)
+
+	timeline.insert(TimecodeRange(start=Timecode("09:00:00:00"), duration=24), TimecodeRange(start=Timecode("01:00:03:00"), duration=24))
+	assert timeline.record_to_source("01:00:03:10") == Timecode("09:00:00:10")
+
+	timeline.insert(TimecodeRange(start=Timecode("08:00:00:00"), duration=24), TimecodeRange(start=Timecode("01:00:02:00"), duration=24), ripple=True, reel="C003")
+	assert [event.reel for event in timeline] == ["A001", "C003", "B002", None, "A001"]
+	assert timeline.record_to_source(end + 24) == Timecode("10:00:02:23")
+	assert timeline.source_to_record("20:00:10:00") == [Timecode("01:00:03:00")]
+
+	event = timeline.remove("01:00:02:12", ripple=True)
+	assert event.reel == "C003"
+	assert timeline.record_to_source(end) == Timecode("10:00:02:23")
+	assert timeline.source_to_record("20:00:10:00") == [Timecode("01:00:02:00")]
+
+	with pytest.raises(ValueError):
+		timeline.remove("02:00:00:00")
@@ -1,5 +1,10 @@
-from .footage import Footage
+from .footage import Footage, FilmGauge
 from .timecode import Timecode
-from .timecoderange import TimecodeRange
+from .timecoderange import TimecodeRange, StridedTimecodeRange
+from .timecoderangeset import TimecodeRangeSet
+from .timecodeindex import TimecodeIndex
+from .timecodeaccumulator import TimecodeAccumulator
+from .timeline import Timeline
+from .resample import Resampler
 
-__all__ = ["Footage", "Timecode", "TimecodeRange"]
\ No newline at end of file
+__all__ = ["Footage", "FilmGauge", "Timecode", "TimecodeRange", "StridedTimecodeRange", "TimecodeRangeSet", "TimecodeIndex", "TimecodeAccumulator", "Timeline", "Resampler"]
\ No newline at end of file
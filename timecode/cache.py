@@ -0,0 +1,186 @@
+"""Opt-in, size-bounded caches for parsing and formatting frequently repeated timecodes
+
+Caching is disabled by default.  Enable it for workloads which see the same handful of timecodes over and over
+(program starts, reel starts, slates...):
+
+>>> from timecode import Timecode, cache
+>>> cache.enable(maxsize=1024)
+>>> tc = Timecode("01:00:00:00")    # Parsed
+>>> tc = Timecode("01:00:00:00")    # Cached
+>>> cache.stats()["parse"]
+{'maxsize': 1024, 'eviction': 'lru', 'size': 1, 'hits': 1, 'misses': 1, 'evictions': 0}
+"""
+
+import collections, threading, typing
+from .modes import Timebase
+
+class TimecodeCache:
+	"""A size-bounded mapping which keeps count of its hits and misses"""
+
+	EVICTION_POLICIES = ("lru", "fifo")
+	"""Supported eviction policies: least-recently-used, or first-in-first-out"""
+
+	__slots__ = ("_entries", "_maxsize", "_eviction", "_lock", "_hits", "_misses", "_evictions")
+
+	def __init__(self, maxsize:int=4096, eviction:str="lru"):
+
+		if not isinstance(maxsize, int) or maxsize < 1:
+			raise ValueError("Cache size must be a positive integer")
+
+		if eviction not in self.EVICTION_POLICIES:
+			raise ValueError(f"Eviction policy must be one of {', '.join(self.EVICTION_POLICIES)} (got {eviction})")
+
+		self._entries = collections.OrderedDict()
+		self._maxsize = maxsize
+		self._eviction = eviction
+		self._lock = threading.Lock()
+		self._hits = 0
+		self._misses = 0
+		self._evictions = 0
+
+	def get(self, key:typing.Hashable, default:typing.Any=None) -> typing.Any:
+		"""Get a cached value, or `default` if it isn't cached"""
+
+		with self._lock:
+			try:
+				value = self._entries[key]
+			except KeyError:
+				self._misses += 1
+				return default
+
+			if self._eviction == "lru":
+				self._entries.move_to_end(key)
+
+			self._hits += 1
+			return value
+
+	def put(self, key:typing.Hashable, value:typing.Any):
+		"""Cache a value, evicting the oldest entry if the cache is full"""
+
+		with self._lock:
+			self._entries[key] = value
+
+			if len(self._entries) > self._maxsize:
+				self._entries.popitem(last=False)
+				self._evictions += 1
+
+	def clear(self):
+		"""Remove all entries and reset the counters"""
+
+		with self._lock:
+			self._entries.clear()
+			self._hits = self._misses = self._evictions = 0
+
+	@property
+	def maxsize(self) -> int:
+		"""The maximum number of entries to keep"""
+		return self._maxsize
+
+	@property
+	def eviction(self) -> str:
+		"""The eviction policy in use"""
+		return self._eviction
+
+	@property
+	def hits(self) -> int:
+		"""Lookups which found a cached value"""
+		return self._hits
+
+	@property
+	def misses(self) -> int:
+		"""Lookups which did not find a cached value"""
+		return self._misses
+
+	@property
+	def evictions(self) -> int:
+		"""Entries removed to make room for new ones"""
+		return self._evictions
+
+	def stats(self) -> typing.Dict[str, typing.Any]:
+		"""A snapshot of the cache settings and counters"""
+		return {
+			"maxsize":   self.maxsize,
+			"eviction":  self.eviction,
+			"size":      len(self),
+			"hits":      self.hits,
+			"misses":    self.misses,
+			"evictions": self.evictions,
+		}
+
+	def __len__(self) -> int:
+		return len(self._entries)
+
+	def __repr__(self) -> str:
+		return f"<{self.__class__.__name__} {len(self)}/{self.maxsize} {self.eviction} hits={self.hits} misses={self.misses}>"
+
+
+_parse_cache:typing.Optional[TimecodeCache] = None
+"""Frame numbers keyed by `(timecode string, timebase)`, or `None` when disabled"""
+
+_format_cache:typing.Optional[TimecodeCache] = None
+"""Timecode strings keyed by `(frame number, timebase)`, or `None` when disabled"""
+
+def enable(maxsize:int=4096, *, eviction:str="lru", parse:bool=True, format:bool=True):
+	"""Enable (or reconfigure) the parse and/or format caches, each holding up to `maxsize` entries"""
+
+	global _parse_cache, _format_cache
+
+	_parse_cache  = TimecodeCache(maxsize, eviction) if parse else None
+	_format_cache = TimecodeCache(maxsize, eviction) if format else None
+
+def disable():
+	"""Disable and discard both caches"""
+
+	global _parse_cache, _format_cache
+
+	_parse_cache = None
+	_format_cache = None
+
+def is_enabled() -> bool:
+	"""Is either cache enabled"""
+	return _parse_cache is not None or _format_cache is not None
+
+def clear():
+	"""Empty the enabled caches and reset their counters"""
+
+	for cache in (_parse_cache, _format_cache):
+		if cache is not None:
+			cache.clear()
+
+def stats() -> typing.Dict[str, typing.Optional[typing.Dict[str, typing.Any]]]:
+	"""A snapshot of the settings and counters of each cache (`None` for a disabled cache)"""
+	return {
+		"parse":  _parse_cache.stats() if _parse_cache is not None else None,
+		"format": _format_cache.stats() if _format_cache is not None else None,
+	}
+
+def frame_number_from_string(timecode:str, timebase:Timebase, strict:bool=False) -> int:
+	"""Convert a timecode string to a frame number, through the parse cache if it's enabled"""
+
+	cache = _parse_cache
+	if cache is None:
+		return timebase.mode._frame_number_from_string(timecode, timebase.rate, strict)
+
+	# Strict and lenient parses of a nonexistent label differ, so they're cached apart
+	key = (timecode, timebase, True) if strict else (timecode, timebase)
+
+	frame_number = cache.get(key)
+	if frame_number is None:
+		frame_number = timebase.mode._frame_number_from_string(timecode, timebase.rate, strict)
+		cache.put(key, frame_number)
+
+	return frame_number
+
+def string_from_frame_number(frame_number:int, timebase:Timebase) -> str:
+	"""Format a frame number as a timecode string, through the format cache if it's enabled"""
+
+	cache = _format_cache
+	if cache is None:
+		return timebase.mode._string_from_frame_number(frame_number, timebase.rate)
+
+	timecode = cache.get((frame_number, timebase))
+	if timecode is None:
+		timecode = timebase.mode._string_from_frame_number(frame_number, timebase.rate)
+		cache.put((frame_number, timebase), timecode)
+
+	return timecode
@@ -0,0 +1,175 @@
+"""Conversion between frame numbers and wall-clock time -- seconds, or audio sample positions -- in bulk
+
+Rates are counted in whole frames per second, but some really run a little slower than they count: 30 DF plays 30000
+frames every 1001 seconds (29.97 fps).  Each counting mode has a `~CountingMode.PULLDOWN` factor for this, which
+gives an exact `Timebase.real_rate`.  A ``real_rate`` may be given to any of these to override it, as for 23.976 NDF
+(``real_rate=Fraction(24000, 1001)``).
+
+NumPy arrays are converted in one vectorized operation and returned as NumPy arrays.  Anything else returns an
+``array('d')`` of seconds, or an ``array('q')`` of frame numbers or sample positions.
+
+>>> from timecode import clock
+>>> from timecode.modes import DropFrame
+>>> clock.to_samples([0, 1, 30], mode=DropFrame(), sample_rate=48000)
+array('q', [0, 1602, 48048])
+"""
+
+import array, fractions, math, numbers, typing
+from .modes import CountingMode, Timebase
+from .resample import Resampler
+
+DEFAULT_SAMPLE_RATE = 48000
+"""Audio samples per second, if not provided"""
+
+ROUNDING_POLICIES = Resampler.ROUNDING_POLICIES
+"""Supported rounding policies (see `Resampler.ROUNDING_POLICIES`)"""
+
+def _get_timebase(mode:typing.Optional[CountingMode], rate:typing.Optional[int]) -> Timebase:
+	from . import Timecode
+	return Timecode._normalize_mode(mode).get_timebase(rate)
+
+def _real_rate(timebase:Timebase, real_rate:typing.Optional[numbers.Rational]) -> fractions.Fraction:
+	"""The wall-clock frames per second of a timebase, or the one given instead"""
+
+	if real_rate is None:
+		return timebase.real_rate
+
+	real_rate = fractions.Fraction(real_rate)
+	if real_rate <= 0:
+		raise ValueError(f"Real rate must be positive (got {real_rate})")
+	return real_rate
+
+def _check_rounding(rounding:str):
+	if rounding not in ROUNDING_POLICIES:
+		raise ValueError(f"Rounding policy must be one of {', '.join(ROUNDING_POLICIES)} (got {rounding})")
+
+def _check_sample_rate(sample_rate:int):
+	if not isinstance(sample_rate, int) or sample_rate <= 0:
+		raise ValueError("Sample rate must be a positive integer")
+
+def _divide(scaled:typing.Any, denominator:int, rounding:str) -> typing.Any:
+	"""Divide an integer (or an integer array) by a positive integer, rounding as asked"""
+
+	if rounding == "floor":
+		return scaled // denominator
+	elif rounding == "ceil":
+		return -(-scaled // denominator)
+
+	# Round half away from zero, in a way that also works elementwise
+	sign = 1 - 2 * (scaled < 0)
+	return (abs(scaled) * 2 + denominator) // (denominator * 2) * sign
+
+def _round(value:typing.Union[fractions.Fraction, float], rounding:str) -> int:
+	"""Round a single (exact or floating-point) number of frames"""
+
+	if rounding == "floor":
+		return math.floor(value)
+	elif rounding == "ceil":
+		return math.ceil(value)
+	return math.floor(abs(value) + fractions.Fraction(1, 2)) * (-1 if value < 0 else 1)
+
+def _round_array(values, rounding:str):
+	"""Round a NumPy array of floating-point numbers of frames"""
+
+	import numpy
+
+	if rounding == "floor":
+		rounded = numpy.floor(values)
+	elif rounding == "ceil":
+		rounded = numpy.ceil(values)
+	else:
+		rounded = numpy.copysign(numpy.floor(numpy.abs(values) + 0.5), values)
+	return rounded.astype(numpy.int64)
+
+# One at a time, exactly
+
+def seconds_of(frame_number:int, timebase:Timebase, *, real_rate:typing.Optional[numbers.Rational]=None) -> fractions.Fraction:
+	"""The exact wall-clock time of a frame number, in seconds"""
+	return frame_number / _real_rate(timebase, real_rate)
+
+def frame_at_seconds(seconds:typing.Union[numbers.Real, str], timebase:Timebase, *, rounding:str="nearest", real_rate:typing.Optional[numbers.Rational]=None) -> int:
+	"""The frame number at a wall-clock time in seconds (a number, or a string like ``"3.003"`` for an exact value)"""
+
+	_check_rounding(rounding)
+	return _round(fractions.Fraction(seconds) * _real_rate(timebase, real_rate), rounding)
+
+def samples_of(frame_number:int, timebase:Timebase, *, sample_rate:int=DEFAULT_SAMPLE_RATE, rounding:str="nearest", real_rate:typing.Optional[numbers.Rational]=None) -> int:
+	"""The audio sample position of a frame number"""
+
+	_check_rounding(rounding)
+	_check_sample_rate(sample_rate)
+	real_rate = _real_rate(timebase, real_rate)
+	return _divide(frame_number * sample_rate * real_rate.denominator, real_rate.numerator, rounding)
+
+def frame_at_samples(samples:int, timebase:Timebase, *, sample_rate:int=DEFAULT_SAMPLE_RATE, rounding:str="nearest", real_rate:typing.Optional[numbers.Rational]=None) -> int:
+	"""The frame number at an audio sample position"""
+
+	_check_rounding(rounding)
+	_check_sample_rate(sample_rate)
+	real_rate = _real_rate(timebase, real_rate)
+	return _divide(samples * real_rate.numerator, sample_rate * real_rate.denominator, rounding)
+
+# In bulk
+
+def to_seconds(frame_numbers:typing.Iterable[int], mode:typing.Optional[CountingMode]=None, rate:typing.Optional[int]=None, *, real_rate:typing.Optional[numbers.Rational]=None) -> typing.Union[array.array, typing.Any]:
+	"""The wall-clock time of many frame numbers, in (floating-point) seconds"""
+
+	real_rate = _real_rate(_get_timebase(mode, rate), real_rate)
+	numerator, denominator = real_rate.numerator, real_rate.denominator
+
+	if hasattr(frame_numbers, "dtype"):
+		return frame_numbers * denominator / numerator
+
+	# Integer multiply, then one correctly-rounded division
+	return array.array("d", [x * denominator / numerator for x in frame_numbers])
+
+def from_seconds(seconds:typing.Iterable[numbers.Real], mode:typing.Optional[CountingMode]=None, rate:typing.Optional[int]=None, *, rounding:str="nearest", real_rate:typing.Optional[numbers.Rational]=None) -> typing.Union[array.array, typing.Any]:
+	"""The frame numbers at many wall-clock times in seconds
+
+	Floating-point times are taken as they are, so a time sitting exactly on a frame boundary may fall either side of
+	it with ``floor`` or ``ceil`` rounding.  Use `frame_at_seconds()` with exact values where that matters.
+	"""
+
+	_check_rounding(rounding)
+	real_rate = _real_rate(_get_timebase(mode, rate), real_rate)
+
+	if hasattr(seconds, "dtype"):
+		return _round_array(seconds * real_rate.numerator / real_rate.denominator, rounding)
+
+	numerator, denominator = real_rate.numerator, real_rate.denominator
+	return array.array("q", [_round(x * numerator / denominator, rounding) for x in seconds])
+
+def to_samples(frame_numbers:typing.Iterable[int], mode:typing.Optional[CountingMode]=None, rate:typing.Optional[int]=None, *, sample_rate:int=DEFAULT_SAMPLE_RATE, rounding:str="nearest", real_rate:typing.Optional[numbers.Rational]=None) -> typing.Union[array.array, typing.Any]:
+	"""The audio sample positions of many frame numbers, in exact integer math"""
+
+	_check_rounding(rounding)
+	_check_sample_rate(sample_rate)
+	real_rate = _real_rate(_get_timebase(mode, rate), real_rate)
+
+	numerator = sample_rate * real_rate.denominator
+	denominator = real_rate.numerator
+
+	if hasattr(frame_numbers, "dtype"):
+		return _divide(frame_numbers * numerator, denominator, rounding)
+
+	# Whole samples per frame line up exactly; skip the rounding
+	if numerator % denominator == 0:
+		samples_per_frame = numerator // denominator
+		return array.array("q", [x * samples_per_frame for x in frame_numbers])
+
+	return array.array("q", [_divide(x * numerator, denominator, rounding) for x in frame_numbers])
+
+def from_samples(samples:typing.Iterable[int], mode:typing.Optional[CountingMode]=None, rate:typing.Optional[int]=None, *, sample_rate:int=DEFAULT_SAMPLE_RATE, rounding:str="nearest", real_rate:typing.Optional[numbers.Rational]=None) -> typing.Union[array.array, typing.Any]:
+	"""The frame numbers at many audio sample positions, in exact integer math"""
+
+	_check_rounding(rounding)
+	_check_sample_rate(sample_rate)
+	real_rate = _real_rate(_get_timebase(mode, rate), real_rate)
+
+	numerator = real_rate.numerator
+	denominator = sample_rate * real_rate.denominator
+
+	if hasattr(samples, "dtype"):
+		return _divide(samples * numerator, denominator, rounding)
+
+	return array.array("q", [_divide(x * numerator, denominator, rounding) for x in samples])
@@ -0,0 +1,167 @@
+"""Single-pass continuity checking for per-frame timecode tracks
+
+Each value is checked against the label expected to follow the previous one.  Labels which match are never parsed;
+the expected labels are stepped along like an odometer (see `CountingMode.iter_strings()`).  Only values which don't
+match are parsed, to work out what went wrong.
+
+>>> from timecode.continuity import check_continuity
+>>> from timecode.modes import DropFrame
+>>> track = ["00;00;59;28", "00;00;59;29", "00;01;00;00", "00;01;00;03", "00;01;00;03", "00;01;00;10"]
+>>> for event in check_continuity(track, mode=DropFrame()):
+...     print(event)
+Discontinuity(index=2, expected=1800, actual=1800, kind='invalid')
+Discontinuity(index=4, expected=1802, actual=1801, kind='repeat')
+Discontinuity(index=5, expected=1802, actual=1808, kind='jump')
+
+Memory use stays constant however long the track is.
+"""
+
+import sys, typing
+from . import Timecode
+from .modes import CountingMode, Timebase
+
+KINDS = ("jump", "repeat", "backward", "invalid")
+"""Kinds of discontinuity:
+
+* ``jump``: Frames were skipped
+* ``repeat``: The previous frame came again
+* ``backward``: An earlier frame came (other than the previous one)
+* ``invalid``: The value could not be parsed (``actual`` is `None`), or is a label which doesn't exist in the
+  counting mode, such as a dropped drop-frame label
+"""
+
+RawTimecode = typing.Union[str, bytes, int]
+
+class Discontinuity(typing.NamedTuple):
+	"""A break in a timecode track"""
+
+	index:int
+	"""The position of the value in the track"""
+
+	expected:typing.Optional[int]
+	"""The frame number which should have come next (`None` for the first value)"""
+
+	actual:typing.Optional[int]
+	"""The frame number which came instead (`None` if it couldn't be parsed)"""
+
+	kind:str
+	"""What sort of break this is (see `KINDS`)"""
+
+class ContinuityChecker:
+	"""Checks a track of timecode strings (or frame numbers) one value at a time, in constant time and memory
+
+	After a break, the track is expected to carry on from wherever it jumped to.
+	"""
+
+	__slots__ = ("_timebase", "_index", "_expected", "_labels")
+
+	def __init__(self, mode:typing.Optional[CountingMode]=None, rate:typing.Optional[int]=None):
+
+		self._timebase = Timecode._normalize_mode(mode).get_timebase(rate)
+		self._index = 0
+		self._expected = None
+		self._labels = None
+
+	@property
+	def timebase(self) -> Timebase:
+		"""The counting mode and rate of the track"""
+		return self._timebase
+
+	@property
+	def rate(self) -> int:
+		return self._timebase.rate
+
+	@property
+	def mode(self) -> CountingMode:
+		return self._timebase.mode
+
+	@property
+	def index(self) -> int:
+		"""How many values have been checked"""
+		return self._index
+
+	@property
+	def expected(self) -> typing.Optional[int]:
+		"""The frame number expected next (`None` before the first value)"""
+		return self._expected
+
+	def _expected_label(self) -> typing.Optional[str]:
+		"""The label expected next, keeping the odometer in step with the expected frame number"""
+
+		if self._expected is None:
+			return None
+		if self._labels is None:
+			self._labels = self._timebase.mode.iter_strings(self._expected, sys.maxsize, self._timebase.rate)
+		return next(self._labels)
+
+	def _parse(self, timecode:str) -> typing.Tuple[int, bool]:
+		"""The frame number of a label, and whether the label actually exists"""
+
+		mode, rate = self._timebase.mode, self._timebase.rate
+		sign, hours, minutes, seconds, frames = mode._components_from_string(timecode)
+		frame_number = mode._frame_number_from_components(hours, minutes, seconds, frames, rate) * sign
+		return frame_number, mode.is_valid_label(hours, minutes, seconds, frames, rate)
+
+	def check(self, value:RawTimecode) -> typing.Optional[Discontinuity]:
+		"""Check the next value in the track, returning a `Discontinuity` if it doesn't follow on from the last"""
+
+		index = self._index
+		expected = self._expected
+		self._index += 1
+		valid = True
+
+		if isinstance(value, int):
+			actual = value
+			self._labels = None
+		else:
+			if isinstance(value, (bytes, bytearray)):
+				value = value.decode("ascii", errors="replace")
+
+			if value == self._expected_label():
+				self._expected += 1
+				return None
+
+			try:
+				actual, valid = self._parse(value.strip())
+			except ValueError:
+				# Assume the unreadable value took up its frame, and carry on
+				if expected is not None:
+					self._expected += 1
+				return Discontinuity(index, expected, None, "invalid")
+
+		if actual != expected:
+			self._labels = None
+		self._expected = actual + 1
+
+		if not valid:
+			return Discontinuity(index, expected, actual, "invalid")
+		elif expected is None or actual == expected:
+			return None
+		elif actual > expected:
+			return Discontinuity(index, expected, actual, "jump")
+		elif actual == expected - 1:
+			return Discontinuity(index, expected, actual, "repeat")
+		return Discontinuity(index, expected, actual, "backward")
+
+	def check_many(self, values:typing.Iterable[RawTimecode]) -> typing.Iterator[Discontinuity]:
+		"""Check many values in turn, yielding each `Discontinuity` as it's found"""
+
+		check = self.check
+		for value in values:
+			event = check(value)
+			if event is not None:
+				yield event
+
+	def reset(self):
+		"""Start checking a new track"""
+
+		self._index = 0
+		self._expected = None
+		self._labels = None
+
+	def __repr__(self) -> str:
+		return f"<{self.__class__.__name__} ({self._index}) @ {self.rate} {self.mode}>"
+
+def check_continuity(values:typing.Iterable[RawTimecode], mode:typing.Optional[CountingMode]=None, rate:typing.Optional[int]=None) -> typing.Iterator[Discontinuity]:
+	"""Check a whole track of timecode strings (or frame numbers) in one pass, yielding each `Discontinuity`"""
+	return ContinuityChecker(mode, rate).check_many(values)
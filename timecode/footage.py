@@ -1,63 +1,235 @@
-import typing, copy
+"""Contains the `Footage` class, which counts frames as feet+frames for a given film gauge"""
+
+import array, fractions, typing
+
+class FilmGauge(typing.NamedTuple):
+	"""A film format, described by its perforations
+
+	Formats with a whole number of frames per foot (like 35mm 4-perf) start each foot on a frame.  Others (like 35mm
+	3-perf) don't, so each foot is counted from the first frame which starts within it.
+	"""
+
+	name:str
+	"""A friendly name for the format"""
+
+	perfs_per_foot:int
+	"""Perforations per foot of film"""
+
+	perfs_per_frame:int
+	"""Perforations per frame"""
+
+	@property
+	def frames_per_foot(self) -> fractions.Fraction:
+		"""Frames per foot of film (which may not be a whole number)"""
+		return fractions.Fraction(self.perfs_per_foot, self.perfs_per_frame)
+
+	@property
+	def frame_digits(self) -> int:
+		"""The number of digits used to display the frames element"""
+		return len(str(-(-self.perfs_per_foot // self.perfs_per_frame)))
+
+	def feet_of_frame(self, frame_number:int) -> int:
+		"""The foot in which a (positive) frame number starts"""
+		return frame_number * self.perfs_per_frame // self.perfs_per_foot
+
+	def first_frame_of_foot(self, feet:int) -> int:
+		"""The first frame which starts in a given (positive) foot"""
+		return -(-feet * self.perfs_per_foot // self.perfs_per_frame)
+
+GAUGE_16MM          = FilmGauge("16mm", 40, 1)
+GAUGE_35MM_2PERF    = FilmGauge("35mm 2-perf", 64, 2)
+GAUGE_35MM_3PERF    = FilmGauge("35mm 3-perf", 64, 3)
+GAUGE_35MM_4PERF    = FilmGauge("35mm 4-perf", 64, 4)
+GAUGE_35MM_8PERF    = FilmGauge("35mm 8-perf", 64, 8)
+GAUGE_65MM_5PERF    = FilmGauge("65mm 5-perf", 64, 5)
+GAUGE_65MM_15PERF   = FilmGauge("65mm 15-perf", 64, 15)
+
+GAUGES:typing.Dict[str, FilmGauge] = {gauge.name: gauge for gauge in (
+	GAUGE_16MM,
+	GAUGE_35MM_2PERF,
+	GAUGE_35MM_3PERF,
+	GAUGE_35MM_4PERF,
+	GAUGE_35MM_8PERF,
+	GAUGE_65MM_5PERF,
+	GAUGE_65MM_15PERF,
+)}
+"""Built-in film gauges, by name"""
 
 class Footage:
 	"""A rate-agnostic frame counter based on the number of frames per foot in various film formats"""
-	
-	__slots___ = ("_framenumber", "_frames_per_foot")
-	
-	def __init__(self, frames:typing.Union[str,int,None], frames_per_foot:int=16):
-		
-		# TODO: Add support for more than 35mm 4-perf
 
-		self._framenumber = self._normalize_framenumber(frames, frames_per_foot)
-		self._frames_per_foot = frames_per_foot
+	DEFAULT_GAUGE = GAUGE_35MM_4PERF
+	"""The film gauge to use if not provided"""
+
+	__slots__ = ("_framenumber", "_gauge")
+
+	def __init__(self, frames:typing.Union[str,int,"Footage",None], frames_per_foot:typing.Optional[int]=None, *, gauge:typing.Union[FilmGauge,str,None]=None):
+
+		self._gauge = self._normalize_gauge(gauge, frames_per_foot)
+		self._framenumber = self._normalize_framenumber(frames, self._gauge)
 
 	@classmethod
-	def _normalize_framenumber(cls, frames:typing.Union[str,int,None], frames_per_foot:int=16) -> int:
+	def _normalize_gauge(cls, gauge:typing.Union[FilmGauge,str,None]=None, frames_per_foot:typing.Optional[int]=None) -> FilmGauge:
+		"""Validate and clean the user-provided film gauge (or frames per foot)"""
+
+		if gauge is not None and frames_per_foot is not None:
+			raise ValueError("Provide either a gauge or frames per foot, but not both")
+
+		if isinstance(gauge, FilmGauge):
+			return gauge
+
+		elif isinstance(gauge, str):
+			try:
+				return GAUGES[gauge]
+			except KeyError:
+				raise ValueError(f"Unknown film gauge {gauge!r} (expected one of: {', '.join(GAUGES)})") from None
+
+		elif gauge is not None:
+			raise ValueError("Gauge must be a `FilmGauge` or the name of a built-in gauge")
+
+		if frames_per_foot is None:
+			return cls.DEFAULT_GAUGE
+
+		elif isinstance(frames_per_foot, int) and frames_per_foot > 0:
+			return GAUGE_35MM_4PERF if frames_per_foot == 16 else FilmGauge(f"{frames_per_foot} fpf", frames_per_foot, 1)
+
+		raise ValueError("Frames per foot must be a positive integer")
+
+	@classmethod
+	def _normalize_framenumber(cls, frames:typing.Union[str,int,"Footage",None], gauge:FilmGauge=GAUGE_35MM_4PERF) -> int:
 		"""Return a frame number from F+F input"""
 
 		if isinstance(frames, int):
 			return frames
-		
+
 		elif isinstance(frames, cls):
-			return copy.copy(frames)
-		
-		frames = str(frames).strip()
-		is_negative = frames.startswith('-')
-		frames.lstrip("+-")
-
-		ff_elements = frames.splt('+')
-		multipliers = [1, frames_per_foot]
-		
-		if len(ff_elements) > len(multipliers):
-			raise ValueError("Frame count is not in the expected format of feet+frames")
-		
-		frame_count = 0
-		
-		try:
-			for idx, ff_element in enumerate(ff_elements[::-1]):
-				frame_count += int(ff_element) * multipliers[idx]
-		except Exception:
-			raise ValueError("Frame count is not in the expected format of feet+frames")
-	
+			return frames._framenumber
+
+		# Timecodes or anything else that knows its frame number
+		elif hasattr(frames, "frame_number"):
+			return int(frames.frame_number)
+
+		return cls._frame_number_from_string(str(frames), gauge)
+
+	@classmethod
+	def _frame_number_from_string(cls, frames:str, gauge:FilmGauge) -> int:
+		"""Validate and convert a feet+frames string to the frame number it represents"""
+
+		footage = frames.strip()
+		sign = -1 if footage.startswith('-') else 1
+
+		# One optional sign, then digits: feet+frames, or just frames
+		ff_elements = footage[1:].split('+') if footage[:1] in ("+", "-") else footage.split('+')
+
+		if len(ff_elements) > 2 or not all(x.isascii() and x.isdigit() for x in ff_elements):
+			raise ValueError(f"Frame count is not in the expected format of feet+frames (got {frames!r})")
+
+		feet, frames = [0] * (2 - len(ff_elements)) + [int(x) for x in ff_elements]
+
+		# A bare frame count may be any length, but the frames of a feet+frames count must fit within the foot
+		if len(ff_elements) == 2 and frames >= gauge.first_frame_of_foot(feet + 1) - gauge.first_frame_of_foot(feet):
+			raise ValueError(f"Frame count {feet}+{frames} has more frames than foot {feet} holds in {gauge.name}")
+
+		return (gauge.first_frame_of_foot(feet) + frames) * sign
+
+	@classmethod
+	def _string_from_frame_number(cls, framenumber:int, gauge:FilmGauge) -> str:
+		"""Format the given frame number as a feet+frames string"""
+
+		magnitude = abs(framenumber)
+		feet = gauge.feet_of_frame(magnitude)
+		frames = magnitude - gauge.first_frame_of_foot(feet)
+
+		return ("-" if framenumber < 0 else "") + str(feet) + "+" + str(frames).zfill(gauge.frame_digits)
+
+	@classmethod
+	def parse_many(cls, footages:typing.Iterable[str], gauge:typing.Union[FilmGauge,str,None]=None, *, errors:typing.Optional[typing.List[typing.Tuple[int,str]]]=None) -> array.array:
+		"""Convert many feet+frames strings to an array of frame numbers in one pass
+
+		Bad rows are handled as in `CountingMode.parse_many()`.  The result can be passed straight to
+		`TimecodeArray` to work with it as timecode.
+		"""
+
+		gauge = cls._normalize_gauge(gauge)
+		from_string = cls._frame_number_from_string
+
+		frame_numbers = array.array("q")
+		bad_rows = []
+
+		for idx, footage in enumerate(footages):
+			try:
+				if not isinstance(footage, str):
+					raise ValueError(f"Expected a feet+frames string, got {type(footage).__name__}")
+				frame_numbers.append(from_string(footage, gauge))
+			except ValueError as e:
+				frame_numbers.append(0)
+				bad_rows.append((idx, str(e)))
+
+		if bad_rows and errors is None:
+			preview = ", ".join(str(idx) for idx, _ in bad_rows[:10]) + (", ..." if len(bad_rows) > 10 else "")
+			raise ValueError(f"{len(bad_rows)} frame count(s) are not in the expected format of feet+frames (rows: {preview})")
+		elif errors is not None:
+			errors.extend(bad_rows)
+
+		return frame_numbers
+
+	@classmethod
+	def format_many(cls, frame_numbers:typing.Iterable[int], gauge:typing.Union[FilmGauge,str,None]=None) -> typing.List[str]:
+		"""Format many frame numbers as feet+frames strings
+
+		Accepts any iterable of frame numbers, including an ``array``, a NumPy array, or a `TimecodeArray`.
+		"""
+
+		gauge = cls._normalize_gauge(gauge)
+
+		# Skip building Timecode objects for TimecodeArrays and friends
+		frame_numbers = getattr(frame_numbers, "frame_numbers", frame_numbers)
+		if hasattr(frame_numbers, "tolist"):
+			frame_numbers = frame_numbers.tolist()
+
+		to_string = cls._string_from_frame_number
+		return [to_string(x, gauge) for x in frame_numbers]
+
+	@classmethod
+	def from_timecode(cls, timecode:"Timecode", gauge:typing.Union[FilmGauge,str,None]=None) -> "Footage":
+		"""The footage for the frame number of a `Timecode`"""
+		return cls(timecode.frame_number, gauge=cls._normalize_gauge(gauge))
+
+	def to_timecode(self, mode:typing.Optional["CountingMode"]=None, rate:typing.Optional[int]=None) -> "Timecode":
+		"""A `Timecode` for this frame number, at a given mode and rate"""
+		from .timecode import Timecode
+		return Timecode(self._framenumber, mode=mode, rate=rate)
+
+	@property
+	def gauge(self) -> FilmGauge:
+		"""The film gauge used to count feet"""
+		return self._gauge
+
+	@property
+	def frame_number(self) -> int:
+		"""The footage as a frame number"""
+		return self._framenumber
+
 	@property
 	def feet(self) -> int:
 		"""Number of full feet"""
-		return abs(self._framenumber) // self._frames_per_foot * (-1 if self.is_negative else 1)
-	
+		return self._gauge.feet_of_frame(abs(self._framenumber)) * (-1 if self.is_negative else 1)
+
 	@property
 	def frames(self) -> int:
-		return abs(self._framenumber) % self._frames_per_foot  * (-1 if self.is_negative else 1)
-	
+		"""Frames into the current foot"""
+		magnitude = abs(self._framenumber)
+		return (magnitude - self._gauge.first_frame_of_foot(self._gauge.feet_of_frame(magnitude))) * (-1 if self.is_negative else 1)
+
 	@property
 	def is_negative(self) -> bool:
 		return self._framenumber < 0
-	
+
 	def __str__(self) -> str:
-		return ("-" if self.is_negative else "") + str(abs(self.feet)) + "+" + str(abs(self.frames)).zfill(len(str(self._frames_per_foot)))
-	
+		return self._string_from_frame_number(self._framenumber, self._gauge)
+
 	def __repr__(self) -> str:
-		return f"<{self.__class__.__name__} {str(self)} 35mm 4-perf>"
-	
+		return f"<{self.__class__.__name__} {str(self)} {self._gauge.name}>"
+
 	def __int__(self) -> int:
-		return self._framenumber
\ No newline at end of file
+		return self._framenumber
@@ -0,0 +1,204 @@
+"""Streaming readers which turn CMX3600 EDLs and CSV pull lists into `TimecodeRange` objects
+
+Files are read through a large buffer and parsed lazily in batches using `CountingMode.parse_many()`, so memory use
+stays bounded no matter how long the list is.
+"""
+
+import contextlib, csv, io, itertools, os, typing
+from . import Timecode, TimecodeRange
+from .modes import CountingMode, DropFrame, NonDropFrame, Timebase
+
+DEFAULT_BATCH_SIZE = 1024
+"""Events (or rows) to parse at a time"""
+
+READ_BUFFER_SIZE = 1 << 20
+"""Bytes to read from disk at a time"""
+
+FileOrPath = typing.Union[str, os.PathLike, typing.IO]
+
+class EdlEvent(typing.NamedTuple):
+	"""An event from an EDL, with its source and record ranges"""
+
+	number:str
+	"""The event number, as written"""
+
+	reel:str
+	"""The source reel (or tape) name"""
+
+	track:str
+	"""The track(s) affected (e.g. ``V``, ``A``, ``AA/V``)"""
+
+	transition:str
+	"""The transition type (e.g. ``C``, ``D``, ``W001``)"""
+
+	source:TimecodeRange
+	"""The source in/out points"""
+
+	record:TimecodeRange
+	"""The record in/out points"""
+
+	line_number:int
+	"""The line this event was read from (1-based)"""
+
+@contextlib.contextmanager
+def _open_text(file:FileOrPath, newline:typing.Optional[str]=None) -> typing.Iterator[typing.IO[str]]:
+	"""Open a path for buffered text reading, or borrow an already-open file without closing it when done"""
+
+	if isinstance(file, (str, os.PathLike)):
+		with open(file, "r", encoding="utf-8", errors="replace", buffering=READ_BUFFER_SIZE, newline=newline) as text_file:
+			yield text_file
+
+	elif isinstance(file, (io.RawIOBase, io.BufferedIOBase)):
+		text_file = io.TextIOWrapper(file, encoding="utf-8", errors="replace", newline=newline)
+		try:
+			yield text_file
+		finally:
+			text_file.detach()	# Leave the binary file open for the caller
+
+	else:
+		yield file
+
+def _parse_batch(timecodes:typing.List[str], timebase:Timebase, line_numbers:typing.Sequence[int], fields_per_line:int) -> typing.Sequence[int]:
+	"""Parse a batch of timecode strings, reporting any bad ones by line number"""
+
+	errors = []
+	frame_numbers = timebase.mode.parse_many(timecodes, timebase.rate, errors=errors)
+
+	if errors:
+		idx, message = errors[0]
+		raise ValueError(f"Line {line_numbers[idx // fields_per_line]}: {message} (got {timecodes[idx]!r})")
+
+	return frame_numbers
+
+def _ranges_from_frames(frame_numbers:typing.Sequence[int], timebase:Timebase, line_number:int) -> typing.Iterator[TimecodeRange]:
+	"""Pair up in and out points as ranges"""
+
+	for tc_in, tc_out in zip(frame_numbers[0::2], frame_numbers[1::2]):
+		if tc_out < tc_in and not TimecodeRange.ALLOW_NEGATIVE_RANGES:
+			raise ValueError(f"Line {line_number}: Out point occurs before in point")
+		yield TimecodeRange._from_validated(tc_in, tc_out - tc_in, timebase)
+
+def _detect_mode(fcm:str) -> typing.Optional[typing.Type[CountingMode]]:
+	"""Map an EDL ``FCM:`` line to a counting mode"""
+
+	fcm = fcm.upper().replace("-", " ").replace("_", " ")
+
+	if "NON DROP" in fcm or "NONDROP" in fcm:
+		return NonDropFrame
+	elif "DROP" in fcm:
+		return DropFrame
+	return None
+
+def read_edl(file:FileOrPath, *, mode:typing.Optional[CountingMode]=None, rate:typing.Optional[int]=None, batch_size:int=DEFAULT_BATCH_SIZE) -> typing.Iterator[EdlEvent]:
+	"""Lazily read the events from a CMX3600-style EDL
+
+	Unless a ``mode`` is given, the counting mode is taken from ``FCM:`` lines as they appear (or from ``;``
+	separators if there are none), and mapped onto `DropFrame` or `NonDropFrame`.  Every event shares one ``rate``:
+	30 if the EDL has ``FCM:`` lines or drop-frame events (both of which mean NTSC), or otherwise the counting mode's
+	default rate, unless one is given.  A ``ValueError`` is raised if drop-frame events can't be counted at that rate.
+	"""
+
+	forced_mode = type(mode) if mode is not None else None
+	detected_mode = None
+	has_fcm = False
+
+	pending:typing.List[typing.List[str]] = []
+	pending_lines:typing.List[int] = []
+	pending_mode:typing.Optional[typing.Type[CountingMode]] = None
+
+	def flush() -> typing.Iterator[EdlEvent]:
+		if not pending:
+			return
+		try:
+			timebase = pending_mode.get_timebase(rate)
+		except ValueError as e:
+			raise ValueError(f"Line {pending_lines[0]}: Can't read {pending_mode()} events at {rate} fps: {e}") from None
+		timecodes = [tc for tokens in pending for tc in tokens[-4:]]
+		frame_numbers = _parse_batch(timecodes, timebase, pending_lines, 4)
+		for idx, tokens in enumerate(pending):
+			source, record = _ranges_from_frames(frame_numbers[idx*4:idx*4+4], timebase, pending_lines[idx])
+			yield EdlEvent(tokens[0], tokens[1], tokens[2], tokens[3], source, record, pending_lines[idx])
+		pending.clear()
+		pending_lines.clear()
+
+	with _open_text(file) as edl:
+
+		for line_number, line in enumerate(edl, start=1):
+
+			tokens = line.split()
+			if not tokens:
+				continue
+
+			# Counting mode changes
+			if tokens[0].upper() == "FCM:":
+				detected_mode = _detect_mode(line.split(":", 1)[1])
+				has_fcm = True
+				continue
+
+			# Events start with an event number and end with four timecodes
+			if not tokens[0].isdigit() or len(tokens) < 8:
+				continue
+
+			event_mode = forced_mode or detected_mode or (DropFrame if ";" in tokens[-1] else NonDropFrame)
+
+			# One rate for the whole EDL, settled by the first event
+			if rate is None:
+				rate = 30 if has_fcm or event_mode is DropFrame else event_mode.DEFAULT_RATE
+
+			if pending and (event_mode is not pending_mode or len(pending) >= batch_size):
+				yield from flush()
+
+			pending_mode = event_mode
+			pending.append(tokens)
+			pending_lines.append(line_number)
+
+		yield from flush()
+
+def read_csv(file:FileOrPath, *columns:typing.Tuple[typing.Union[str,int], typing.Union[str,int]], mode:typing.Optional[CountingMode]=None, rate:typing.Optional[int]=None, has_header:bool=True, batch_size:int=DEFAULT_BATCH_SIZE, **csv_options) -> typing.Iterator[typing.Tuple[TimecodeRange, ...]]:
+	"""Lazily read ranges from a CSV file, as a tuple of `TimecodeRange` per row
+
+	Each of ``columns`` is an ``(in, out)`` pair of column names (or indexes, if the file has no header).  Unless a
+	``mode`` is given, `DropFrame` is used if the first batch of timecodes uses ``;`` separators.  Any other keyword
+	arguments are passed along to `csv.reader`.
+	"""
+
+	if not columns:
+		raise ValueError("At least one (in, out) pair of columns is required")
+
+	with _open_text(file, newline="") as csv_file:
+
+		reader = csv.reader(csv_file, **csv_options)
+
+		header = next(reader, None) if has_header else None
+
+		try:
+			indexes = [header.index(column) if isinstance(column, str) and header is not None else int(column) for pair in columns for column in pair]
+		except ValueError:
+			raise ValueError(f"Columns {columns} not found in CSV header {header}") from None
+
+		timebase = Timecode._normalize_mode(mode).get_timebase(rate) if mode is not None else None
+		fields_per_row = len(indexes)
+
+		while True:
+			batch, line_numbers = [], []
+			for row in itertools.islice(reader, batch_size):
+				batch.append(row)
+				line_numbers.append(reader.line_num)
+
+			if not batch:
+				break
+
+			try:
+				timecodes = [row[idx].strip() for row in batch for idx in indexes]
+			except IndexError:
+				short_row = next(row_idx for row_idx, row in enumerate(batch) if len(row) <= max(indexes))
+				raise ValueError(f"Line {line_numbers[short_row]}: Expected at least {max(indexes) + 1} columns") from None
+
+			if timebase is None:
+				timebase = (DropFrame if any(";" in tc for tc in timecodes) else NonDropFrame).get_timebase(rate)
+
+			frame_numbers = _parse_batch(timecodes, timebase, line_numbers, fields_per_row)
+
+			for idx, line_number in enumerate(line_numbers):
+				row_frames = frame_numbers[idx*fields_per_row:(idx+1)*fields_per_row]
+				yield tuple(_ranges_from_frames(row_frames, timebase, line_number))
@@ -0,0 +1,321 @@
+"""Opt-in call counters (and timers) for the conversion hot paths, per counting mode and rate
+
+Instrumentation is disabled by default, and costs nothing until it's enabled: the hot paths are only wrapped while
+it's on.
+
+>>> from timecode import Timecode, instrumentation
+>>> with instrumentation.measure(timing=True) as report:
+...     tc = Timecode("01:00:00:00", rate=30)
+...     tc_string = str(tc)
+>>> report["parse"]["30 NDF"]["calls"]
+1
+
+The operations counted are:
+
+* ``parse``: `CountingMode._frame_number_from_string()`, and `CountingMode.parse_many()` (``items`` counts the rows
+  parsed)
+* ``format``: `CountingMode._string_from_frame_number()`, and `CountingMode.iter_strings()` and
+  `CountingMode.iter_bytes()` (``items`` counts the labels yielded)
+* ``dropped_frames``: `DropFrame.get_dropped_frames()`
+* ``timecode_init``: `Timecode` construction, including the timecodes built internally by arithmetic, iteration,
+  resampling and so on
+* ``range_iter``: `TimecodeRange` iteration (``items`` counts the timecodes yielded)
+
+Counting modes defined after instrumentation is enabled are picked up the next time it's enabled.  Conversions which
+never build a `Timecode` or go through the methods above aren't counted: `TimecodeArray` math, the `clock` and
+`resample` frame number conversions, and `smpte` decoding.
+"""
+
+import contextlib, functools, threading, time, typing
+from . import Timecode, TimecodeRange
+from .modes import CountingMode
+
+MODE_OPERATIONS = {
+	"parse":          "_frame_number_from_string",
+	"format":         "_string_from_frame_number",
+	"dropped_frames": "get_dropped_frames",
+}
+"""Counting mode classmethods to instrument, by operation name"""
+
+_counters:typing.Optional[typing.Dict[typing.Tuple[str, str], typing.List]] = None
+"""``[calls, items, seconds]`` keyed by `(operation, "rate mode")`, or `None` when disabled"""
+
+_timing = False
+"""Time calls as well as counting them"""
+
+_patched:typing.List[typing.Tuple[type, str, typing.Any]] = []
+"""The original attributes which were wrapped, as `(owner, name, original)`"""
+
+_labels:typing.Dict[typing.Tuple[type, typing.Any], str] = {}
+"""Cached ``"rate mode"`` labels by `(mode class, rate)`"""
+
+_lock = threading.Lock()
+_local = threading.local()
+
+def _label(mode_class:typing.Type[CountingMode], rate:typing.Any) -> str:
+	"""A ``"rate mode"`` label, like ``30 DF``"""
+
+	try:
+		return _labels[(mode_class, rate)]
+	except (KeyError, TypeError):
+		pass
+
+	label = f"{rate if rate is not None else mode_class.DEFAULT_RATE} {mode_class()}"
+	try:
+		_labels[(mode_class, rate)] = label
+	except TypeError:
+		pass
+	return label
+
+def _record(operation:str, label:str, items:int, elapsed:float):
+	counters = _counters
+	if counters is None:
+		return
+	with _lock:
+		counter = counters.setdefault((operation, label), [0, 0, 0.0])
+		counter[0] += 1
+		counter[1] += items
+		counter[2] += elapsed
+
+@contextlib.contextmanager
+def _outermost(operation:str) -> typing.Iterator[bool]:
+	"""Guard against counting calls twice when an implementation calls its parent class (or itself)"""
+
+	active = _local.__dict__.setdefault("active", set())
+	if operation in active:
+		yield False
+		return
+
+	active.add(operation)
+	try:
+		yield True
+	finally:
+		active.discard(operation)
+
+def _wrap_mode_classmethod(func:typing.Callable, operation:str) -> classmethod:
+
+	@functools.wraps(func)
+	def wrapper(cls, value, rate=None, *args, **kwargs):
+		with _outermost(operation) as outermost:
+			if not outermost:
+				return func(cls, value, rate, *args, **kwargs)
+			start = time.perf_counter() if _timing else 0.0
+			try:
+				return func(cls, value, rate, *args, **kwargs)
+			finally:
+				_record(operation, _label(cls, rate), 1, time.perf_counter() - start if _timing else 0.0)
+
+	return classmethod(wrapper)
+
+def _wrap_parse_many(func:typing.Callable, operation:str) -> classmethod:
+
+	@functools.wraps(func)
+	def wrapper(cls, timecodes, rate=None, *args, **kwargs):
+		with _outermost(operation) as outermost:
+			if not outermost:
+				return func(cls, timecodes, rate, *args, **kwargs)
+			start = time.perf_counter() if _timing else 0.0
+			frame_numbers = None
+			try:
+				frame_numbers = func(cls, timecodes, rate, *args, **kwargs)
+				return frame_numbers
+			finally:
+				_record(operation, _label(cls, rate), len(frame_numbers) if frame_numbers is not None else 0, time.perf_counter() - start if _timing else 0.0)
+
+	return classmethod(wrapper)
+
+def _wrap_iter_labels(func:typing.Callable, operation:str) -> classmethod:
+
+	@functools.wraps(func)
+	def wrapper(cls, start, count, rate, *args, **kwargs):
+
+		label = _label(cls, rate)
+		iterator = func(cls, start, count, rate, *args, **kwargs)
+		perf_counter = time.perf_counter
+		items = 0
+		elapsed = 0.0
+
+		# As for ranges, only time spent producing labels counts.  Anything it formats along the way is part of it.
+		try:
+			while True:
+				with _outermost(operation):
+					begin = perf_counter() if _timing else 0.0
+					try:
+						tc_label = next(iterator)
+					except StopIteration:
+						return
+					finally:
+						if _timing:
+							elapsed += perf_counter() - begin
+				items += 1
+				yield tc_label
+		finally:
+			_record(operation, label, items, elapsed)
+
+	return classmethod(wrapper)
+
+def _wrap_timecode_init(func:typing.Callable) -> typing.Callable:
+
+	@functools.wraps(func)
+	def wrapper(self, *args, **kwargs):
+		start = time.perf_counter() if _timing else 0.0
+		func(self, *args, **kwargs)
+		_record("timecode_init", _label(type(self._timebase.mode), self._timebase.rate), 1, time.perf_counter() - start if _timing else 0.0)
+
+	return wrapper
+
+def _wrap_timecode_from_validated(func:typing.Callable) -> classmethod:
+
+	@functools.wraps(func)
+	def wrapper(cls, frame_number, timebase):
+		start = time.perf_counter() if _timing else 0.0
+		timecode = func(cls, frame_number, timebase)
+		_record("timecode_init", _label(type(timebase.mode), timebase.rate), 1, time.perf_counter() - start if _timing else 0.0)
+		return timecode
+
+	return classmethod(wrapper)
+
+def _wrap_range_iter(func:typing.Callable) -> typing.Callable:
+
+	@functools.wraps(func)
+	def wrapper(self):
+
+		label = _label(type(self.mode), self.rate)
+		iterator = func(self)
+		perf_counter = time.perf_counter
+		items = 0
+		elapsed = 0.0
+
+		# Only time spent producing timecodes counts, not time spent by whoever is consuming them
+		try:
+			while True:
+				start = perf_counter() if _timing else 0.0
+				try:
+					timecode = next(iterator)
+				except StopIteration:
+					return
+				finally:
+					if _timing:
+						elapsed += perf_counter() - start
+				items += 1
+				yield timecode
+		finally:
+			_record("range_iter", label, items, elapsed)
+
+	return wrapper
+
+def _mode_classes() -> typing.Iterator[type]:
+	"""`CountingMode` and all of its subclasses"""
+
+	pending = [CountingMode]
+	while pending:
+		mode_class = pending.pop()
+		yield mode_class
+		pending.extend(mode_class.__subclasses__())
+
+def _patch(owner:type, name:str, replacement:typing.Any):
+	_patched.append((owner, name, owner.__dict__[name]))
+	setattr(owner, name, replacement)
+
+def enable(*, timing:bool=False):
+	"""Start counting calls (and timing them, if ``timing`` is set), keeping any counts so far"""
+
+	global _counters, _timing
+
+	with _lock:
+		_timing = timing
+		if _counters is None:
+			_counters = {}
+
+		if _patched:
+			return
+
+		for mode_class in _mode_classes():
+			for operation, name in MODE_OPERATIONS.items():
+				if name in mode_class.__dict__:
+					_patch(mode_class, name, _wrap_mode_classmethod(mode_class.__dict__[name].__func__, operation))
+
+			# Batches count as one call, of many items
+			if "parse_many" in mode_class.__dict__:
+				_patch(mode_class, "parse_many", _wrap_parse_many(mode_class.__dict__["parse_many"].__func__, "parse"))
+			if "_iter_labels" in mode_class.__dict__:
+				_patch(mode_class, "_iter_labels", _wrap_iter_labels(mode_class.__dict__["_iter_labels"].__func__, "format"))
+
+		_patch(Timecode, "__init__", _wrap_timecode_init(Timecode.__init__))
+		_patch(Timecode, "_from_validated", _wrap_timecode_from_validated(Timecode.__dict__["_from_validated"].__func__))
+		_patch(TimecodeRange, "__iter__", _wrap_range_iter(TimecodeRange.__iter__))
+
+def disable():
+	"""Stop counting, restore the original hot paths, and discard the counts"""
+
+	global _counters, _timing
+
+	with _lock:
+		while _patched:
+			owner, name, original = _patched.pop()
+			setattr(owner, name, original)
+
+		_counters = None
+		_timing = False
+
+def is_enabled() -> bool:
+	"""Is instrumentation enabled"""
+	return _counters is not None
+
+def clear():
+	"""Reset the counts"""
+
+	with _lock:
+		if _counters is not None:
+			_counters.clear()
+
+def snapshot() -> typing.Dict[str, typing.Dict[str, typing.Dict[str, typing.Any]]]:
+	"""A copy of the counts so far, as ``{operation: {"rate mode": {"calls", "items", "seconds"}}}``
+
+	``seconds`` is `None` unless timing is enabled.
+	"""
+
+	with _lock:
+		counters = dict(_counters or {})
+		timing = _timing
+
+	report:typing.Dict[str, typing.Dict[str, typing.Dict[str, typing.Any]]] = {}
+	for (operation, label), (calls, items, seconds) in sorted(counters.items()):
+		report.setdefault(operation, {})[label] = {
+			"calls":   calls,
+			"items":   items,
+			"seconds": seconds if timing else None,
+		}
+	return report
+
+@contextlib.contextmanager
+def measure(*, timing:bool=False) -> typing.Iterator[typing.Dict[str, typing.Dict[str, typing.Dict[str, typing.Any]]]]:
+	"""Count (and optionally time) the calls made within a ``with`` block
+
+	Yields a dict which is filled in with a `snapshot()` of just this block when it exits.  Instrumentation is left
+	as it was found.
+	"""
+
+	was_enabled = is_enabled()
+	previous_counts = dict((key, counts[:]) for key, counts in (_counters or {}).items())
+	previous_timing = _timing
+
+	enable(timing=timing)
+	clear()
+
+	report = {}
+	try:
+		yield report
+	finally:
+		report.update(snapshot())
+
+		if not was_enabled:
+			disable()
+		else:
+			# Put back the counts from before, plus whatever happened in here
+			with _lock:
+				for key, counts in previous_counts.items():
+					merged = _counters.setdefault(key, [0, 0, 0.0])
+					for idx, count in enumerate(counts):
+						merged[idx] += count
+			enable(timing=previous_timing)
@@ -1,5 +1,6 @@
+from .timebase import Timebase
 from .abstract import CountingMode
 from .ndf import NonDropFrame
 from .df import DropFrame
 
-__all__ = ["CountingMode", "NonDropFrame", "DropFrame"]
\ No newline at end of file
+__all__ = ["Timebase", "CountingMode", "NonDropFrame", "DropFrame"]
\ No newline at end of file
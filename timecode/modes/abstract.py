@@ -1,4 +1,5 @@
-import abc, typing
+import abc, array, fractions, typing
+from .timebase import Timebase
 
 class CountingMode(abc.ABC):
 	"""An abstract class to facilitate timecode frame counting modes"""
@@ -12,6 +13,9 @@ class CountingMode(abc.ABC):
 	DEFAULT_RATE = 24
 	"""The default frame rate to use if not provided"""
 
+	PULLDOWN = fractions.Fraction(1)
+	"""Wall-clock speed of the counted rate: frames really pass at ``rate * PULLDOWN`` per second"""
+
 	__slots__ = ()
 
 	@classmethod
@@ -26,6 +30,20 @@ class CountingMode(abc.ABC):
 		
 		raise ValueError("Timecode rate must be a positive integer")
 
+	@classmethod
+	def get_timebase(cls, rate:typing.Optional[int]=None) -> Timebase:
+		"""Get the shared `Timebase` for this mode at the given rate"""
+
+		try:
+			return Timebase._interned[(cls, rate)]
+		except (KeyError, TypeError):
+			return Timebase(cls, rate)
+	
+	@classmethod
+	def get_drop_offset(cls, rate:int) -> int:
+		"""Frame labels skipped at the start of each drop minute (none, unless a mode says otherwise)"""
+		return 0
+
 	@classmethod
 	def _santize_string(cls, timecode:str) -> str:
 		"""Remove any weirdness"""
@@ -35,8 +53,15 @@ class CountingMode(abc.ABC):
 		return timecode
 	
 	@classmethod
-	def _frame_number_from_string(cls, timecode:str, rate:int) -> int:
-		"""Validate and convert a timecode string to the NDF frame number it represents"""
+	def _frame_number_from_string(cls, timecode:str, rate:int, strict:bool=False) -> int:
+		"""Validate and convert a timecode string to the frame number it represents"""
+
+		sign, hours, minutes, seconds, frames = cls._components_from_string(timecode)
+		return cls._frame_number_from_components(hours, minutes, seconds, frames, rate, strict) * sign
+
+	@classmethod
+	def _components_from_string(cls, timecode:str) -> typing.Tuple[int, int, int, int, int]:
+		"""Validate and split a timecode string into its sign, hours, minutes, seconds and frames"""
 
 		sign = -1 if timecode.startswith("-") else 1
 
@@ -48,38 +73,177 @@ class CountingMode(abc.ABC):
 
 		# Split into elements
 		tc_elements = timecode.split(":")
-		multipliers = [1, rate, rate*60, rate*60*60]
 		
-		if len(tc_elements) > len(multipliers):
+		if len(tc_elements) > 4:
 			raise ValueError("Timecode is not in the expected format of hh:mm:ss:ff")
 		
-		frame_count = 0
-		
 		try:
-			for idx, tc_element in enumerate(tc_elements[::-1]):
-				frame_count += int(tc_element) * multipliers[idx]
+			# Pad out any missing leading elements (e.g. "30:00")
+			hours, minutes, seconds, frames = [0] * (4 - len(tc_elements)) + [int(x) for x in tc_elements]
 		except Exception:
 			raise ValueError("Timecode is not in the expected format of hh:mm:ss:ff")
 		
-		return frame_count * sign
+		return sign, hours, minutes, seconds, frames
+	
+	@classmethod
+	def is_valid_label(cls, hours:int, minutes:int, seconds:int, frames:int, rate:int) -> bool:
+		"""Whether a label exists in this counting mode (they all do, unless a mode says otherwise)"""
+		return True
+
+	@classmethod
+	def _frame_number_from_components(cls, hours:int, minutes:int, seconds:int, frames:int, rate:int, strict:bool=False) -> int:
+		"""Convert the (unsigned) elements of a timecode to the frame number it represents
+		
+		With ``strict``, labels which don't exist in this counting mode are rejected (see `is_valid_label()`).
+		"""
+		return ((hours * 60 + minutes) * 60 + seconds) * rate + frames
+	
+	@classmethod
+	def parse_many(cls, timecodes:typing.Iterable[str], rate:typing.Optional[int]=None, *, errors:typing.Optional[typing.List[typing.Tuple[int,str]]]=None, strict:bool=False) -> array.array:
+		"""Convert many timecode strings to an array of frame numbers in one pass
+		
+		Bad rows do not stop the parse.  If an ``errors`` list is provided, an ``(index, message)`` tuple is appended 
+		to it for each bad row and its frame number is set to ``0``.  Otherwise, a single ``ValueError`` listing the 
+		index of every bad row is raised once all rows have been checked.  With ``strict``, labels which don't exist in
+		this counting mode are bad rows too.
+		"""
+
+		rate = cls.validate_rate(rate)
+
+		# Fixed-width hh:mm:ss:ff strings take a fast path straight to the elements
+		fixed_width = 9 + len(str(rate))
+		separators = (":", cls.SEPARATOR)
+		from_components = cls._frame_number_from_components
+		from_string = cls._frame_number_from_string
+
+		frame_numbers = array.array("q")
+		bad_rows = []
+
+		for idx, timecode in enumerate(timecodes):
+			if isinstance(timecode, str) and len(timecode) == fixed_width and timecode[2] in separators and timecode[5] in separators and timecode[8] in separators and timecode[0] not in "+-":
+				try:
+					frame_numbers.append(from_components(int(timecode[0:2]), int(timecode[3:5]), int(timecode[6:8]), int(timecode[9:]), rate, strict))
+					continue
+				except ValueError:
+					pass	# Let the full parser sort it out and complain properly
+			
+			try:
+				if not isinstance(timecode, str):
+					raise ValueError(f"Expected a timecode string, got {type(timecode).__name__}")
+				frame_numbers.append(from_string(timecode, rate, strict))
+			except ValueError as e:
+				frame_numbers.append(0)
+				bad_rows.append((idx, str(e)))
+		
+		if bad_rows and errors is None:
+			preview = ", ".join(str(idx) for idx, _ in bad_rows[:10]) + (", ..." if len(bad_rows) > 10 else "")
+			raise ValueError(f"{len(bad_rows)} timecode(s) are not in the expected format of hh:mm:ss:ff (rows: {preview})")
+		elif errors is not None:
+			errors.extend(bad_rows)
+
+		return frame_numbers
 	
 	@classmethod
 	def _string_from_frame_number(cls, framenumber:int, rate:int) -> str:
 		"""Format the given frame number to as a timecode string"""
 
-		sign = '-' if framenumber < 0 else ''
+		sign, hours, minutes, seconds, frames = cls.components(framenumber, rate)
 		frame_fill = len(str(rate))
-
-		framenumber = abs(framenumber)
 		
 		tc_string = cls.SEPARATOR.join([
-			str(cls.hours(framenumber, rate)).zfill(2),
-			str(cls.minutes(framenumber, rate)).zfill(2),
-			str(cls.seconds(framenumber, rate)).zfill(2),
-			str(cls.frames(framenumber, rate)).zfill(frame_fill)
+			str(hours).zfill(2),
+			str(minutes).zfill(2),
+			str(seconds).zfill(2),
+			str(frames).zfill(frame_fill)
 		])
 
-		return sign + tc_string
+		return ('-' if sign < 0 else '') + tc_string
+	
+	@classmethod
+	def format_many(cls, frame_numbers:typing.Iterable[int], rate:typing.Optional[int]=None) -> typing.List[str]:
+		"""Format many frame numbers as timecode strings"""
+
+		rate = cls.validate_rate(rate)
+		to_string = cls._string_from_frame_number
+
+		return [to_string(x, rate) for x in frame_numbers]
+	
+	@classmethod
+	def iter_strings(cls, start:int, count:int, rate:typing.Optional[int]=None) -> typing.Iterator[str]:
+		"""Format ``count`` consecutive frame numbers from ``start`` as timecode strings
+
+		Rather than working out every label from scratch, the previous one is stepped on like an odometer, so long runs
+		cost about the same per frame however far in they are.
+		"""
+		return cls._iter_labels(start, count, cls.validate_rate(rate), str)
+
+	@classmethod
+	def iter_bytes(cls, start:int, count:int, rate:typing.Optional[int]=None) -> typing.Iterator[bytes]:
+		"""Format ``count`` consecutive frame numbers from ``start`` as ASCII timecode strings (see `iter_strings()`)"""
+		return cls._iter_labels(start, count, cls.validate_rate(rate), lambda label: label.encode("ascii"))
+
+	@classmethod
+	def _iter_labels(cls, start:int, count:int, rate:int, encode:typing.Callable[[str], typing.AnyStr]) -> typing.Iterator[typing.AnyStr]:
+
+		timebase = cls.get_timebase(rate)
+		end = start + count
+
+		# Negative timecodes count down towards zero, so those are just formatted the long way
+		to_string = cls._string_from_frame_number
+		for frame_number in range(start, min(end, 0)):
+			yield encode(to_string(frame_number, rate))
+
+		start = max(start, 0)
+		if start >= end:
+			return
+
+		sep = cls.SEPARATOR
+		drop_offset = timebase._drop_offset
+		frame_labels = [encode(sep + str(x).zfill(timebase._frame_digits)) for x in range(rate)]
+
+		_, hours, minutes, seconds, frames = cls.components(start, rate)
+		remaining = end - start
+
+		while remaining > 0:
+
+			# Everything but the frames only changes once a second
+			prefix = encode(f"{hours:02d}{sep}{minutes:02d}{sep}{seconds:02d}")
+			run = min(rate - frames, remaining)
+
+			for label in frame_labels[frames:frames + run]:
+				yield prefix + label
+
+			remaining -= run
+			frames = 0
+			seconds += 1
+
+			if seconds == 60:
+				seconds = 0
+				minutes += 1
+				if minutes == 60:
+					minutes = 0
+					hours += 1
+
+				# Skip the labels dropped at the start of the minute, if any
+				if minutes % 10:
+					frames = drop_offset
+
+	@classmethod
+	def components(cls, framenumber:int, rate:int) -> typing.Tuple[int, int, int, int, int]:
+		"""The sign (``1`` or ``-1``), hours, minutes, seconds and frames of a frame number, in one pass"""
+
+		# NOTE: Written without branching on the value so this also works elementwise on integer arrays (see `TimecodeArray`)
+		timebase = cls.get_timebase(rate)
+		sign = 1 - 2 * (framenumber < 0)
+		framenumber = abs(framenumber)
+
+		return (
+			sign,
+			framenumber // timebase._frames_per_hour,
+			framenumber // timebase._frames_per_minute % 60,
+			framenumber // rate % 60,
+			framenumber % rate
+		)
 
 	@classmethod
 	def hours(cls, framenumber:int, rate:int) -> int:
@@ -1,4 +1,4 @@
-import typing
+import fractions, typing
 from . import CountingMode
 
 class DropFrame(CountingMode):
@@ -19,6 +19,9 @@ class DropFrame(CountingMode):
 	DEFAULT_RATE = 30
 	"""DF timecodes are intended for multiples of 30"""
 
+	PULLDOWN = fractions.Fraction(1000, 1001)
+	"""DF counts 30 frames a second, but really runs at 29.97 (30000/1001)"""
+
 	SEPARATOR = ";"
 	"""The character expected and used for separation of elements"""
 
@@ -35,13 +38,68 @@ class DropFrame(CountingMode):
 		return rate
 	
 	@classmethod
-	def _frame_number_from_string(cls, timecode: str, rate: int) -> int:
+	def get_drop_offset(cls, rate:int) -> int:
+		"""Frame labels skipped at the start of each drop minute -- 2 per 30fps"""
+		return 2 * rate // 30
+
+	@classmethod
+	def is_valid_label(cls, hours:int, minutes:int, seconds:int, frames:int, rate:int) -> bool:
+		"""Whether a label exists in drop-frame, or is one of the labels skipped at the start of a drop minute"""
+		return not (seconds == 0 and frames < cls.get_timebase(rate)._drop_offset and minutes % 10)
+
+	@classmethod
+	def _frame_number_from_components(cls, hours:int, minutes:int, seconds:int, frames:int, rate:int, strict:bool=False) -> int:
+		"""Convert the (unsigned) elements of a timecode to the frame number it represents
+		
+		Labels which don't exist (e.g. ``00;01;00;00``) are rejected with ``strict``, or otherwise count as the next
+		label that does (``00;01;00;02``).
+		"""
+
+		drop_offset = cls.get_timebase(rate)._drop_offset
+
+		# Every minute drops its first labels, except every tenth minute -- the reverse of `get_dropped_frames()`
+		total_minutes = hours * 60 + minutes
+		dropped_frames = drop_offset * (total_minutes - total_minutes // 10)
+
+		if seconds == 0 and frames < drop_offset and minutes % 10:
+			if strict:
+				raise ValueError(f"Timecode {hours:02d};{minutes:02d};{seconds:02d};{frames:0{len(str(rate))}d} does not exist in drop-frame at {rate} fps")
+			frames = drop_offset
+
+		return ((total_minutes * 60) + seconds) * rate + frames - dropped_frames
+
+	@classmethod
+	def validate_many(cls, timecodes:typing.Iterable[str], rate:typing.Optional[int]=None) -> typing.List[typing.Tuple[int,str]]:
+		"""Find the labels in many drop-frame timecode strings which don't exist, returning ``(index, message)`` tuples
 		
-		# First get the base frame number without drops
-		frame_number = super()._frame_number_from_string(timecode, rate)
+		Only the seconds, frames and minutes digits are looked at for fixed-width strings, so this is much quicker
+		than parsing them all.  Strings which can't be parsed at all are reported too.
+		"""
+
+		rate = cls.validate_rate(rate)
+		drop_offset = cls.get_timebase(rate)._drop_offset
+		fixed_width = 9 + len(str(rate))
+		separators = (":", cls.SEPARATOR)
+
+		bad_rows = []
 
-		# TODO: return
-		return frame_number
+		for idx, timecode in enumerate(timecodes):
+
+			# Most well-formed labels can be ruled out on the seconds alone
+			if isinstance(timecode, str) and len(timecode) == fixed_width and timecode[2] in separators and timecode[5] in separators and timecode[8] in separators and (timecode[0:2] + timecode[3:5] + timecode[6:8] + timecode[9:]).isdecimal():
+				if timecode[6:8] != "00" or timecode[4] == "0" or int(timecode[9:]) >= drop_offset:
+					continue
+
+			try:
+				if not isinstance(timecode, str):
+					raise ValueError(f"Expected a timecode string, got {type(timecode).__name__}")
+				sign, hours, minutes, seconds, frames = cls._components_from_string(timecode)
+				if not cls.is_valid_label(hours, minutes, seconds, frames, rate):
+					raise ValueError(f"Timecode {timecode} does not exist in drop-frame at {rate} fps")
+			except ValueError as e:
+				bad_rows.append((idx, str(e)))
+
+		return bad_rows
 
 	@classmethod
 	def get_dropped_frames(cls, framenumber:int, rate:int) -> int:
@@ -59,29 +117,32 @@ class DropFrame(CountingMode):
 		# For every start segment (rate*61), add 2
 		# For every partial sgment, add 2
 		
-		multiplier = -1 if framenumber <  0 else 1
+		# NOTE: Written without branching on the value so this also works elementwise on integer arrays (see `TimecodeArray`)
+		multiplier = 1 - 2 * (framenumber < 0)
 		framenumber_normalized = abs(framenumber)
 		
 		# Drop-frame adds two frames every minute, except every ten minutes
-		# First: Let's get some things straight
-		drop_offset = (2 * rate // 30)			# Frames to drop -- 2 per 30fps
+		# First: Let's get some things straight (precomputed once per rate, see `Timebase`)
+		timebase = cls.get_timebase(rate)
+		drop_offset = timebase._drop_offset			# Frames to drop -- 2 per 30fps
 		
-		full_minute = rate * 60							# Length of a full non-drop minute (in frames) (60 seconds)
-		drop_minute = full_minute - drop_offset			# Length of a drop-minute (in frames)
-		drop_segment = full_minute + (drop_minute * 9)	# Length of a drop-segment (in frames) (One full minute + Nine drop minutes = 10 Minutes)
+		full_minute = timebase._frames_per_minute		# Length of a full non-drop minute (in frames) (60 seconds)
+		drop_minute = timebase._drop_minute				# Length of a drop-minute (in frames)
+		drop_segment = timebase._drop_segment			# Length of a drop-segment (in frames) (One full minute + Nine drop minutes = 10 Minutes)
 		
 		# So how many full 10-minute drop-segments have elapsed
 		drop_segments_elapsed = framenumber_normalized // drop_segment
 
 		# And as for the remaining frames at the end...
 		remaining_frames = framenumber_normalized % drop_segment
-		remaining_drop_frames = max(remaining_frames - full_minute + 1, 0)	# I don't understand why +1 yet, but that was a problem for like three days. max() will be bad for negative values
+		remaining_drop_frames = remaining_frames - full_minute + 1	# I don't understand why +1 yet, but that was a problem for like three days
+		remaining_drop_frames = remaining_drop_frames * (remaining_drop_frames > 0)	# Clamp to zero, like max(x, 0) but array-friendly
 		
 		# Number of complete drop-minutes
 		drop_minutes_elapsed = remaining_drop_frames // drop_minute
 
 		# And then any other frames will need a 2-frame boost! Oooh!
-		remainder = drop_offset if (remaining_drop_frames % drop_minute) else 0
+		remainder = drop_offset * (remaining_drop_frames % drop_minute != 0)
 
 
 		return ((drop_segments_elapsed * (9 * drop_offset)) + (drop_minutes_elapsed * drop_offset) + remainder) * multiplier
@@ -111,8 +172,11 @@ class DropFrame(CountingMode):
 		return super().frames(framenumber+dropped_frames, rate)
 	
 	@classmethod
-	def _string_from_frame_number(cls, framenumber: int, rate: int) -> str:
-		return super()._string_from_frame_number(framenumber, rate)  + f" ({cls.get_dropped_frames(framenumber, rate)})"
+	def components(cls, framenumber:int, rate:int) -> typing.Tuple[int, int, int, int, int]:
+		"""The sign (``1`` or ``-1``), hours, minutes, seconds and frames of a frame number, in one pass"""
+		# Dropped frames are only calculated the once here
+		dropped_frames = cls.get_dropped_frames(framenumber, rate)
+		return super().components(framenumber+dropped_frames, rate)
 
 	@classmethod
 	def __str__(cls):
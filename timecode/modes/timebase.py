@@ -0,0 +1,129 @@
+"""Contains the `Timebase` class, which pairs a frame counting mode with a rate"""
+
+import fractions, typing
+
+class Timebase:
+	"""An interned, immutable pairing of a `CountingMode` and a rate, with the constants they imply precomputed
+
+	There is only ever one `Timebase` for a given mode and rate, so they may be compared by identity:
+
+	>>> Timebase(DropFrame, 30) is Timebase(DropFrame(), 30)
+	True
+	"""
+
+	__slots__ = ("_mode", "_rate", "_frames_per_minute", "_frames_per_hour", "_frame_digits", "_drop_offset", "_drop_minute", "_drop_segment", "_real_rate")
+
+	_interned:typing.Dict[typing.Tuple[type, typing.Any], "Timebase"] = {}
+	"""Every `Timebase` created so far, keyed by `(mode class, rate)`"""
+
+	def __new__(cls, mode:typing.Union["CountingMode", typing.Type["CountingMode"]], rate:typing.Optional[int]=None):
+
+		mode_class = mode if isinstance(mode, type) else type(mode)
+
+		try:
+			return cls._interned[(mode_class, rate)]
+		except (KeyError, TypeError):
+			pass
+
+		from .abstract import CountingMode
+
+		if not issubclass(mode_class, CountingMode):
+			raise ValueError(f"Mode must be an instance of the `CountingMode` class")
+
+		# Validate the rate, then check again in case it was just a default or a different-but-equal value
+		validated_rate = mode_class.validate_rate(rate)
+		timebase = cls._interned.get((mode_class, validated_rate))
+
+		if timebase is None:
+			timebase = super().__new__(cls)
+			timebase._set_constants(mode_class, validated_rate)
+			timebase = cls._interned.setdefault((mode_class, validated_rate), timebase)
+
+		if rate is None:
+			cls._interned.setdefault((mode_class, rate), timebase)
+
+		return timebase
+
+	def _set_constants(self, mode_class:typing.Type["CountingMode"], rate:int):
+		"""Precompute everything there is to know about this timebase"""
+
+		setattr_ = super().__setattr__
+
+		setattr_("_mode", mode_class())
+		setattr_("_rate", rate)
+		setattr_("_frames_per_minute", rate * 60)
+		setattr_("_frames_per_hour", rate * 60 * 60)
+		setattr_("_frame_digits", len(str(rate)))
+		setattr_("_real_rate", rate * mode_class.PULLDOWN)
+
+		# Modes which don't drop frames just have zero-length drops
+		drop_offset = mode_class.get_drop_offset(rate)
+		setattr_("_drop_offset", drop_offset)
+		setattr_("_drop_minute", self._frames_per_minute - drop_offset)
+		setattr_("_drop_segment", self._frames_per_minute + (self._drop_minute * 9))
+
+	def __setattr__(self, name, value):
+		raise AttributeError(f"{self.__class__.__name__} objects are immutable")
+
+	def __reduce__(self):
+		# Unpickle through the interning
+		return (self.__class__, (type(self._mode), self._rate))
+
+	def __copy__(self) -> "Timebase":
+		return self
+
+	def __deepcopy__(self, memo) -> "Timebase":
+		return self
+
+	@property
+	def mode(self) -> "CountingMode":
+		"""The counting mode (a shared instance)"""
+		return self._mode
+
+	@property
+	def rate(self) -> int:
+		"""The rate (per second)"""
+		return self._rate
+
+	@property
+	def real_rate(self) -> fractions.Fraction:
+		"""Frames per second of wall-clock time, exactly (e.g. ``30000/1001`` for 30 DF)"""
+		return self._real_rate
+
+	@property
+	def frames_per_second(self) -> int:
+		"""Frames in one second"""
+		return self._rate
+
+	@property
+	def frames_per_minute(self) -> int:
+		"""Frames in one full (non-drop) minute"""
+		return self._frames_per_minute
+
+	@property
+	def frames_per_hour(self) -> int:
+		"""Frames in one full (non-drop) hour"""
+		return self._frames_per_hour
+
+	@property
+	def frame_digits(self) -> int:
+		"""The number of digits used to display the frames element"""
+		return self._frame_digits
+
+	@property
+	def drop_offset(self) -> int:
+		"""Frame labels skipped at the start of each drop minute (``0`` for modes which don't drop frames)"""
+		return self._drop_offset
+
+	@property
+	def drop_minute(self) -> int:
+		"""Frames in one drop minute"""
+		return self._drop_minute
+
+	@property
+	def drop_segment(self) -> int:
+		"""Frames in one ten-minute segment (one full minute + nine drop minutes)"""
+		return self._drop_segment
+
+	def __repr__(self) -> str:
+		return f"<{self.__class__.__name__} {self.rate} {self.mode}>"
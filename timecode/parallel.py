@@ -0,0 +1,131 @@
+"""Batch parsing, formatting and resampling spread across a pool of processes
+
+Large jobs are split into chunks, and each chunk is handled by a worker process.  Frame numbers travel between
+processes as packed 64-bit integer buffers rather than pickled `Timecode` objects, and results come back in their
+original order.
+
+>>> from timecode import parallel
+>>> from timecode.modes import DropFrame
+>>> frame_numbers = parallel.parse_many(timecodes, mode=DropFrame(), rate=60, workers=8)
+>>> timecodes = parallel.format_many(frame_numbers, mode=DropFrame(), rate=60, workers=8)
+
+Jobs which fit in a single chunk (or which are given ``workers=1``) are run in this process without a pool.  To
+avoid starting a new pool for every job, pass your own ``executor``.
+"""
+
+import array, concurrent.futures, fractions, functools, typing
+from . import Timecode, Resampler
+from .modes import CountingMode, Timebase
+
+DEFAULT_CHUNK_SIZE = 250_000
+"""Timecodes (or frame numbers) per chunk, if not provided"""
+
+FrameNumbers = typing.Union[array.array, typing.Sequence[int], typing.Any]
+
+# Worker functions
+# NOTE: These run in the worker processes, so they are given plain picklable arguments
+
+def _parse_chunk(mode_class:typing.Type[CountingMode], rate:int, timecodes:typing.List[str]) -> typing.Tuple[bytes, typing.List[typing.Tuple[int, str]]]:
+	errors = []
+	return mode_class.parse_many(timecodes, rate, errors=errors).tobytes(), errors
+
+def _format_chunk(mode_class:typing.Type[CountingMode], rate:int, buffer:bytes) -> str:
+	frame_numbers = array.array("q")
+	frame_numbers.frombytes(buffer)
+	return "\n".join(mode_class.format_many(frame_numbers, rate))
+
+def _resample_chunk(source:Timebase, target:Timebase, rounding:str, speed:fractions.Fraction, buffer:bytes) -> bytes:
+	frame_numbers = array.array("q")
+	frame_numbers.frombytes(buffer)
+	return Resampler.get(source, target, rounding, speed).resample_frames(frame_numbers).tobytes()
+
+# Helpers
+
+def _as_frame_array(frame_numbers:FrameNumbers) -> array.array:
+	"""Pack frame numbers (including NumPy arrays and `TimecodeArray`s) into an ``array('q')``"""
+
+	if isinstance(frame_numbers, array.array) and frame_numbers.typecode == "q":
+		return frame_numbers
+
+	frame_numbers = getattr(frame_numbers, "frame_numbers", frame_numbers)
+
+	packed = array.array("q")
+	if hasattr(frame_numbers, "astype"):
+		packed.frombytes(frame_numbers.astype("=i8").tobytes())
+	else:
+		packed.extend(frame_numbers)
+	return packed
+
+def _validate_chunk_size(chunk_size:int) -> int:
+	if not isinstance(chunk_size, int) or chunk_size < 1:
+		raise ValueError("Chunk size must be a positive integer")
+	return chunk_size
+
+def _run(func:typing.Callable, args:typing.Tuple, chunks:typing.List[typing.Any], workers:typing.Optional[int], executor:typing.Optional[concurrent.futures.Executor]) -> typing.List[typing.Any]:
+	"""Run `func(*args, chunk)` for each chunk, in a pool if it's worth it, keeping the results in order"""
+
+	if executor is None and (len(chunks) <= 1 or workers == 1):
+		return [func(*args, chunk) for chunk in chunks]
+
+	if executor is not None:
+		return list(executor.map(functools.partial(func, *args), chunks))
+
+	with concurrent.futures.ProcessPoolExecutor(max_workers=workers) as pool:
+		return list(pool.map(functools.partial(func, *args), chunks))
+
+# Public API
+
+def parse_many(timecodes:typing.Sequence[str], mode:typing.Optional[CountingMode]=None, rate:typing.Optional[int]=None, *, errors:typing.Optional[typing.List[typing.Tuple[int,str]]]=None, workers:typing.Optional[int]=None, chunk_size:int=DEFAULT_CHUNK_SIZE, executor:typing.Optional[concurrent.futures.Executor]=None) -> array.array:
+	"""Convert many timecode strings to an array of frame numbers across a pool of processes
+
+	Bad rows are handled as in `CountingMode.parse_many()`, with indexes into the full sequence.
+	"""
+
+	timebase = Timecode._normalize_mode(mode).get_timebase(rate)
+	chunk_size = _validate_chunk_size(chunk_size)
+
+	timecodes = timecodes if isinstance(timecodes, typing.Sequence) else list(timecodes)
+	chunks = [list(timecodes[idx:idx+chunk_size]) for idx in range(0, len(timecodes), chunk_size)]
+
+	frame_numbers = array.array("q")
+	bad_rows = []
+
+	for idx, (buffer, chunk_errors) in enumerate(_run(_parse_chunk, (type(timebase.mode), timebase.rate), chunks, workers, executor)):
+		frame_numbers.frombytes(buffer)
+		bad_rows.extend((row + idx * chunk_size, message) for row, message in chunk_errors)
+
+	if bad_rows and errors is None:
+		preview = ", ".join(str(idx) for idx, _ in bad_rows[:10]) + (", ..." if len(bad_rows) > 10 else "")
+		raise ValueError(f"{len(bad_rows)} timecode(s) are not in the expected format of hh:mm:ss:ff (rows: {preview})")
+	elif errors is not None:
+		errors.extend(bad_rows)
+
+	return frame_numbers
+
+def format_many(frame_numbers:FrameNumbers, mode:typing.Optional[CountingMode]=None, rate:typing.Optional[int]=None, *, workers:typing.Optional[int]=None, chunk_size:int=DEFAULT_CHUNK_SIZE, executor:typing.Optional[concurrent.futures.Executor]=None) -> typing.List[str]:
+	"""Format many frame numbers as timecode strings across a pool of processes"""
+
+	timebase = Timecode._normalize_mode(mode).get_timebase(rate)
+	chunk_size = _validate_chunk_size(chunk_size)
+
+	buffer = memoryview(_as_frame_array(frame_numbers))
+	chunks = [buffer[idx:idx+chunk_size].tobytes() for idx in range(0, len(buffer), chunk_size)]
+
+	timecodes = []
+	for chunk in _run(_format_chunk, (type(timebase.mode), timebase.rate), chunks, workers, executor):
+		if chunk:
+			timecodes.extend(chunk.split("\n"))
+	return timecodes
+
+def resample_many(frame_numbers:FrameNumbers, resampler:Resampler, *, workers:typing.Optional[int]=None, chunk_size:int=DEFAULT_CHUNK_SIZE, executor:typing.Optional[concurrent.futures.Executor]=None) -> array.array:
+	"""Convert many frame numbers to another timebase (see `Resampler`) across a pool of processes"""
+
+	chunk_size = _validate_chunk_size(chunk_size)
+
+	buffer = memoryview(_as_frame_array(frame_numbers))
+	chunks = [buffer[idx:idx+chunk_size].tobytes() for idx in range(0, len(buffer), chunk_size)]
+
+	resampled = array.array("q")
+	for chunk in _run(_resample_chunk, (resampler.source, resampler.target, resampler.rounding, resampler.speed), chunks, workers, executor):
+		resampled.frombytes(chunk)
+	return resampled
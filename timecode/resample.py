@@ -0,0 +1,188 @@
+"""Contains the `Resampler` class, which converts frame numbers between timebases using exact rational math
+
+>>> from timecode.modes import NonDropFrame
+>>> from timecode.resample import Resampler
+>>> to_30 = Resampler.get(NonDropFrame().get_timebase(24), NonDropFrame().get_timebase(30))
+>>> to_30.resample_frames(range(0, 10))
+array('q', [0, 1, 3, 4, 5, 6, 8, 9, 10, 11])
+"""
+
+import array, fractions, typing
+from .timecode import Timecode
+from .timecoderange import TimecodeRange
+from .modes import Timebase
+
+class Resampler:
+	"""Converts frame numbers from one timebase to another with a given rounding policy
+
+	The ratio between the two timebases is worked out once, as an exact fraction, so there is no floating-point drift
+	over long durations.  An optional ``speed`` factor plays the source faster (or slower) than real-time, as in a
+	24-to-25 PAL speed-up (``speed=Fraction(25, 24)``).
+	"""
+
+	ROUNDING_POLICIES = ("floor", "nearest", "ceil")
+	"""Supported rounding policies.  ``nearest`` rounds halves away from zero, so negative frames mirror positive ones."""
+
+	DEFAULT_ROUNDING = "nearest"
+	"""The rounding policy to use if not provided"""
+
+	MAX_CACHED = 256
+	"""The most shared resamplers to keep at once"""
+
+	_cache:typing.Dict[tuple, "Resampler"] = {}
+	"""Shared resamplers by (source, target, rounding), plus the speed if it isn't 1"""
+
+	__slots__ = ("_source", "_target", "_rounding", "_speed", "_numerator", "_denominator")
+
+	def __init__(self, source:Timebase, target:Timebase, rounding:str=DEFAULT_ROUNDING, speed:typing.Union[fractions.Fraction,int]=1):
+
+		if not isinstance(source, Timebase) or not isinstance(target, Timebase):
+			raise TypeError("Source and target must be `Timebase` objects")
+
+		if rounding not in self.ROUNDING_POLICIES:
+			raise ValueError(f"Rounding policy must be one of {', '.join(self.ROUNDING_POLICIES)} (got {rounding})")
+
+		speed = fractions.Fraction(speed)
+		if speed <= 0:
+			raise ValueError(f"Speed must be positive (got {speed})")
+
+		ratio = fractions.Fraction(target.rate, source.rate) / speed
+
+		self._source = source
+		self._target = target
+		self._rounding = rounding
+		self._speed = speed
+		self._numerator = ratio.numerator
+		self._denominator = ratio.denominator
+
+	@classmethod
+	def get(cls, source:Timebase, target:Timebase, rounding:str=DEFAULT_ROUNDING, speed:typing.Union[fractions.Fraction,int]=1) -> "Resampler":
+		"""Get a shared resampler for a pair of timebases"""
+
+		if speed == 1:
+			key = (source, target, rounding)
+		elif isinstance(speed, (int, fractions.Fraction)):
+			key = (source, target, rounding, speed)
+		else:
+			key = (source, target, rounding, fractions.Fraction(speed))
+
+		cache = cls._cache
+		try:
+			return cache[key]
+		except KeyError:
+			pass
+
+		resampler = cls(source, target, rounding, speed)
+
+		# Let go of the oldest, once there are too many speeds in play
+		if len(cache) >= cls.MAX_CACHED:
+			cache.pop(next(iter(cache), None), None)
+
+		return cache.setdefault(key, resampler)
+
+	@property
+	def source(self) -> Timebase:
+		"""The timebase to convert from"""
+		return self._source
+
+	@property
+	def target(self) -> Timebase:
+		"""The timebase to convert to"""
+		return self._target
+
+	@property
+	def rounding(self) -> str:
+		"""The rounding policy for frames which don't line up exactly"""
+		return self._rounding
+
+	@property
+	def speed(self) -> fractions.Fraction:
+		"""The speed change applied along the way"""
+		return self._speed
+
+	@property
+	def ratio(self) -> fractions.Fraction:
+		"""Target frames per source frame"""
+		return fractions.Fraction(self._numerator, self._denominator)
+
+	def resample_frame(self, frame_number:typing.Any) -> typing.Any:
+		"""Convert a frame number (or a NumPy array of them) to the target timebase"""
+
+		scaled = frame_number * self._numerator
+		denominator = self._denominator
+
+		if self._rounding == "floor":
+			return scaled // denominator
+		elif self._rounding == "ceil":
+			return -(-scaled // denominator)
+
+		# Round half away from zero, in a way that also works elementwise
+		sign = 1 - 2 * (scaled < 0)
+		return (abs(scaled) * 2 + denominator) // (denominator * 2) * sign
+
+	def resample_frames(self, frame_numbers:typing.Iterable[int]) -> typing.Union[array.array, typing.Any]:
+		"""Convert many frame numbers to the target timebase
+
+		NumPy arrays are converted in one vectorized operation and returned as NumPy arrays.  Anything else is returned
+		as an ``array('q')``.
+		"""
+
+		if hasattr(frame_numbers, "dtype"):
+			return self.resample_frame(frame_numbers)
+
+		# Whole frames line up exactly; skip the rounding
+		if self._denominator == 1:
+			numerator = self._numerator
+			return array.array("q", [x * numerator for x in frame_numbers])
+
+		resample_frame = self.resample_frame
+		return array.array("q", [resample_frame(x) for x in frame_numbers])
+
+	def _check_source(self, timebase:Timebase):
+		if timebase is not self._source:
+			raise ValueError(f"Expected a timecode at {self._source.rate} {self._source.mode} (got {timebase.rate} {timebase.mode})")
+
+	def resample_timecode(self, timecode:Timecode) -> Timecode:
+		"""Convert a `Timecode` to the target timebase"""
+
+		self._check_source(timecode.timebase)
+		return Timecode._from_validated(self.resample_frame(timecode.frame_number), self._target)
+
+	def resample_timecodes(self, timecodes:typing.Iterable[Timecode]) -> typing.List[Timecode]:
+		"""Convert many `Timecode`s to the target timebase"""
+
+		timecodes = list(timecodes)
+		for tc in timecodes:
+			self._check_source(tc.timebase)
+
+		from_validated = Timecode._from_validated
+		target = self._target
+		return [from_validated(x, target) for x in self.resample_frames(tc.frame_number for tc in timecodes)]
+
+	def resample_range(self, tc_range:TimecodeRange) -> TimecodeRange:
+		"""Convert a `TimecodeRange` to the target timebase
+
+		The start and end are each resampled, so ranges which were back-to-back stay back-to-back.
+		"""
+
+		self._check_source(tc_range.timebase)
+		start = self.resample_frame(tc_range._start)
+		end = self.resample_frame(tc_range._end)
+		return TimecodeRange._from_validated(start, end - start, self._target)
+
+	def resample_ranges(self, tc_ranges:typing.Iterable[TimecodeRange]) -> typing.List[TimecodeRange]:
+		"""Convert many `TimecodeRange`s to the target timebase"""
+
+		tc_ranges = list(tc_ranges)
+		for tc_range in tc_ranges:
+			self._check_source(tc_range.timebase)
+
+		bounds = self.resample_frames(x for r in tc_ranges for x in (r._start, r._end))
+
+		from_validated = TimecodeRange._from_validated
+		target = self._target
+		return [from_validated(start, end - start, target) for start, end in zip(bounds[0::2], bounds[1::2])]
+
+	def __repr__(self) -> str:
+		speed = f" x{self._speed}" if self._speed != 1 else ""
+		return f"<{self.__class__.__name__} {self._source.rate} {self._source.mode} -> {self._target.rate} {self._target.mode}{speed} ({self._rounding})>"
@@ -0,0 +1,235 @@
+"""Bulk encoding and decoding of SMPTE 12M linear (LTC) and vertical interval (VITC) timecode words
+
+Words are packed least-significant bit first, so bit ``n`` of a word lives in bit ``n % 8`` of byte ``n // 8``:
+
+* An LTC word is 80 bits in 10 bytes, ending with the sync word (``FC BF``)
+* A VITC word is 90 bits (nine groups of two sync bits and eight data bits, the last holding the CRC), padded out
+  to a 12-byte slot
+
+Both carry BCD hours, minutes, seconds and frames, the drop-frame flag, and 32 user bits (returned as an integer
+with user bit group 1 in the lowest nibble).  Only rates up to 30 fit in a timecode word.
+
+>>> from timecode import smpte
+>>> words = smpte.encode_ltc(range(108000), rate=30)    # One hour of 30fps LTC
+>>> decoded = smpte.decode_ltc(words, rate=30)
+>>> decoded.frame_numbers[-1]
+107999
+"""
+
+import array, struct, typing
+from . import Timecode
+from .modes import CountingMode, DropFrame, NonDropFrame, Timebase
+
+LTC_WORD_SIZE = 10
+"""Bytes per LTC word"""
+
+VITC_WORD_SIZE = 12
+"""Bytes per (padded) VITC word"""
+
+LTC_SYNC = b"\xfc\xbf"
+"""The LTC sync word, as it appears in the last two bytes"""
+
+MAX_RATE = 30
+"""The highest rate a timecode word can count"""
+
+_POPCOUNT = bytes(bin(x).count("1") for x in range(256))
+_LTC_WORDS = struct.Struct("<8s2s")
+
+class DecodedWords(typing.NamedTuple):
+	"""Frame numbers and user bits decoded from a buffer of timecode words"""
+
+	frame_numbers:array.array
+	"""The frame number of each word, as an ``array('q')``"""
+
+	user_bits:array.array
+	"""The 32 user bits of each word, as an ``array('L')``"""
+
+	timebase:Timebase
+	"""The counting mode and rate the frame numbers count in"""
+
+	def timecodes(self) -> typing.List[Timecode]:
+		"""The decoded words as `Timecode` objects"""
+		from_validated = Timecode._from_validated
+		return [from_validated(x, self.timebase) for x in self.frame_numbers]
+
+def _get_timebase(mode:typing.Optional[CountingMode], rate:typing.Optional[int]) -> Timebase:
+	timebase = Timecode._normalize_mode(mode).get_timebase(rate)
+	if timebase.rate > MAX_RATE:
+		raise ValueError(f"Timecode words can only count up to {MAX_RATE} frames per second (got {timebase.rate})")
+	return timebase
+
+def _iter_user_bits(user_bits:typing.Union[int, typing.Iterable[int]]) -> typing.Iterator[int]:
+	if isinstance(user_bits, int):
+		while True:
+			yield user_bits
+	yield from user_bits
+
+def _data_bytes(idx:int, frame_number:int, timebase:Timebase, drop_frame:int, user_bits:int) -> typing.List[int]:
+	"""The first 64 bits of a timecode word, as eight bytes"""
+
+	sign, hours, minutes, seconds, frames = timebase.mode.components(frame_number, timebase.rate)
+
+	if sign < 0 or hours > 23:
+		raise ValueError(f"Word {idx}: Frame number {frame_number} is outside of the 24-hour range of a timecode word")
+	if not 0 <= user_bits <= 0xFFFFFFFF:
+		raise ValueError(f"Word {idx}: User bits must fit in 32 bits")
+
+	return [
+		frames % 10          | (user_bits       & 0xF) << 4,
+		frames // 10         | drop_frame << 2 | (user_bits >> 4  & 0xF) << 4,
+		seconds % 10         | (user_bits >> 8  & 0xF) << 4,
+		seconds // 10        | (user_bits >> 12 & 0xF) << 4,
+		minutes % 10         | (user_bits >> 16 & 0xF) << 4,
+		minutes // 10        | (user_bits >> 20 & 0xF) << 4,
+		hours % 10           | (user_bits >> 24 & 0xF) << 4,
+		hours // 10          | (user_bits >> 28 & 0xF) << 4,
+	]
+
+def _decode_data_bytes(idx:int, data:typing.Sequence[int], rate:int) -> typing.Tuple[int, int, int, int, int, int]:
+	"""Unpack hours, minutes, seconds, frames, the drop-frame flag and user bits from the first 64 bits of a word"""
+
+	units = (data[0] & 0xF, data[2] & 0xF, data[4] & 0xF, data[6] & 0xF)
+	if max(units) > 9:
+		raise ValueError(f"Word {idx}: Not a valid BCD timecode")
+
+	frames  = units[0] + (data[1] & 0x3) * 10
+	seconds = units[1] + (data[3] & 0x7) * 10
+	minutes = units[2] + (data[5] & 0x7) * 10
+	hours   = units[3] + (data[7] & 0x3) * 10
+
+	if frames >= rate or seconds > 59 or minutes > 59 or hours > 23:
+		raise ValueError(f"Word {idx}: Timecode {hours:02d}:{minutes:02d}:{seconds:02d}:{frames:02d} is out of range at {rate} frames per second")
+
+	user_bits = 0
+	for shift, byte in enumerate(data[:8]):
+		user_bits |= (byte >> 4) << (shift * 4)
+
+	return hours, minutes, seconds, frames, data[1] >> 2 & 1, user_bits
+
+def _decode(words:typing.Iterable[typing.Sequence[int]], mode:typing.Optional[CountingMode], rate:typing.Optional[int]) -> DecodedWords:
+	"""Turn the data bytes of many words into frame numbers, taking the counting mode from the drop-frame flag if needed"""
+
+	timebase = None if mode is None else _get_timebase(mode, rate)
+
+	frame_numbers = array.array("q")
+	all_user_bits = array.array("L")
+
+	for idx, data in enumerate(words):
+
+		hours, minutes, seconds, frames, drop_frame, user_bits = _decode_data_bytes(idx, data, timebase.rate if timebase is not None else rate or MAX_RATE)
+
+		if timebase is None:
+			timebase = _get_timebase(DropFrame() if drop_frame else NonDropFrame(), rate if rate is not None else MAX_RATE)
+		elif mode is None and drop_frame != isinstance(timebase.mode, DropFrame):
+			raise ValueError(f"Word {idx}: Drop-frame flag changes part way through")
+
+		frame_numbers.append(timebase.mode._frame_number_from_components(hours, minutes, seconds, frames, timebase.rate))
+		all_user_bits.append(user_bits)
+
+	if timebase is None:
+		timebase = _get_timebase(mode, rate)
+
+	return DecodedWords(frame_numbers, all_user_bits, timebase)
+
+def _check_buffer(buffer:typing.Union[bytes, bytearray, memoryview], word_size:int) -> memoryview:
+	buffer = memoryview(buffer).cast("B")
+	if len(buffer) % word_size:
+		raise ValueError(f"Buffer length ({len(buffer)}) is not a multiple of the {word_size}-byte word size")
+	return buffer
+
+# LTC
+
+def encode_ltc(frame_numbers:typing.Iterable[int], mode:typing.Optional[CountingMode]=None, rate:typing.Optional[int]=None, *, user_bits:typing.Union[int, typing.Iterable[int]]=0) -> bytes:
+	"""Encode many frame numbers as packed 80-bit LTC words
+
+	``user_bits`` is either one value for every word, or an iterable with a value per word.  The biphase polarity
+	correction bit is set on each word.
+	"""
+
+	timebase = _get_timebase(mode, rate)
+	drop_frame = int(isinstance(timebase.mode, DropFrame))
+	polarity_byte = 7 if timebase.rate == 25 else 3	# Bit 59 at 25fps, bit 27 otherwise
+	sync_ones = sum(_POPCOUNT[x] for x in LTC_SYNC)
+
+	words = bytearray()
+
+	for idx, (frame_number, word_user_bits) in enumerate(zip(frame_numbers, _iter_user_bits(user_bits))):
+
+		data = _data_bytes(idx, frame_number, timebase, drop_frame, word_user_bits)
+
+		# Make the number of ones (and so zeros) in the word even, including the sync word's
+		if (sum(_POPCOUNT[x] for x in data) + sync_ones) % 2:
+			data[polarity_byte] |= 0x8
+
+		words += bytes(data)
+		words += LTC_SYNC
+
+	return bytes(words)
+
+def decode_ltc(buffer:typing.Union[bytes, bytearray, memoryview], mode:typing.Optional[CountingMode]=None, rate:typing.Optional[int]=None) -> DecodedWords:
+	"""Decode a buffer of packed 80-bit LTC words
+
+	Unless a ``mode`` is given, it is taken from the drop-frame flag of the first word, and must not change from word
+	to word.  In that case the ``rate`` defaults to 30; otherwise it defaults to the mode's default rate.
+	"""
+
+	buffer = _check_buffer(buffer, LTC_WORD_SIZE)
+
+	def words() -> typing.Iterator[bytes]:
+		for idx, (data, sync) in enumerate(_LTC_WORDS.iter_unpack(buffer)):
+			if sync != LTC_SYNC:
+				raise ValueError(f"Word {idx}: Missing LTC sync word")
+			yield data
+
+	return _decode(words(), mode, rate)
+
+# VITC
+
+def _vitc_crc(bits:int) -> int:
+	"""The CRC (x^8 + 1) of the first 82 bits of a VITC word, for bits 82-89"""
+
+	checksum = 0
+	for shift in range(0, 82, 8):
+		checksum ^= bits >> shift & 0xFF
+
+	# CRC bit n sits at bit 82 + n, which lines up with bit (n + 2) % 8 of the checksum
+	return (checksum >> 2 | checksum << 6) & 0xFF
+
+def encode_vitc(frame_numbers:typing.Iterable[int], mode:typing.Optional[CountingMode]=None, rate:typing.Optional[int]=None, *, user_bits:typing.Union[int, typing.Iterable[int]]=0) -> bytes:
+	"""Encode many frame numbers as 90-bit VITC words, each padded to a 12-byte slot (see `encode_ltc()`)"""
+
+	timebase = _get_timebase(mode, rate)
+	drop_frame = int(isinstance(timebase.mode, DropFrame))
+
+	words = bytearray()
+
+	for idx, (frame_number, word_user_bits) in enumerate(zip(frame_numbers, _iter_user_bits(user_bits))):
+
+		bits = 0
+		for group, byte in enumerate(_data_bytes(idx, frame_number, timebase, drop_frame, word_user_bits)):
+			bits |= (0b01 | byte << 2) << (group * 10)
+		bits |= 0b01 << 80
+
+		bits |= _vitc_crc(bits) << 82
+		words += bits.to_bytes(VITC_WORD_SIZE, "little")
+
+	return bytes(words)
+
+def decode_vitc(buffer:typing.Union[bytes, bytearray, memoryview], mode:typing.Optional[CountingMode]=None, rate:typing.Optional[int]=None) -> DecodedWords:
+	"""Decode a buffer of 90-bit VITC words in 12-byte slots, checking the sync bits and CRC (see `decode_ltc()`)"""
+
+	buffer = _check_buffer(buffer, VITC_WORD_SIZE)
+
+	def words() -> typing.Iterator[typing.List[int]]:
+		for idx, offset in enumerate(range(0, len(buffer), VITC_WORD_SIZE)):
+
+			bits = int.from_bytes(buffer[offset:offset + VITC_WORD_SIZE], "little")
+
+			if any(bits >> (group * 10) & 0b11 != 0b01 for group in range(9)):
+				raise ValueError(f"Word {idx}: Missing VITC sync bits")
+			if bits >> 82 & 0xFF != _vitc_crc(bits & ((1 << 82) - 1)):
+				raise ValueError(f"Word {idx}: VITC CRC mismatch")
+
+			yield [bits >> (group * 10 + 2) & 0xFF for group in range(8)]
+
+	return _decode(words(), mode, rate)
@@ -0,0 +1,318 @@
+"""A compact binary file format for large collections of timecodes or timecode ranges, with a memory-mapped reader
+
+Files are a 64-byte header followed by packed little-endian 64-bit frame numbers, so they can be read back without
+parsing anything at all:
+
+==========  ======  ============================================================================
+Offset      Bytes   Field
+==========  ======  ============================================================================
+0           8       Magic: ``b"TCSTORE\\0"``
+8           2       Format version (unsigned, currently ``1``)
+10          1       Kind: ``1`` for timecodes, ``2`` for timecode ranges
+11          1       Reserved (zero)
+12          4       Rate (unsigned)
+16          8       Number of records (unsigned)
+24          32      Counting mode class name (ASCII, null-padded), e.g. ``DropFrame``
+56          8       Reserved (zero)
+64          ...     Records: one int64 frame number per timecode, or an int64 ``(start, duration)`` pair per range
+==========  ======  ============================================================================
+
+>>> from timecode import store
+>>> store.write_timecodes("frames.tcs", timecodes)
+>>> with store.TimecodeStore("frames.tcs") as frames:
+...     frames.frame_numbers[1000]    # Straight from the mapped file
+...     frames[1000]                  # As a `Timecode`, built on demand
+"""
+
+import array, mmap, os, struct, sys, typing
+from . import Timecode, TimecodeRange
+from .modes import CountingMode, Timebase
+
+MAGIC = b"TCSTORE\0"
+VERSION = 1
+
+KIND_TIMECODES = 1
+KIND_RANGES = 2
+
+HEADER = struct.Struct("<8sHBxIQ32s8x")
+"""The file header (see above)"""
+
+WRITE_CHUNK_SIZE = 1 << 16
+"""Frame numbers to buffer between writes"""
+
+def _mode_class_named(name:str) -> typing.Type[CountingMode]:
+	"""Find a counting mode class by name"""
+
+	pending = [CountingMode]
+	while pending:
+		mode_class = pending.pop()
+		if mode_class.__name__ == name:
+			return mode_class
+		pending.extend(mode_class.__subclasses__())
+
+	raise ValueError(f"Unknown counting mode {name!r}")
+
+class StoreWriter:
+	"""Writes timecodes or ranges to a store file as they come, without holding them all in memory
+
+	The record count in the header is filled in when the writer is closed.
+	"""
+
+	__slots__ = ("_file", "_kind", "_timebase", "_count", "_pending")
+
+	def __init__(self, path:typing.Union[str, os.PathLike], kind:int, timebase:Timebase):
+
+		if kind not in (KIND_TIMECODES, KIND_RANGES):
+			raise ValueError(f"Kind must be KIND_TIMECODES or KIND_RANGES (got {kind})")
+
+		if len(type(timebase.mode).__name__) > 32:
+			raise ValueError("Counting mode class names must be 32 characters or fewer to be stored")
+
+		self._file = open(path, "wb")
+		self._kind = kind
+		self._timebase = timebase
+		self._count = 0
+		self._pending = array.array("q")
+
+		self._write_header()
+
+	def _write_header(self):
+		self._file.seek(0)
+		self._file.write(HEADER.pack(MAGIC, VERSION, self._kind, self._timebase.rate, self._count, type(self._timebase.mode).__name__.encode("ascii")))
+
+	def _flush(self):
+		if sys.byteorder == "big":
+			self._pending.byteswap()
+		self._file.write(self._pending.tobytes())
+		del self._pending[:]
+
+	def append(self, item:typing.Union[Timecode, TimecodeRange, int]):
+		"""Add a `Timecode` (or frame number) or a `TimecodeRange`, depending on the kind of store"""
+
+		if isinstance(item, (Timecode, TimecodeRange)) and item.timebase is not self._timebase:
+			raise ValueError(f"Expected {self._timebase.rate} {self._timebase.mode} (got {item.timebase.rate} {item.timebase.mode})")
+
+		if self._kind == KIND_RANGES:
+			if not isinstance(item, TimecodeRange):
+				raise TypeError(f"Expected a TimecodeRange (got {item.__class__.__name__})")
+			self._pending.append(item._start)
+			self._pending.append(item._end - item._start)
+		else:
+			self._pending.append(int(item))
+
+		self._count += 1
+		if len(self._pending) >= WRITE_CHUNK_SIZE:
+			self._flush()
+
+	def extend(self, items:typing.Iterable[typing.Union[Timecode, TimecodeRange, int]]):
+		"""Add many timecodes (or frame numbers) or ranges"""
+
+		# Packed frame numbers go straight through
+		if self._kind == KIND_TIMECODES and isinstance(items, array.array) and items.typecode == "q":
+			self._flush()
+			self._pending.extend(items)
+			self._count += len(items)
+			self._flush()
+			return
+
+		append = self.append
+		for item in items:
+			append(item)
+
+	def close(self):
+		"""Write any remaining records and the final count, and close the file"""
+
+		if self._file.closed:
+			return
+
+		self._flush()
+		self._write_header()
+		self._file.close()
+
+	def __enter__(self) -> "StoreWriter":
+		return self
+
+	def __exit__(self, exc_type, exc_value, traceback):
+		self.close()
+
+def write_timecodes(path:typing.Union[str, os.PathLike], timecodes:typing.Iterable[typing.Union[Timecode, int]], mode:typing.Optional[CountingMode]=None, rate:typing.Optional[int]=None) -> int:
+	"""Write timecodes to a store file, returning how many were written
+
+	Frame numbers (including an ``array('q')`` or a `TimecodeArray`) are written with the given ``mode`` and
+	``rate``.  `Timecode` objects must all share one timebase, which is used if no ``mode`` or ``rate`` is given.
+	"""
+
+	# A TimecodeArray knows its own timebase, and NumPy can hand over its buffer directly
+	if hasattr(timecodes, "frame_numbers") and hasattr(timecodes, "timebase"):
+		if mode is None and rate is None:
+			mode, rate = timecodes.mode, timecodes.rate
+		frame_numbers = array.array("q")
+		frame_numbers.frombytes(timecodes.frame_numbers.astype("=i8").tobytes())
+		timecodes = frame_numbers
+
+	elif mode is None and rate is None and not isinstance(timecodes, array.array):
+		timecodes = iter(timecodes)
+		first = next(timecodes, None)
+		if isinstance(first, Timecode):
+			mode, rate = first.mode, first.rate
+		timecodes = (x for items in ([first] if first is not None else [], timecodes) for x in items)
+
+	timebase = Timecode._normalize_mode(mode).get_timebase(rate)
+
+	with StoreWriter(path, KIND_TIMECODES, timebase) as writer:
+		writer.extend(timecodes)
+		return writer._count
+
+def write_ranges(path:typing.Union[str, os.PathLike], ranges:typing.Iterable[TimecodeRange]) -> int:
+	"""Write timecode ranges (which must share one timebase) to a store file, returning how many were written"""
+
+	ranges = iter(ranges)
+	first = next(ranges, None)
+	timebase = first.timebase if first is not None else Timecode.DEFAULT_MODE.get_timebase()
+
+	with StoreWriter(path, KIND_RANGES, timebase) as writer:
+		if first is not None:
+			writer.append(first)
+		writer.extend(ranges)
+		return writer._count
+
+class TimecodeStore:
+	"""A read-only, memory-mapped store file
+
+	Frame numbers are exposed as zero-copy ``memoryview``s of the file.  `Timecode` or `TimecodeRange` objects are
+	only built when they are asked for.  Release any views before closing the store.
+	"""
+
+	__slots__ = ("_file", "_mmap", "_kind", "_timebase", "_count", "_records")
+
+	def __init__(self, path:typing.Union[str, os.PathLike]):
+
+		self._file = open(path, "rb")
+		self._mmap = None
+
+		try:
+			self._read(path)
+		except Exception:
+			self.close()
+			raise
+
+	def _read(self, path:typing.Union[str, os.PathLike]):
+
+		header = self._file.read(HEADER.size)
+		if len(header) < HEADER.size:
+			raise ValueError(f"{path} is too short to be a timecode store")
+
+		magic, version, kind, rate, count, mode_name = HEADER.unpack(header)
+
+		if magic != MAGIC:
+			raise ValueError(f"{path} is not a timecode store")
+		elif version != VERSION:
+			raise ValueError(f"{path} is timecode store version {version}, but only version {VERSION} is supported")
+		elif kind not in (KIND_TIMECODES, KIND_RANGES):
+			raise ValueError(f"{path} has an unknown kind of record ({kind})")
+
+		record_size = 16 if kind == KIND_RANGES else 8
+		if os.fstat(self._file.fileno()).st_size < HEADER.size + count * record_size:
+			raise ValueError(f"{path} is truncated (expected {count} records)")
+
+		self._kind = kind
+		self._count = count
+		self._timebase = _mode_class_named(mode_name.rstrip(b"\0").decode("ascii")).get_timebase(rate)
+
+		if count == 0:
+			self._records = memoryview(array.array("q"))
+			return
+
+		self._mmap = mmap.mmap(self._file.fileno(), HEADER.size + count * record_size, access=mmap.ACCESS_READ)
+		with memoryview(self._mmap) as view, view[HEADER.size:HEADER.size + count * record_size] as records:
+
+			if sys.byteorder == "little":
+				self._records = records.cast("q")
+			else:
+				# No zero-copy on big-endian machines, unfortunately
+				swapped = array.array("q")
+				swapped.frombytes(records)
+				swapped.byteswap()
+				self._records = memoryview(swapped)
+
+	@property
+	def kind(self) -> int:
+		"""`KIND_TIMECODES` or `KIND_RANGES`"""
+		return self._kind
+
+	@property
+	def timebase(self) -> Timebase:
+		"""The (shared) counting mode and rate of everything in this store"""
+		return self._timebase
+
+	@property
+	def rate(self) -> int:
+		return self._timebase.rate
+
+	@property
+	def mode(self) -> CountingMode:
+		return self._timebase.mode
+
+	@property
+	def frame_numbers(self) -> memoryview:
+		"""Every stored frame number (for ranges: start, duration, start, duration...), without copying"""
+		return self._records
+
+	@property
+	def starts(self) -> memoryview:
+		"""The start frame of each range, without copying"""
+		self._check_kind(KIND_RANGES)
+		return self._records[0::2]
+
+	@property
+	def durations(self) -> memoryview:
+		"""The duration of each range, without copying"""
+		self._check_kind(KIND_RANGES)
+		return self._records[1::2]
+
+	def _check_kind(self, kind:int):
+		if self._kind != kind:
+			raise TypeError(f"This store holds {'ranges' if self._kind == KIND_RANGES else 'timecodes'}")
+
+	def __len__(self) -> int:
+		return self._count
+
+	def __getitem__(self, key:typing.Union[int, slice]) -> typing.Union[Timecode, TimecodeRange, typing.List[typing.Union[Timecode, TimecodeRange]]]:
+
+		if isinstance(key, slice):
+			return [self._make(idx) for idx in range(*key.indices(self._count))]
+
+		if key < 0:
+			key += self._count
+		if not 0 <= key < self._count:
+			raise IndexError(f"{self.__class__.__name__} index out of range")
+
+		return self._make(key)
+
+	def _make(self, idx:int) -> typing.Union[Timecode, TimecodeRange]:
+		if self._kind == KIND_RANGES:
+			return TimecodeRange._from_validated(self._records[idx*2], self._records[idx*2+1], self._timebase)
+		return Timecode._from_validated(self._records[idx], self._timebase)
+
+	def __iter__(self) -> typing.Iterator[typing.Union[Timecode, TimecodeRange]]:
+		return (self._make(idx) for idx in range(self._count))
+
+	def close(self):
+		"""Unmap and close the file"""
+
+		if getattr(self, "_records", None) is not None:
+			self._records.release()
+		if self._mmap is not None:
+			self._mmap.close()
+			self._mmap = None
+		self._file.close()
+
+	def __enter__(self) -> "TimecodeStore":
+		return self
+
+	def __exit__(self, exc_type, exc_value, traceback):
+		self.close()
+
+	def __repr__(self) -> str:
+		kind = "ranges" if self._kind == KIND_RANGES else "timecodes"
+		return f"<{self.__class__.__name__} {self._count} {kind} @ {self.rate} {self.mode}>"
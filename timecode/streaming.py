@@ -0,0 +1,182 @@
+"""Asyncio adapters which convert a live feed of timecodes in micro-batches
+
+Each adapter takes an async iterable of raw timecode strings (or ``bytes`` lines, or frame numbers) and yields lists
+of converted values, so that the event loop handles a batch at a time rather than an item at a time.  A reader task
+pulls from the feed into a bounded queue, which applies backpressure to the feed when conversion falls behind.
+
+>>> import asyncio
+>>> from timecode.streaming import stream_timecodes
+>>> async def follow(reader: asyncio.StreamReader):
+...     async for timecodes in stream_timecodes(reader, rate=30):
+...         for tc in timecodes:
+...             print(repr(tc))
+
+Batches are yielded when they are full, or once ``timeout`` seconds have passed since their first item arrived,
+whichever is sooner.  Blank lines are ignored.
+"""
+
+import array, asyncio, concurrent.futures, functools, typing
+from . import Timecode
+from .modes import CountingMode, Timebase
+
+DEFAULT_BATCH_SIZE = 256
+"""Items per batch, at most"""
+
+DEFAULT_TIMEOUT = 0.05
+"""Seconds to wait for a batch to fill up before yielding what's there"""
+
+DEFAULT_MAX_PENDING = 4
+"""Batches' worth of items to buffer from the feed before it has to wait"""
+
+ON_ERROR_POLICIES = ("raise", "skip")
+"""What to do with items that can't be parsed: raise a ``ValueError``, or leave them out of the batch"""
+
+RawTimecode = typing.Union[str, bytes, int]
+
+class _Failure(typing.NamedTuple):
+	"""Carries an exception from the reader task to the consumer"""
+	exception:BaseException
+
+_END = object()
+"""Marks the end of the feed"""
+
+async def batches(source:typing.AsyncIterable[typing.Any], *, batch_size:int=DEFAULT_BATCH_SIZE, timeout:float=DEFAULT_TIMEOUT, max_pending:int=DEFAULT_MAX_PENDING) -> typing.AsyncIterator[typing.List[typing.Any]]:
+	"""Group the items from an async iterable into lists of up to `batch_size` items"""
+
+	if not isinstance(batch_size, int) or batch_size < 1:
+		raise ValueError("Batch size must be a positive integer")
+
+	if not isinstance(max_pending, int) or max_pending < 1:
+		raise ValueError("Max pending must be a positive integer")
+
+	loop = asyncio.get_running_loop()
+	queue = asyncio.Queue(maxsize=batch_size * max_pending)
+
+	async def read():
+		try:
+			async for item in source:
+				await queue.put(item)
+		except Exception as e:
+			await queue.put(_Failure(e))
+		else:
+			await queue.put(_END)
+
+	reader = asyncio.ensure_future(read())
+	error = None
+
+	try:
+		while error is None:
+
+			batch = []
+			item = await queue.get()
+			deadline = loop.time() + timeout
+
+			while True:
+				if item is _END:
+					error = StopAsyncIteration()
+					break
+				elif isinstance(item, _Failure):
+					error = item.exception
+					break
+
+				batch.append(item)
+				if len(batch) >= batch_size:
+					break
+
+				try:
+					item = queue.get_nowait()
+				except asyncio.QueueEmpty:
+					remaining = deadline - loop.time()
+					if remaining <= 0:
+						break
+					try:
+						item = await asyncio.wait_for(queue.get(), remaining)
+					except asyncio.TimeoutError:
+						break
+
+			# Anything that made it in before the feed ended (or failed) still gets through
+			if batch:
+				yield batch
+
+		if not isinstance(error, StopAsyncIteration):
+			raise error
+
+	finally:
+		reader.cancel()
+
+def _normalize_item(item:RawTimecode) -> typing.Union[str, int]:
+	if isinstance(item, int):
+		return item
+	elif isinstance(item, (bytes, bytearray)):
+		return item.decode("ascii", errors="replace").strip()
+	return str(item).strip()
+
+def _frame_numbers_from_batch(batch:typing.List[RawTimecode], timebase:Timebase, on_error:str) -> array.array:
+	"""Convert a batch of raw timecodes to frame numbers"""
+
+	items = [x for x in map(_normalize_item, batch) if x != ""]
+	strings = [x for x in items if not isinstance(x, int)]
+
+	errors = []
+	parsed = iter(timebase.mode.parse_many(strings, timebase.rate, errors=errors))
+
+	if errors and on_error == "raise":
+		idx, message = errors[0]
+		raise ValueError(f"{message} (got {strings[idx]!r})")
+
+	bad_rows = {idx for idx, _ in errors}
+	frame_numbers = array.array("q")
+	string_idx = 0
+
+	for item in items:
+		if isinstance(item, int):
+			frame_numbers.append(item)
+			continue
+		frame_number = next(parsed)
+		if string_idx not in bad_rows:
+			frame_numbers.append(frame_number)
+		string_idx += 1
+
+	return frame_numbers
+
+def _strings_from_batch(batch:typing.List[RawTimecode], timebase:Timebase, on_error:str) -> typing.List[str]:
+	return timebase.mode.format_many(_frame_numbers_from_batch(batch, timebase, on_error), timebase.rate)
+
+async def _convert(source:typing.AsyncIterable[RawTimecode], convert:typing.Callable, mode:typing.Optional[CountingMode], rate:typing.Optional[int], on_error:str, executor:typing.Optional[concurrent.futures.Executor], batch_options:typing.Dict[str, typing.Any]) -> typing.AsyncIterator[typing.Any]:
+
+	if on_error not in ON_ERROR_POLICIES:
+		raise ValueError(f"On error must be one of {', '.join(ON_ERROR_POLICIES)} (got {on_error})")
+
+	timebase = Timecode._normalize_mode(mode).get_timebase(rate)
+	loop = asyncio.get_running_loop()
+
+	async for batch in batches(source, **batch_options):
+		if executor is None:
+			yield convert(batch, timebase, on_error)
+		else:
+			yield await loop.run_in_executor(executor, functools.partial(convert, batch, timebase, on_error))
+
+async def stream_frame_numbers(source:typing.AsyncIterable[RawTimecode], mode:typing.Optional[CountingMode]=None, rate:typing.Optional[int]=None, *, on_error:str="raise", executor:typing.Optional[concurrent.futures.Executor]=None, **batch_options) -> typing.AsyncIterator[array.array]:
+	"""Convert a feed of raw timecodes to batches of frame numbers
+
+	If an ``executor`` is given, each batch is converted there instead of on the event loop.  Any other keyword
+	arguments are passed along to `batches()`.
+	"""
+
+	async for frame_numbers in _convert(source, _frame_numbers_from_batch, mode, rate, on_error, executor, batch_options):
+		yield frame_numbers
+
+async def stream_timecodes(source:typing.AsyncIterable[RawTimecode], mode:typing.Optional[CountingMode]=None, rate:typing.Optional[int]=None, *, on_error:str="raise", executor:typing.Optional[concurrent.futures.Executor]=None, **batch_options) -> typing.AsyncIterator[typing.List[Timecode]]:
+	"""Convert a feed of raw timecodes to batches of `Timecode` objects (see `stream_frame_numbers()`)"""
+
+	timebase = Timecode._normalize_mode(mode).get_timebase(rate)
+	from_validated = Timecode._from_validated
+
+	async for frame_numbers in _convert(source, _frame_numbers_from_batch, timebase.mode, timebase.rate, on_error, executor, batch_options):
+		yield [from_validated(x, timebase) for x in frame_numbers]
+
+async def stream_strings(source:typing.AsyncIterable[RawTimecode], mode:typing.Optional[CountingMode]=None, rate:typing.Optional[int]=None, *, on_error:str="raise", executor:typing.Optional[concurrent.futures.Executor]=None, **batch_options) -> typing.AsyncIterator[typing.List[str]]:
+	"""Convert a feed of raw timecodes to batches of normalized timecode strings (see `stream_frame_numbers()`)"""
+
+	async for timecodes in _convert(source, _strings_from_batch, mode, rate, on_error, executor, batch_options):
+		yield timecodes
@@ -1,7 +1,8 @@
 """Contains the `Timecode` class, which represents a single frame in the context of a given frame rate"""
 
-import typing
-from .modes import CountingMode, NonDropFrame
+import fractions, numbers, typing
+from .modes import CountingMode, NonDropFrame, Timebase
+from . import cache
 
 class Timecode:
 	"""Timecode representing a given frame number and rate"""
@@ -9,24 +10,46 @@ class Timecode:
 	DEFAULT_MODE = NonDropFrame
 	"""The default frame counting mode class to use if not provided"""
 
-	__slots__ = ("_mode", "_rate", "_frame_number")
+	__slots__ = ("_timebase", "_frame_number")
 
-	def __init__(self, timecode:typing.Union[str,int, "Timecode"], mode:typing.Optional[CountingMode]=None, rate:typing.Optional[int]=None):
+	def __init__(self, timecode:typing.Union[str,int, "Timecode"], mode:typing.Optional[CountingMode]=None, rate:typing.Optional[int]=None, *, strict:bool=False):
 
 		# If a timecode object is provided, make a copy of it
 		if isinstance(timecode, self.__class__):
-			if mode is not None and timecode.mode is type(mode):
+			if mode is not None and type(timecode.mode) is not type(mode):
 				raise ValueError(f"The mode provided ({mode}) does not match the mode of the timecode object passed ({timecode.mode}).  Use Timecode.resample() to change the mode of an existing Timecode object.")
 			elif rate is not None and timecode.rate != rate:
 				raise ValueError(f"The rate provided ({rate}) does not match the rate of the timecode object passed ({timecode.rate}).  Use Timecode.resample() to change the rate of an existing Timecode object.")
-			mode = timecode.mode
-			rate = timecode.rate
-			timecode = timecode.frame_number
+			self._timebase = timecode._timebase
+			self._frame_number = timecode.frame_number
+			return
 
 		# Create a new timecode object from raw parameters
-		self._mode = self._normalize_mode(mode)
-		self._rate = self._mode.validate_rate(rate)
-		self._frame_number = self._mode._frame_number_from_string(str(timecode), self._rate)
+		# NOTE: The rate is validated by the mode when its `Timebase` is first created
+		self._timebase = self._normalize_mode(mode).get_timebase(rate)
+
+		# Frame numbers are already frame numbers; no need to round-trip them through a string
+		if isinstance(timecode, bool):
+			raise ValueError(f"Timecode must be a frame number or a timecode string (got {timecode})")
+		elif isinstance(timecode, int):
+			if timecode < 0 and not self._timebase.mode.ALLOW_NEGATIVE_TIMECODE:
+				raise ValueError("Negative timecodes are not allowed by this frame counting mode")
+			self._frame_number = int(timecode)
+		else:
+			# With `strict`, labels which don't exist in the counting mode (e.g. dropped DF labels) are rejected
+			self._frame_number = cache.frame_number_from_string(str(timecode), self._timebase, strict)
+	
+	@classmethod
+	def _from_validated(cls, frame_number:int, timebase:Timebase) -> "Timecode":
+		"""Create a timecode from an already-validated frame number and timebase, skipping `__init__`
+		
+		For internal use where the inputs are known to be good (arithmetic, iteration, etc).
+		"""
+
+		timecode = cls.__new__(cls)
+		timecode._timebase = timebase
+		timecode._frame_number = frame_number
+		return timecode
 	
 	@classmethod
 	def _normalize_mode(cls, mode:CountingMode) -> CountingMode:
@@ -40,19 +63,68 @@ class Timecode:
 
 		raise ValueError(f"Mode must be an instance of the `CountingMode` class")
 	
-	def resample(self, *, mode:typing.Optional[CountingMode]=None, rate:typing.Optional[int]=None):
-		"""Create a new timecode object resampled to a new rate or frame counting mode"""
+	def resample(self, *, mode:typing.Optional[CountingMode]=None, rate:typing.Optional[int]=None, rounding:str="nearest") -> "Timecode":
+		"""Create a new timecode object resampled to a new rate or frame counting mode (see `resample.Resampler`)"""
 
-		# NOTE: These fellas'll be further validated in the constructor
-		new_rate = rate or self.rate
-		new_mode = mode or self.mode
-		new_frame_number = round(self.frame_number * (new_rate/self.rate))
+		new_mode = self._normalize_mode(mode) if mode is not None else self._timebase.mode
+		new_timebase = new_mode.get_timebase(rate or self._timebase.rate)
 
-		return self.__class__(
-			timecode = new_frame_number,
-			mode = new_mode,
-			rate = new_rate
-		)
+		return Resampler.get(self._timebase, new_timebase, rounding).resample_timecode(self)
+
+	def to_seconds(self, *, real_rate:typing.Optional[numbers.Rational]=None) -> fractions.Fraction:
+		"""The exact wall-clock time of this timecode, in seconds, at the timebase's real rate (see `clock`)"""
+
+		from . import clock
+		return clock.seconds_of(self._frame_number, self._timebase, real_rate=real_rate)
+
+	@classmethod
+	def from_seconds(cls, seconds:typing.Union[numbers.Real, str], mode:typing.Optional[CountingMode]=None, rate:typing.Optional[int]=None, *, rounding:str="nearest", real_rate:typing.Optional[numbers.Rational]=None) -> "Timecode":
+		"""Create a timecode at a wall-clock time in seconds (see `clock`)"""
+
+		from . import clock
+		timebase = cls._normalize_mode(mode).get_timebase(rate)
+		return cls._from_validated(clock.frame_at_seconds(seconds, timebase, rounding=rounding, real_rate=real_rate), timebase)
+
+	def to_samples(self, sample_rate:int=48000, *, rounding:str="nearest", real_rate:typing.Optional[numbers.Rational]=None) -> int:
+		"""The audio sample position of this timecode (see `clock`)"""
+
+		from . import clock
+		return clock.samples_of(self._frame_number, self._timebase, sample_rate=sample_rate, rounding=rounding, real_rate=real_rate)
+
+	@classmethod
+	def from_samples(cls, samples:int, mode:typing.Optional[CountingMode]=None, rate:typing.Optional[int]=None, *, sample_rate:int=48000, rounding:str="nearest", real_rate:typing.Optional[numbers.Rational]=None) -> "Timecode":
+		"""Create a timecode at an audio sample position (see `clock`)"""
+
+		from . import clock
+		timebase = cls._normalize_mode(mode).get_timebase(rate)
+		return cls._from_validated(clock.frame_at_samples(samples, timebase, sample_rate=sample_rate, rounding=rounding, real_rate=real_rate), timebase)
+
+	@classmethod
+	def sum(cls, timecodes:typing.Iterable[typing.Union["Timecode", "TimecodeRange"]], *, start:typing.Optional["Timecode"]=None) -> "Timecode":
+		"""Add up many timecodes (or the durations of many ranges), checking that they share a timebase just the once
+
+		Much quicker than ``total = total + tc`` in a loop, which builds a new timecode at every step.
+		"""
+
+		from .timecoderange import TimecodeRange
+
+		timecodes = timecodes if isinstance(timecodes, (list, tuple)) else list(timecodes)
+
+		if not all(issubclass(item_type, (cls, TimecodeRange)) for item_type in {type(item) for item in timecodes}):
+			raise TypeError(f"Can only sum {cls.__name__} or TimecodeRange objects")
+
+		timebases = {item.timebase for item in timecodes}
+		if start is not None:
+			timebases.add(start.timebase)
+
+		if len(timebases) > 1:
+			raise ValueError(f"All given Timecode objects must have matching counting modes and rates (found: {', '.join(f'{tb.rate} {tb.mode}' for tb in timebases)})")
+
+		timebase = timebases.pop() if timebases else cls.DEFAULT_MODE.get_timebase()
+		total = start.frame_number if start is not None else 0
+		total += sum(item._frame_number if isinstance(item, Timecode) else item._end - item._start for item in timecodes)
+
+		return cls._from_validated(total, timebase)
 
 	@property
 	def frame_number(self) -> int:
@@ -62,32 +134,37 @@ class Timecode:
 	@property
 	def rate(self) -> int:
 		"""The rate (per second) of this timecode"""
-		return self._rate
+		return self._timebase.rate
 	
 	@property
 	def mode(self) -> CountingMode:
 		"""The counting mode used with this timecode"""
-		return self._mode
+		return self._timebase.mode
+	
+	@property
+	def timebase(self) -> Timebase:
+		"""The (shared) counting mode and rate used with this timecode"""
+		return self._timebase
 	
 	@property
 	def hours(self) -> int:
 		"""The hours elapsed"""
-		return self.mode.hours(self.frame_number, self.rate)
+		return self._timebase.mode.components(self._frame_number, self._timebase.rate)[1]
 	
 	@property
 	def minutes(self) -> int:
 		"""The minutes per hour elapsed"""
-		return self.mode.minutes(self.frame_number, self.rate)
+		return self._timebase.mode.components(self._frame_number, self._timebase.rate)[2]
 	
 	@property
 	def seconds(self) -> int:
 		"""The seconds per minute elapsed"""
-		return self.mode.seconds(self.frame_number, self.rate)
+		return self._timebase.mode.components(self._frame_number, self._timebase.rate)[3]
 	
 	@property
 	def frames(self) -> int:
 		"""The frames per second elapsed"""
-		return self.mode.frames(self.frame_number, self.rate)
+		return self._timebase.mode.components(self._frame_number, self._timebase.rate)[4]
 	
 	@property
 	def is_negative(self) -> bool:
@@ -100,7 +177,7 @@ class Timecode:
 		return not self.is_negative
 	
 	def __str__(self) -> str:
-		return self._mode._string_from_frame_number(self._frame_number, self._rate)
+		return cache.string_from_frame_number(self._frame_number, self._timebase)
 	
 	def __int__(self) -> int:
 		return self.frame_number
@@ -111,7 +188,7 @@ class Timecode:
 	def __hash__(self) -> int:
 		"""Create a unique hash for this timecode"""
 		return hash(
-			(self.frame_number, self.rate, self.mode)
+			(self.frame_number, self.timebase)
 		)
 	
 	# Comparisons
@@ -121,7 +198,7 @@ class Timecode:
 		"""Determine if an object can be compared properly to Timecode"""
 		# TODO: Only comparing like types for now
 		if isinstance(other, self.__class__):
-			return self.mode.__class__ == other.mode.__class__ and self.rate == other.rate
+			return self._timebase is other._timebase
 		elif isinstance(other, int):
 			return True
 		else:
@@ -150,7 +227,7 @@ class Timecode:
 	def __add__(self, other) -> "Timecode":
 		if not self._is_compatible(other):
 			raise TypeError(f"Cannot compare {self.__class__.__name__} to {other.__class__.__name__}")
-		return self.__class__(int(self) + int(other), mode=self.mode, rate=self.rate)
+		return self._from_validated(int(self) + int(other), self._timebase)
 	
 	def __radd__(self, other) -> "Timecode":
 		return self + other
@@ -158,17 +235,17 @@ class Timecode:
 	def __sub__(self, other) -> "Timecode":
 		if not self._is_compatible(other):
 			raise TypeError(f"Cannot compare {self.__class__.__name__} to {other.__class__.__name__}")
-		return self.__class__(int(self) - int(other), mode=self.mode, rate=self.rate)
+		return self._from_validated(int(self) - int(other), self._timebase)
 	
 	def __rsub__(self, other) -> "Timecode":
 		if not self._is_compatible(other):
 			raise TypeError(f"Cannot compare {self.__class__.__name__} to {other.__class__.__name__}")
-		return self.__class__(int(other) - int(self), mode=self.mode, rate=self.rate)
+		return self._from_validated(int(other) - int(self), self._timebase)
 	
 	def __mul__(self, other) -> "Timecode":
 		if not self._is_compatible(other):
 			raise TypeError(f"Cannot compare {self.__class__.__name__} to {other.__class__.__name__}")
-		return self.__class__(int(self) * int(other), mode=self.mode, rate=self.rate)
+		return self._from_validated(int(self) * int(other), self._timebase)
 	
 	def __rmul__(self, other) -> "Timecode":
 		return self * other
@@ -176,11 +253,14 @@ class Timecode:
 	def __truediv__(self, other) -> "Timecode":
 		if not self._is_compatible(other):
 			raise TypeError(f"Cannot compare {self.__class__.__name__} to {other.__class__.__name__}")
-		return self.__class__(round(int(self) / int(other)), mode=self.mode, rate=self.rate)
+		return self._from_validated(round(int(self) / int(other)), self._timebase)
 	
 	def __rtruediv__(self, other) -> "Timecode":
 		if not self._is_compatible(other):
 			raise TypeError(f"Cannot compare {self.__class__.__name__} to {other.__class__.__name__}")
-		return self.__class__(round(int(other) / int(self)), mode=self.mode, rate=self.rate)		
+		return self._from_validated(round(int(other) / int(self)), self._timebase)		
 	
-	# TODO: More?
\ No newline at end of file
+	# TODO: More?
+
+# Imported last, as the resampler is built on `Timecode`
+from .resample import Resampler
@@ -0,0 +1,98 @@
+"""Contains the `TimecodeAccumulator` class, a mutable running total of frames"""
+
+import typing
+from . import Timecode, TimecodeRange
+from .modes import CountingMode, Timebase
+
+class TimecodeAccumulator:
+	"""A mutable running total of frames, tied to a fixed counting mode and rate
+
+	Adding to it in place (``total += tc``) updates a single integer rather than building a new `Timecode` at every
+	step, which adds up in loops over thousands of clips:
+
+	>>> total = TimecodeAccumulator(rate=24)
+	>>> for clip in clips:
+	...     total += clip.duration
+	>>> total.timecode
+	<Timecode 01:23:45:12 @ 24 NDF>
+	"""
+
+	__slots__ = ("_timebase", "_frame_number")
+
+	def __init__(self, start:typing.Union[Timecode,int]=0, mode:typing.Optional[CountingMode]=None, rate:typing.Optional[int]=None):
+
+		if isinstance(start, Timecode):
+			start = Timecode(start, mode=mode, rate=rate)	# Checks the mode and rate match, if given
+			self._timebase = start.timebase
+			self._frame_number = start.frame_number
+		elif isinstance(start, int):
+			self._timebase = Timecode._normalize_mode(mode).get_timebase(rate)
+			self._frame_number = start
+		else:
+			raise TypeError(f"Expected a Timecode or frame number to start from (got {start.__class__.__name__})")
+
+	def _frames_of(self, other:typing.Union[Timecode, TimecodeRange, int]) -> int:
+		"""The frames to add (or subtract) for a timecode, a range's duration, or a frame count"""
+
+		if isinstance(other, (Timecode, TimecodeRange)):
+			if other.timebase is not self._timebase:
+				raise ValueError(f"Expected {self._timebase.rate} {self._timebase.mode} (got {other.timebase.rate} {other.timebase.mode})")
+			return other.frame_number if isinstance(other, Timecode) else other._end - other._start
+		elif isinstance(other, int):
+			return other
+
+		raise TypeError(f"Cannot add {other.__class__.__name__} to {self.__class__.__name__}")
+
+	@property
+	def timebase(self) -> Timebase:
+		"""The counting mode and rate of the total"""
+		return self._timebase
+
+	@property
+	def rate(self) -> int:
+		return self._timebase.rate
+
+	@property
+	def mode(self) -> CountingMode:
+		return self._timebase.mode
+
+	@property
+	def frame_number(self) -> int:
+		"""The total so far, as a frame number"""
+		return self._frame_number
+
+	@property
+	def timecode(self) -> Timecode:
+		"""The total so far, as a `Timecode`"""
+		return Timecode._from_validated(self._frame_number, self._timebase)
+
+	def add(self, other:typing.Union[Timecode, TimecodeRange, int]) -> "TimecodeAccumulator":
+		"""Add a timecode, the duration of a range, or a number of frames"""
+		self._frame_number += self._frames_of(other)
+		return self
+
+	def subtract(self, other:typing.Union[Timecode, TimecodeRange, int]) -> "TimecodeAccumulator":
+		"""Subtract a timecode, the duration of a range, or a number of frames"""
+		self._frame_number -= self._frames_of(other)
+		return self
+
+	def extend(self, timecodes:typing.Iterable[typing.Union[Timecode, TimecodeRange]]) -> "TimecodeAccumulator":
+		"""Add many timecodes or range durations at once (see `Timecode.sum()`)"""
+		self._frame_number = Timecode.sum(timecodes, start=self.timecode).frame_number
+		return self
+
+	def reset(self, start:int=0):
+		"""Start counting again"""
+		self._frame_number = start
+
+	__iadd__ = add
+	__isub__ = subtract
+
+	def __int__(self) -> int:
+		return self._frame_number
+
+	def __str__(self) -> str:
+		return str(self.timecode)
+
+	def __repr__(self) -> str:
+		return f"<{self.__class__.__name__} {self} @ {self.rate} {self.mode}>"
@@ -0,0 +1,309 @@
+"""Contains the `TimecodeArray` class, which represents many frames sharing a single rate and counting mode
+
+Requires NumPy (``pip install timecode[numpy]``)
+"""
+
+import numbers, typing
+import numpy
+from . import Timecode
+from .modes import CountingMode, Timebase
+
+class TimecodeArray:
+	"""A contiguous array of frame numbers sharing a single rate and counting mode"""
+
+	DTYPE = numpy.int64
+	"""The NumPy dtype used to store frame numbers"""
+
+	__slots__ = ("_timebase", "_frame_numbers", "_components")
+
+	def __init__(self, frame_numbers:typing.Union[typing.Iterable[int], "TimecodeArray"], mode:typing.Optional[CountingMode]=None, rate:typing.Optional[int]=None):
+
+		# If a TimecodeArray is provided, make a copy of it
+		if isinstance(frame_numbers, self.__class__):
+			if mode is not None and type(frame_numbers.mode) is not type(mode):
+				raise ValueError(f"The mode provided ({mode}) does not match the mode of the timecode array passed ({frame_numbers.mode}).  Use TimecodeArray.resample() to change the mode of an existing TimecodeArray object.")
+			elif rate is not None and frame_numbers.rate != rate:
+				raise ValueError(f"The rate provided ({rate}) does not match the rate of the timecode array passed ({frame_numbers.rate}).  Use TimecodeArray.resample() to change the rate of an existing TimecodeArray object.")
+			mode = frame_numbers.mode
+			rate = frame_numbers.rate
+			frame_numbers = frame_numbers._frame_numbers
+
+		self._timebase = Timecode._normalize_mode(mode).get_timebase(rate)
+		self._frame_numbers = self._normalize_frame_numbers(frame_numbers)
+		self._components = None
+
+	@classmethod
+	def _normalize_frame_numbers(cls, frame_numbers:typing.Iterable[int]) -> numpy.ndarray:
+		"""Validate and convert the user-provided frame numbers to a contiguous one-dimensional array"""
+
+		if isinstance(frame_numbers, typing.Iterator):
+			array = numpy.fromiter(frame_numbers, dtype=cls.DTYPE)
+		else:
+			array = numpy.array(frame_numbers, dtype=cls.DTYPE, copy=True)
+
+		if array.ndim != 1:
+			raise ValueError("Frame numbers must be a one-dimensional sequence of integers")
+
+		return array
+
+	@classmethod
+	def _from_array(cls, frame_numbers:numpy.ndarray, timebase:Timebase) -> "TimecodeArray":
+		"""Wrap an already-validated int64 array without copying it"""
+
+		timecodes = cls.__new__(cls)
+		timecodes._timebase = timebase
+		timecodes._frame_numbers = frame_numbers
+		timecodes._components = None
+		return timecodes
+
+	@classmethod
+	def from_strings(cls, timecodes:typing.Iterable[str], mode:typing.Optional[CountingMode]=None, rate:typing.Optional[int]=None, *, errors:typing.Optional[typing.List[typing.Tuple[int,str]]]=None, strict:bool=False) -> "TimecodeArray":
+		"""Create a `TimecodeArray` by parsing many timecode strings (see `CountingMode.parse_many()`)"""
+
+		timebase = Timecode._normalize_mode(mode).get_timebase(rate)
+		frame_numbers = timebase.mode.parse_many(timecodes, timebase.rate, errors=errors, strict=strict)
+
+		return cls._from_array(numpy.frombuffer(frame_numbers, dtype=cls.DTYPE).copy(), timebase)
+
+	@classmethod
+	def from_timecodes(cls, timecodes:typing.Iterable[Timecode]) -> "TimecodeArray":
+		"""Create a `TimecodeArray` from `Timecode` objects which all share the same mode and rate"""
+
+		timecodes = list(timecodes)
+
+		if not timecodes:
+			return cls([])
+
+		timebase = timecodes[0].timebase
+
+		for tc in timecodes:
+			if tc.timebase is not timebase:
+				raise ValueError(f"All given Timecode objects must have matching counting modes and rates (found: {repr(tc)} vs {timebase.rate} {timebase.mode})")
+
+		return cls._from_array(cls._normalize_frame_numbers([tc.frame_number for tc in timecodes]), timebase)
+
+	@property
+	def frame_numbers(self) -> numpy.ndarray:
+		"""The frame numbers as a read-only NumPy array"""
+		view = self._frame_numbers.view()
+		view.flags.writeable = False
+		return view
+
+	@property
+	def rate(self) -> int:
+		"""The rate (per second) shared by these timecodes"""
+		return self._timebase.rate
+
+	@property
+	def mode(self) -> CountingMode:
+		"""The counting mode shared by these timecodes"""
+		return self._timebase.mode
+
+	@property
+	def timebase(self) -> Timebase:
+		"""The (shared) counting mode and rate of these timecodes"""
+		return self._timebase
+
+	@property
+	def components(self) -> typing.Tuple[numpy.ndarray, numpy.ndarray, numpy.ndarray, numpy.ndarray, numpy.ndarray]:
+		"""The signs, hours, minutes, seconds and frames for each timecode (see `CountingMode.components()`)
+		
+		Worked out once, on first use, and shared with the element properties as read-only arrays.
+		"""
+
+		if self._components is None:
+			components = self.mode.components(self._frame_numbers, self.rate)
+			for component in components:
+				component.flags.writeable = False
+			self._components = components
+		return self._components
+
+	@property
+	def hours(self) -> numpy.ndarray:
+		"""The hours elapsed for each timecode"""
+		return self.components[1]
+
+	@property
+	def minutes(self) -> numpy.ndarray:
+		"""The minutes per hour elapsed for each timecode"""
+		return self.components[2]
+
+	@property
+	def seconds(self) -> numpy.ndarray:
+		"""The seconds per minute elapsed for each timecode"""
+		return self.components[3]
+
+	@property
+	def frames(self) -> numpy.ndarray:
+		"""The frames per second elapsed for each timecode"""
+		return self.components[4]
+
+	@property
+	def is_negative(self) -> numpy.ndarray:
+		"""Is each timecode negative"""
+		return self._frame_numbers < 0
+
+	@property
+	def is_positive(self) -> numpy.ndarray:
+		"""Is each timecode positive"""
+		return ~self.is_negative
+
+	def resample(self, *, mode:typing.Optional[CountingMode]=None, rate:typing.Optional[int]=None, rounding:str="nearest") -> "TimecodeArray":
+		"""Create a new array resampled to a new rate or frame counting mode, in one vectorized operation (see `resample.Resampler`)"""
+
+		from .resample import Resampler
+
+		new_mode = Timecode._normalize_mode(mode) if mode is not None else self.mode
+		new_timebase = new_mode.get_timebase(rate or self.rate)
+		resampler = Resampler.get(self._timebase, new_timebase, rounding)
+
+		return self._from_array(resampler.resample_frames(self._frame_numbers).astype(self.DTYPE, copy=False), new_timebase)
+
+	def to_seconds(self, *, real_rate:typing.Optional[numbers.Rational]=None) -> numpy.ndarray:
+		"""The wall-clock time of every timecode in (floating-point) seconds, in one vectorized operation (see `clock`)"""
+
+		from . import clock
+		return clock.to_seconds(self._frame_numbers, self.mode, self.rate, real_rate=real_rate)
+
+	@classmethod
+	def from_seconds(cls, seconds:typing.Iterable[numbers.Real], mode:typing.Optional[CountingMode]=None, rate:typing.Optional[int]=None, *, rounding:str="nearest", real_rate:typing.Optional[numbers.Rational]=None) -> "TimecodeArray":
+		"""Create a `TimecodeArray` at many wall-clock times in seconds (see `clock.from_seconds()`)"""
+
+		from . import clock
+		timebase = Timecode._normalize_mode(mode).get_timebase(rate)
+		seconds = numpy.asarray(seconds, dtype=numpy.float64)
+		return cls._from_array(numpy.atleast_1d(clock.from_seconds(seconds, timebase.mode, timebase.rate, rounding=rounding, real_rate=real_rate)), timebase)
+
+	def to_samples(self, sample_rate:int=48000, *, rounding:str="nearest", real_rate:typing.Optional[numbers.Rational]=None) -> numpy.ndarray:
+		"""The audio sample position of every timecode, in one vectorized operation (see `clock`)"""
+
+		from . import clock
+		return clock.to_samples(self._frame_numbers, self.mode, self.rate, sample_rate=sample_rate, rounding=rounding, real_rate=real_rate)
+
+	@classmethod
+	def from_samples(cls, samples:typing.Iterable[int], mode:typing.Optional[CountingMode]=None, rate:typing.Optional[int]=None, *, sample_rate:int=48000, rounding:str="nearest", real_rate:typing.Optional[numbers.Rational]=None) -> "TimecodeArray":
+		"""Create a `TimecodeArray` at many audio sample positions (see `clock.from_samples()`)"""
+
+		from . import clock
+		timebase = Timecode._normalize_mode(mode).get_timebase(rate)
+		samples = cls._normalize_frame_numbers(samples)
+		return cls._from_array(clock.from_samples(samples, timebase.mode, timebase.rate, sample_rate=sample_rate, rounding=rounding, real_rate=real_rate), timebase)
+
+	def to_strings(self) -> typing.List[str]:
+		"""Format every timecode as a timecode string"""
+
+		signs, hours, minutes, seconds, frames = (x.tolist() for x in self.components)
+		signs = ["-" if sign < 0 else "" for sign in signs]
+
+		sep = self.mode.SEPARATOR
+		frame_fill = self._timebase.frame_digits
+
+		return [f"{sign}{h:02d}{sep}{m:02d}{sep}{s:02d}{sep}{f:0{frame_fill}d}" for sign, h, m, s, f in zip(signs, hours, minutes, seconds, frames)]
+
+	def __len__(self) -> int:
+		return len(self._frame_numbers)
+
+	def __iter__(self) -> typing.Iterator[Timecode]:
+		from_validated = Timecode._from_validated
+		timebase = self._timebase
+		return (from_validated(x, timebase) for x in self._frame_numbers.tolist())
+
+	def __getitem__(self, key) -> typing.Union[Timecode, "TimecodeArray"]:
+
+		if isinstance(key, (int, numpy.integer)):
+			return Timecode._from_validated(int(self._frame_numbers[key]), self._timebase)
+
+		return self._from_array(numpy.atleast_1d(self._frame_numbers[key]), self._timebase)
+
+	def __array__(self, dtype=None, copy=None) -> numpy.ndarray:
+		return self.frame_numbers if dtype is None else self._frame_numbers.astype(dtype)
+
+	def __repr__(self) -> str:
+		preview = self.to_strings() if len(self) <= 6 else self[:3].to_strings() + ["..."] + self[-3:].to_strings()
+		return f"<{self.__class__.__name__} [{', '.join(preview)}] ({len(self)}) @ {self.rate} {self.mode}>"
+
+	# Like NumPy arrays, elementwise `__eq__` means these can't be hashed
+	__hash__ = None
+
+	# Comparisons
+
+	def _is_compatible(self, other:typing.Any) -> bool:
+		"""Determine if an object can be compared properly to TimecodeArray"""
+
+		if isinstance(other, (self.__class__, Timecode)):
+			return self._timebase is other.timebase
+		elif isinstance(other, (str, bytes)):
+			# Strings are sequences too, but not of frame numbers
+			raise TypeError(f"Cannot compare {self.__class__.__name__} to {other.__class__.__name__}")
+		elif isinstance(other, (int, numpy.integer, numpy.ndarray, typing.Sequence)):
+			return True
+		else:
+			raise TypeError(f"Cannot compare {self.__class__.__name__} to {other.__class__.__name__}")
+
+	@classmethod
+	def _as_operand(cls, other:typing.Any) -> typing.Union[int, numpy.ndarray]:
+		"""Get the raw frame number(s) from a compatible operand"""
+
+		if isinstance(other, cls):
+			return other._frame_numbers
+		elif isinstance(other, (int, numpy.integer, Timecode)):
+			return int(other)
+		return numpy.asarray(other, dtype=cls.DTYPE)
+
+	def _compare(self, other, op) -> numpy.ndarray:
+		if not self._is_compatible(other):
+			return numpy.zeros(len(self), dtype=bool)
+		return op(self._frame_numbers, self._as_operand(other))
+
+	def __eq__(self, other) -> numpy.ndarray:
+		return self._compare(other, numpy.equal)
+
+	def __ne__(self, other) -> numpy.ndarray:
+		return ~(self == other)
+
+	def __lt__(self, other) -> numpy.ndarray:
+		return self._compare(other, numpy.less)
+
+	def __le__(self, other) -> numpy.ndarray:
+		return self._compare(other, numpy.less_equal)
+
+	def __gt__(self, other) -> numpy.ndarray:
+		return self._compare(other, numpy.greater)
+
+	def __ge__(self, other) -> numpy.ndarray:
+		return self._compare(other, numpy.greater_equal)
+
+	# Math operations
+
+	def _math(self, other, op) -> "TimecodeArray":
+		if not self._is_compatible(other):
+			raise TypeError(f"Cannot compare {self.__class__.__name__} to {other.__class__.__name__}")
+		result = op(self._frame_numbers, self._as_operand(other))
+		return self._from_array(numpy.asarray(result, dtype=self.DTYPE), self._timebase)
+
+	def __add__(self, other) -> "TimecodeArray":
+		return self._math(other, numpy.add)
+
+	def __radd__(self, other) -> "TimecodeArray":
+		return self + other
+
+	def __sub__(self, other) -> "TimecodeArray":
+		return self._math(other, numpy.subtract)
+
+	def __rsub__(self, other) -> "TimecodeArray":
+		return self._math(other, lambda a, b: numpy.subtract(b, a))
+
+	def __mul__(self, other) -> "TimecodeArray":
+		return self._math(other, numpy.multiply)
+
+	def __rmul__(self, other) -> "TimecodeArray":
+		return self * other
+
+	def __truediv__(self, other) -> "TimecodeArray":
+		return self._math(other, lambda a, b: numpy.rint(numpy.true_divide(a, b)))
+
+	def __rtruediv__(self, other) -> "TimecodeArray":
+		return self._math(other, lambda a, b: numpy.rint(numpy.true_divide(b, a)))
+
+	def __neg__(self) -> "TimecodeArray":
+		return self._from_array(-self._frame_numbers, self._timebase)
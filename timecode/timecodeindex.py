@@ -0,0 +1,295 @@
+"""Contains the `TimecodeIndex` class, an immutable lookup table of ranges sorted by start frame"""
+
+import array, bisect, itertools, typing
+from . import Timecode, TimecodeRange
+from .modes import CountingMode, Timebase
+
+IndexItem = typing.Union[TimecodeRange, Timecode]
+
+class _EndsTree:
+	"""A segment tree over ranges sorted by start, keeping the furthest end under each node
+
+	Finds the ranges before a position which reach past a frame in ``O(log n + k log n)`` for ``k`` results, however
+	much the ranges overlap.  Empty ranges are never found.
+	"""
+
+	__slots__ = ("_size", "_tree")
+
+	def __init__(self, starts:array.array, ends:array.array):
+
+		size = 1
+		while size < len(ends):
+			size *= 2
+
+		# Leaves hold the ends, in order of start; each node above holds the furthest end beneath it
+		tree = array.array("q", [-2**63]) * (size * 2)
+		for idx, (start, end) in enumerate(zip(starts, ends)):
+			if start < end:
+				tree[size + idx] = end
+		for node in range(size - 1, 0, -1):
+			tree[node] = max(tree[node * 2], tree[node * 2 + 1])
+
+		self._size = size
+		self._tree = tree
+
+	def _nodes_before(self, stop:int) -> typing.List[int]:
+		"""The nodes exactly covering positions ``0`` to ``stop``, left to right"""
+
+		left, right = [], []
+		lo, hi = self._size, min(stop, self._size) + self._size
+
+		while lo < hi:
+			if lo & 1:
+				left.append(lo)
+				lo += 1
+			if hi & 1:
+				hi -= 1
+				right.append(hi)
+			lo //= 2
+			hi //= 2
+
+		return left + right[::-1]
+
+	def last_reaching(self, stop:int, frame_number:int) -> int:
+		"""The last position before ``stop`` whose range ends after a frame, or ``-1``"""
+
+		tree, size = self._tree, self._size
+
+		for node in reversed(self._nodes_before(stop)):
+			if tree[node] > frame_number:
+				# Head down, keeping to the right
+				while node < size:
+					node = node * 2 + 1 if tree[node * 2 + 1] > frame_number else node * 2
+				return node - size
+		return -1
+
+	def all_reaching(self, stop:int, frame_number:int) -> typing.List[int]:
+		"""Every position before ``stop`` whose range ends after a frame, in order"""
+
+		tree, size = self._tree, self._size
+		positions = []
+
+		for node in self._nodes_before(stop):
+			pending = [node]
+			while pending:
+				node = pending.pop()
+				if tree[node] <= frame_number:
+					continue
+				elif node >= size:
+					positions.append(node - size)
+				else:
+					pending.append(node * 2 + 1)
+					pending.append(node * 2)
+
+		return positions
+
+class TimecodeIndex:
+	"""An immutable, sorted index of `TimecodeRange`s (or single `Timecode`s) for fast lookups
+
+	Built once, then searched with binary searches over packed start and end frames, so no timecodes are built
+	just to compare them.  Ranges may overlap.  All items must share the same counting mode and rate.
+	"""
+
+	__slots__ = ("_timebase", "_items", "_starts", "_ends", "_max_ends", "_ends_tree", "_ends_sorted", "_ends_order")
+
+	def __init__(self, items:typing.Iterable[IndexItem]=()):
+
+		items = list(items)
+		timebase = items[0].timebase if items else Timecode.DEFAULT_MODE.get_timebase()
+
+		bounds = []
+		for idx, item in enumerate(items):
+			if item.timebase is not timebase:
+				raise ValueError(f"All items must have matching counting modes and rates (found: {timebase.rate} {timebase.mode} vs {item.timebase.rate} {item.timebase.mode})")
+			if isinstance(item, TimecodeRange):
+				bounds.append((item._start, item._end, idx))
+			elif isinstance(item, Timecode):
+				bounds.append((item.frame_number, item.frame_number + 1, idx))
+			else:
+				raise TypeError(f"Cannot index {item.__class__.__name__}")
+
+		bounds.sort()
+
+		self._timebase = timebase
+		self._items = tuple(items[idx] for _, _, idx in bounds)
+		self._starts = array.array("q", (start for start, _, _ in bounds))
+		self._ends = array.array("q", (end for _, end, _ in bounds))
+
+		# The furthest any range reaches by each position, to rule out most searches straight away
+		self._max_ends = array.array("q", itertools.accumulate(self._ends, max))
+
+		# For the rest, where long ranges reach over many shorter ones
+		self._ends_tree = _EndsTree(self._starts, self._ends)
+
+		# For finding the closest range which ends before a frame (empty ranges are never the closest)
+		order = sorted((idx for idx in range(len(bounds)) if self._starts[idx] < self._ends[idx]), key=self._ends.__getitem__)
+		self._ends_order = array.array("q", order)
+		self._ends_sorted = array.array("q", (self._ends[idx] for idx in order))
+
+	@property
+	def timebase(self) -> Timebase:
+		"""The (shared) counting mode and rate of the items in this index"""
+		return self._timebase
+
+	@property
+	def rate(self) -> int:
+		return self._timebase.rate
+
+	@property
+	def mode(self) -> CountingMode:
+		return self._timebase.mode
+
+	def _frame_number_of(self, timecode:typing.Union[Timecode, str, int]) -> int:
+		"""Get the frame number of a query, checking its timebase"""
+
+		if isinstance(timecode, Timecode):
+			if timecode.timebase is not self._timebase:
+				raise ValueError(f"Expected a timecode at {self.rate} {self.mode} (got {timecode.rate} {timecode.mode})")
+			return timecode.frame_number
+		elif isinstance(timecode, int):
+			return timecode
+		return Timecode(timecode, mode=self.mode, rate=self.rate).frame_number
+
+	def _bounds_of(self, tc_range:typing.Union[TimecodeRange, typing.Tuple[typing.Union[Timecode,str,int], typing.Union[Timecode,str,int]]]) -> typing.Tuple[int, int]:
+		"""Get the frame boundaries of a query range or ``(start, end)`` pair"""
+
+		if isinstance(tc_range, TimecodeRange):
+			if tc_range.timebase is not self._timebase:
+				raise ValueError(f"Expected a range at {self.rate} {self.mode} (got {tc_range.rate} {tc_range.mode})")
+			return tc_range._start, tc_range._end
+
+		start, end = tc_range
+		return self._frame_number_of(start), self._frame_number_of(end)
+
+	def _positions_overlapping(self, start:int, end:int) -> typing.List[int]:
+		"""Sorted positions of the ranges which share at least one frame with ``start`` to ``end``"""
+
+		if start >= end:
+			return []
+
+		# Only ranges which start before the end can overlap
+		return self._ends_tree.all_reaching(bisect.bisect_left(self._starts, end), start)
+
+	def _position_containing(self, frame_number:int) -> int:
+		"""The position of the latest-starting range containing a frame, or ``-1``"""
+
+		idx = bisect.bisect_right(self._starts, frame_number) - 1
+
+		# Usually the latest-starting range either contains the frame, or nothing before it reaches that far
+		if idx < 0 or self._ends[idx] > frame_number:
+			return idx
+		elif self._max_ends[idx] <= frame_number:
+			return -1
+		return self._ends_tree.last_reaching(idx, frame_number)
+
+	# Queries
+
+	def find(self, timecode:typing.Union[Timecode, str, int]) -> typing.Optional[IndexItem]:
+		"""The item containing a timecode (the latest-starting one, if several do), or `None`"""
+
+		idx = self._position_containing(self._frame_number_of(timecode))
+		return self._items[idx] if idx >= 0 else None
+
+	def containing(self, timecode:typing.Union[Timecode, str, int]) -> typing.List[IndexItem]:
+		"""Every item containing a timecode, in order of start"""
+
+		frame_number = self._frame_number_of(timecode)
+		return [self._items[idx] for idx in self._positions_overlapping(frame_number, frame_number + 1)]
+
+	def window(self, tc_range:typing.Union[TimecodeRange, typing.Tuple[typing.Union[Timecode,str,int], typing.Union[Timecode,str,int]]]) -> typing.List[IndexItem]:
+		"""Every item sharing at least one frame with a range (or a ``(start, end)`` pair, end exclusive), in order of start"""
+
+		return [self._items[idx] for idx in self._positions_overlapping(*self._bounds_of(tc_range))]
+
+	def nearest(self, timecode:typing.Union[Timecode, str, int]) -> typing.Optional[IndexItem]:
+		"""The item containing a timecode, or otherwise the closest one to it (the earlier one, in a tie)"""
+
+		frame_number = self._frame_number_of(timecode)
+
+		idx = self._position_containing(frame_number)
+		if idx >= 0:
+			return self._items[idx]
+
+		# Closest range ending before the frame, and closest range starting after it
+		before = bisect.bisect_right(self._ends_sorted, frame_number) - 1
+		after = bisect.bisect_right(self._starts, frame_number)
+		while after < len(self._starts) and self._starts[after] >= self._ends[after]:
+			after += 1
+
+		distance_before = frame_number - self._ends_sorted[before] + 1 if before >= 0 else None
+		distance_after = self._starts[after] - frame_number if after < len(self._starts) else None
+
+		if distance_before is None and distance_after is None:
+			return None
+		elif distance_after is None or (distance_before is not None and distance_before <= distance_after):
+			return self._items[self._ends_order[before]]
+		return self._items[after]
+
+	def find_many(self, timecodes:typing.Iterable[typing.Union[Timecode, str, int]]) -> typing.Union[array.array, typing.Any]:
+		"""The sorted position (see `__getitem__()`) of the item containing each timecode, or ``-1`` if there isn't one
+
+		NumPy arrays of frame numbers are looked up in one vectorized search, and return a NumPy array.  Anything else
+		returns an ``array('q')``.
+		"""
+
+		if hasattr(timecodes, "dtype"):
+			return self._find_many_vectorized(timecodes)
+
+		position_containing = self._position_containing
+		frame_number_of = self._frame_number_of
+		return array.array("q", [position_containing(frame_number_of(tc)) for tc in timecodes])
+
+	def _find_many_vectorized(self, frame_numbers):
+		import numpy
+
+		starts = numpy.frombuffer(self._starts, dtype=numpy.int64)
+		ends = numpy.frombuffer(self._ends, dtype=numpy.int64)
+		max_ends = numpy.frombuffer(self._max_ends, dtype=numpy.int64)
+
+		frame_numbers = numpy.asarray(frame_numbers, dtype=numpy.int64)
+		positions = numpy.searchsorted(starts, frame_numbers, side="right") - 1
+
+		if not len(starts):
+			return numpy.full(frame_numbers.shape, -1, dtype=numpy.int64)
+
+		clipped = numpy.clip(positions, 0, None)
+		found = (positions >= 0) & (ends[clipped] > frame_numbers)
+
+		# Overlapping ranges may still contain frames the latest-starting range doesn't
+		unresolved = ~found & (positions >= 0) & (max_ends[clipped] > frame_numbers)
+		result = numpy.where(found, positions, -1)
+
+		for idx in numpy.flatnonzero(unresolved).tolist():
+			result[idx] = self._position_containing(int(frame_numbers[idx]))
+
+		return result
+
+	def lookup_many(self, timecodes:typing.Iterable[typing.Union[Timecode, str, int]]) -> typing.List[typing.Optional[IndexItem]]:
+		"""The item containing each timecode, or `None` (see `find_many()`)"""
+
+		items = self._items
+		return [items[idx] if idx >= 0 else None for idx in self.find_many(timecodes).tolist()]
+
+	# Container stuff
+
+	def __len__(self) -> int:
+		return len(self._items)
+
+	def __iter__(self) -> typing.Iterator[IndexItem]:
+		return iter(self._items)
+
+	def __getitem__(self, key:typing.Union[int, slice]) -> typing.Union[IndexItem, typing.Tuple[IndexItem, ...]]:
+		"""An item by its sorted position"""
+		return self._items[key]
+
+	def __contains__(self, timecode) -> bool:
+		if isinstance(timecode, Timecode) and timecode.timebase is not self._timebase:
+			return False
+		return self._position_containing(self._frame_number_of(timecode)) >= 0
+
+	def __repr__(self) -> str:
+		if not self._items:
+			return f"<{self.__class__.__name__} (0) @ {self.rate} {self.mode}>"
+		first = Timecode._from_validated(self._starts[0], self._timebase)
+		last = Timecode._from_validated(self._max_ends[-1], self._timebase)
+		return f"<{self.__class__.__name__} {first} - {last} ({len(self)}) @ {self.rate} {self.mode}>"
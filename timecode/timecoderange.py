@@ -1,8 +1,8 @@
 """Contains the `TimecodeRange` class, which represents a continuous range of frames"""
 
-import typing
-from . import Timecode
-from .modes import CountingMode
+import fractions, numbers, typing
+from .timecode import Timecode
+from .modes import CountingMode, Timebase
 
 class TimecodeRange:
 	"""An unbroken sequence of timecodes between a specified range"""
@@ -10,101 +10,336 @@ class TimecodeRange:
 	ALLOW_NEGATIVE_RANGES = False
 	"""Allow a start timecode which is later than the end timecode"""
 
-	__slots__ = ("_start_tc", "_duration")
+	__slots__ = ("_timebase", "_start", "_end")
 	
 	def __init__(self, *, start:typing.Union[Timecode,str,int,None]=None, duration:typing.Union[Timecode,str,int,None]=None, end:typing.Union[Timecode,str,int,None]=None):
 
-		rate, mode = self._get_common_mode(start, duration, end)
-
-		self._start_tc = Timecode(start, rate=rate, mode=mode()) if start is not None else None
-		self._duration = Timecode(duration, rate=rate, mode=mode()) if duration is not None else None
-		end = Timecode(end, rate=rate, mode=mode()) if end is not None else None
+		timebase = self._get_common_timebase(start, duration, end)
+		mode, rate = timebase.mode, timebase.rate
 
+		start = Timecode(start, rate=rate, mode=mode).frame_number if start is not None else None
+		duration = Timecode(duration, rate=rate, mode=mode).frame_number if duration is not None else None
+		end = Timecode(end, rate=rate, mode=mode).frame_number if end is not None else None
 		
-		if end:
-			if duration and not start:
-				self._start_tc = end - self.duration	
-			elif start and not duration:
-				self._duration = end - self.start
-			elif start and duration:
+		if end is not None:
+			if duration is not None and start is None:
+				start = end - duration
+			elif start is not None and duration is None:
+				duration = end - start
+			elif start is not None and duration is not None:
 				# Just do a sanity check
-				if self.start + self.duration != end:
+				if start + duration != end:
 					raise ValueError("`end` does not match `start` + `duration`")
 		
-		if not self._start_tc and self._duration:
+		if start is None or duration is None:
 			raise ValueError(f"Two of `start`,`duration`, and `end` are required")
 		
-		if not self.ALLOW_NEGATIVE_RANGES and self._duration < 0:
+		if not self.ALLOW_NEGATIVE_RANGES and duration < 0:
 			raise ValueError("Negative durations are not allowed (end cannot occur before start)")
+
+		# Just the frame numbers are kept; timecodes are only built when asked for
+		self._timebase = timebase
+		self._start = start
+		self._end = start + duration
+	
+	@classmethod
+	def _from_validated(cls, start:int, duration:int, timebase:Timebase) -> "TimecodeRange":
+		"""Create a range from an already-validated start frame, duration and timebase, skipping `__init__`"""
+
+		tc_range = cls.__new__(cls)
+		tc_range._timebase = timebase
+		tc_range._start = start
+		tc_range._end = start + duration
+		return tc_range
 	
 	@classmethod
-	def _get_common_mode(cls, *args:typing.Iterable[typing.Union[Timecode,str,int,None]]) -> typing.Tuple[int, CountingMode]:
+	def _get_common_timebase(cls, *args:typing.Iterable[typing.Union[Timecode,str,int,None]]) -> Timebase:
 		"""Returns the common counting mode and rate from the provided arguments"""
 		
-		known_mode = None
-		known_rate = None
+		known_timebase = None
 		
 		for tc in (t for t in args if isinstance(t, Timecode)):
 
-			if known_mode is not None and type(tc.mode) is not known_mode:
-				print("For",tc,":", type(tc.mode), known_mode)
-				raise ValueError(f"All given Timecode objects must have matching counting modes (found: {known_mode.__name__} vs {type(tc.mode).__name__})")
-			elif known_rate is not None and known_rate != tc.rate:
-				raise ValueError(f"All given Timecode ojbects must have matching rates (found: {known_rate} vs {tc.rate})")
-		
-			known_mode = type(tc.mode)
-			known_rate = tc.rate
+			if known_timebase is None:
+				known_timebase = tc.timebase
+			elif type(tc.mode) is not type(known_timebase.mode):
+				raise ValueError(f"All given Timecode objects must have matching counting modes (found: {type(known_timebase.mode).__name__} vs {type(tc.mode).__name__})")
+			elif tc.rate != known_timebase.rate:
+				raise ValueError(f"All given Timecode ojbects must have matching rates (found: {known_timebase.rate} vs {tc.rate})")
 		
 		# Set defaults if none were given
-		# NOTE: If one is None, the other should be too.  I don't know what to do with this information but it seems like I should mention it or something.
-		known_mode = known_mode or Timecode.DEFAULT_MODE
-		known_rate = known_rate or known_mode.DEFAULT_RATE
-
-		return (known_rate, known_mode)
+		return known_timebase or Timecode.DEFAULT_MODE.get_timebase()
 
 	@property
 	def start(self) -> Timecode:
 		"""The start timecode in this range"""
-		return self._start_tc
+		return Timecode._from_validated(self._start, self._timebase)
 	
 	@property
 	def end(self) -> Timecode:
 		"""The end timecode in this range (exclusive)"""
-		return self._start_tc + self._duration
+		return Timecode._from_validated(self._end, self._timebase)
 	
 	@property
 	def duration(self) -> Timecode:
 		"""The duration of this timecode range"""
-		return self._duration
-	
+		return Timecode._from_validated(self._end - self._start, self._timebase)
+
 	@property
 	def rate(self) -> int:
-		return self.start.rate
+		return self._timebase.rate
 	
 	@property
 	def mode(self) -> CountingMode:
-		return self.start.mode
+		return self._timebase.mode
+	
+	@property
+	def timebase(self) -> Timebase:
+		"""The (shared) counting mode and rate of this range"""
+		return self._timebase
+	
+	def resample(self, *, mode:typing.Optional[CountingMode]=None, rate:typing.Optional[int]=None, rounding:str="nearest") -> "TimecodeRange":
+		"""Create a new range resampled to a new rate or frame counting mode (see `resample.Resampler`)"""
+
+		from .resample import Resampler
+
+		new_mode = Timecode._normalize_mode(mode) if mode is not None else self.mode
+		new_timebase = new_mode.get_timebase(rate or self.rate)
+
+		return Resampler.get(self.timebase, new_timebase, rounding).resample_range(self)
+	
+	def to_seconds(self, *, real_rate:typing.Optional[numbers.Rational]=None) -> typing.Tuple[fractions.Fraction, fractions.Fraction]:
+		"""The exact wall-clock times of the start and (exclusive) end of this range, in seconds (see `clock`)"""
+
+		from . import clock
+		return clock.seconds_of(self._start, self._timebase, real_rate=real_rate), clock.seconds_of(self._end, self._timebase, real_rate=real_rate)
+
+	@classmethod
+	def from_seconds(cls, start:typing.Union[numbers.Real, str], end:typing.Union[numbers.Real, str], mode:typing.Optional[CountingMode]=None, rate:typing.Optional[int]=None, *, rounding:str="nearest", real_rate:typing.Optional[numbers.Rational]=None) -> "TimecodeRange":
+		"""Create a range between two wall-clock times in seconds, rounding each end so neighbouring ranges stay back-to-back (see `clock`)"""
+
+		from . import clock
+		timebase = Timecode._normalize_mode(mode).get_timebase(rate)
+		start, end = (clock.frame_at_seconds(x, timebase, rounding=rounding, real_rate=real_rate) for x in (start, end))
+		return cls(start=Timecode._from_validated(start, timebase), end=Timecode._from_validated(end, timebase))
+
+	def to_samples(self, sample_rate:int=48000, *, rounding:str="nearest", real_rate:typing.Optional[numbers.Rational]=None) -> typing.Tuple[int, int]:
+		"""The audio sample positions of the start and (exclusive) end of this range (see `clock`)"""
+
+		from . import clock
+		return tuple(clock.samples_of(x, self._timebase, sample_rate=sample_rate, rounding=rounding, real_rate=real_rate) for x in (self._start, self._end))
+
+	@classmethod
+	def from_samples(cls, start:int, end:int, mode:typing.Optional[CountingMode]=None, rate:typing.Optional[int]=None, *, sample_rate:int=48000, rounding:str="nearest", real_rate:typing.Optional[numbers.Rational]=None) -> "TimecodeRange":
+		"""Create a range between two audio sample positions (see `from_seconds()`)"""
+
+		from . import clock
+		timebase = Timecode._normalize_mode(mode).get_timebase(rate)
+		start, end = (clock.frame_at_samples(x, timebase, sample_rate=sample_rate, rounding=rounding, real_rate=real_rate) for x in (start, end))
+		return cls(start=Timecode._from_validated(start, timebase), end=Timecode._from_validated(end, timebase))
+
+	def iter_strings(self) -> typing.Iterator[str]:
+		"""Format every timecode in this range as a string, much quicker than ``str()`` on each (see `CountingMode.iter_strings()`)"""
+		return self.mode.iter_strings(self._start, self._end - self._start, self.rate)
+
+	def iter_bytes(self) -> typing.Iterator[bytes]:
+		"""Format every timecode in this range as an ASCII ``bytes`` string (see `iter_strings()`)"""
+		return self.mode.iter_bytes(self._start, self._end - self._start, self.rate)
+
+	def _frame_range(self) -> range:
+		"""The frame numbers in this range, as a `range`"""
+		return range(self._start, self._end)
+	
+	def index(self, timecode:typing.Union[Timecode,str,int]) -> int:
+		"""The position of a timecode within this range"""
+		
+		if timecode not in self:
+			raise ValueError(f"{timecode} is not in {self}")
+		
+		if not isinstance(timecode, Timecode):
+			timecode = Timecode(timecode, rate=self.rate, mode=self.mode)
+		
+		return timecode.frame_number - self._start
+	
+	def count(self, timecode:typing.Union[Timecode,str,int]) -> int:
+		"""The number of times a timecode occurs in this range (``0`` or ``1``)"""
+		return int(timecode in self)
 	
 	def __len__(self) -> int:
-		return abs(int(self.duration))
+		return abs(self._end - self._start)
 	
 	def __iter__(self) -> typing.Iterator["Timecode"]:
-		return (self.start.__class__(x, mode=self.mode, rate=self.rate) for x in range(self.start.frame_number, self.end.frame_number))
+		from_validated = Timecode._from_validated
+		timebase = self._timebase
+		return (from_validated(x, timebase) for x in range(self._start, self._end))
+	
+	def __reversed__(self) -> typing.Iterator["Timecode"]:
+		from_validated = Timecode._from_validated
+		timebase = self._timebase
+		return (from_validated(x, timebase) for x in reversed(range(self._start, self._end)))
+	
+	def __getitem__(self, key:typing.Union[int, slice]) -> typing.Union[Timecode, "TimecodeRange", "StridedTimecodeRange"]:
+		"""Get a timecode by position, or a slice of this range (without building each timecode)"""
+
+		frame_range = self._frame_range()
+
+		if isinstance(key, slice):
+			return StridedTimecodeRange._from_frame_range(frame_range[key], self._timebase)
+		
+		try:
+			return Timecode._from_validated(frame_range[key], self._timebase)
+		except IndexError:
+			raise IndexError(f"{self.__class__.__name__} index out of range") from None
 	
 	def __repr__(self) -> str:
-		return f"<{self.__class__.__name__} {self.start} - {self.end} ({str(self.duration.frame_number).lstrip('00:')}) @ {self.rate} {self.mode}>"
+		return f"<{self.__class__.__name__} {self.start} - {self.end} ({self._end - self._start}) @ {self.rate} {self.mode}>"
 	
 	def __contains__(self, other) -> bool:
 
 		# Compare `TimecodeRange` instances
-		if isinstance(other, self.__class__):
-			return self.start <= other.start and self.end >= other.end
+		if isinstance(other, TimecodeRange):
+			return other._timebase is self._timebase and self._start <= other._start and self._end >= other._end
 
-		# Compare `Timecode` instances (or convert to `Timecode` if it isn't)
+		# Compare `Timecode` instances (or frame numbers, or convert to `Timecode` if it isn't)
 		if isinstance(other, Timecode):
-			if other.rate != self.rate or type(other.mode) is not type(self.mode):
+			if other.timebase is not self._timebase:
 				return False
+			frame_number = other.frame_number
+		elif isinstance(other, int):
+			frame_number = other
 		else:
-			other = Timecode(other, rate=self.rate, mode=self.mode)
+			frame_number = Timecode(other, rate=self.rate, mode=self.mode).frame_number
 		
-		return self.start.frame_number<=other.frame_number and self.end.frame_number>other.frame_number
\ No newline at end of file
+		return self._start <= frame_number < self._end
+	
+	def __hash__(self) -> int:
+		return hash((self._start, self._end, self._timebase))
+	
+	# Comparisons (by start, then end)
+
+	def _is_compatible(self, other:typing.Any) -> bool:
+		"""Determine if an object can be compared properly to TimecodeRange"""
+		if isinstance(other, TimecodeRange):
+			return self._timebase is other._timebase
+		raise TypeError(f"Cannot compare {self.__class__.__name__} to {other.__class__.__name__}")
+
+	def __eq__(self, other) -> bool:
+		if not isinstance(other, TimecodeRange):
+			return NotImplemented
+		return self._timebase is other._timebase and self._start == other._start and self._end == other._end
+	
+	def __lt__(self, other) -> bool:
+		return self._is_compatible(other) and (self._start, self._end) < (other._start, other._end)
+	
+	def __le__(self, other) -> bool:
+		return self._is_compatible(other) and (self._start, self._end) <= (other._start, other._end)
+	
+	def __gt__(self, other) -> bool:
+		return self._is_compatible(other) and (self._start, self._end) > (other._start, other._end)
+	
+	def __ge__(self, other) -> bool:
+		return self._is_compatible(other) and (self._start, self._end) >= (other._start, other._end)
+
+class StridedTimecodeRange:
+	"""Every Nth timecode between a specified range, as a lazy view (see `TimecodeRange.__getitem__()`)"""
+
+	__slots__ = ("_frame_range", "_timebase")
+
+	def __init__(self, tc_range:TimecodeRange, step:int=1):
+
+		if not isinstance(step, int) or step == 0:
+			raise ValueError("Step must be a non-zero integer")
+
+		self._frame_range = tc_range._frame_range()[::step]
+		self._timebase = tc_range.timebase
+	
+	@classmethod
+	def _from_frame_range(cls, frame_range:range, timebase:Timebase) -> typing.Union["StridedTimecodeRange", TimecodeRange]:
+		"""Wrap an already-validated `range` of frame numbers, as a `TimecodeRange` if it is unbroken"""
+
+		if frame_range.step == 1:
+			return TimecodeRange._from_validated(frame_range.start, len(frame_range), timebase)
+
+		strided = cls.__new__(cls)
+		strided._frame_range = frame_range
+		strided._timebase = timebase
+		return strided
+	
+	@property
+	def start(self) -> Timecode:
+		"""The first timecode in this view"""
+		return Timecode._from_validated(self._frame_range.start, self._timebase)
+	
+	@property
+	def step(self) -> int:
+		"""The number of frames between each timecode (negative when stepping backwards)"""
+		return self._frame_range.step
+	
+	@property
+	def rate(self) -> int:
+		return self._timebase.rate
+	
+	@property
+	def mode(self) -> CountingMode:
+		return self._timebase.mode
+	
+	@property
+	def timebase(self) -> Timebase:
+		"""The (shared) counting mode and rate of this view"""
+		return self._timebase
+	
+	def _frame_number_of(self, timecode:typing.Union[Timecode,str,int]) -> typing.Optional[int]:
+		"""Get the frame number of a timecode in this timebase, or `None` if it isn't compatible"""
+
+		if isinstance(timecode, Timecode):
+			return timecode.frame_number if timecode.timebase is self._timebase else None
+		return Timecode(timecode, rate=self.rate, mode=self.mode).frame_number
+	
+	def index(self, timecode:typing.Union[Timecode,str,int]) -> int:
+		"""The position of a timecode within this view"""
+
+		if timecode not in self:
+			raise ValueError(f"{timecode} is not in {self}")
+		return self._frame_range.index(self._frame_number_of(timecode))
+	
+	def count(self, timecode:typing.Union[Timecode,str,int]) -> int:
+		"""The number of times a timecode occurs in this view (``0`` or ``1``)"""
+		return int(timecode in self)
+	
+	def __len__(self) -> int:
+		return len(self._frame_range)
+	
+	def __iter__(self) -> typing.Iterator[Timecode]:
+		from_validated = Timecode._from_validated
+		timebase = self._timebase
+		return (from_validated(x, timebase) for x in self._frame_range)
+	
+	def __reversed__(self) -> typing.Iterator[Timecode]:
+		from_validated = Timecode._from_validated
+		timebase = self._timebase
+		return (from_validated(x, timebase) for x in reversed(self._frame_range))
+	
+	def __getitem__(self, key:typing.Union[int, slice]) -> typing.Union[Timecode, TimecodeRange, "StridedTimecodeRange"]:
+
+		if isinstance(key, slice):
+			return self._from_frame_range(self._frame_range[key], self._timebase)
+
+		try:
+			return Timecode._from_validated(self._frame_range[key], self._timebase)
+		except IndexError:
+			raise IndexError(f"{self.__class__.__name__} index out of range") from None
+	
+	def __contains__(self, other) -> bool:
+		frame_number = self._frame_number_of(other)
+		return frame_number is not None and frame_number in self._frame_range
+	
+	def __eq__(self, other) -> bool:
+		if not isinstance(other, self.__class__):
+			return NotImplemented
+		return self._timebase is other._timebase and self._frame_range == other._frame_range
+	
+	def __hash__(self) -> int:
+		return hash((self._frame_range, self._timebase))
+	
+	def __repr__(self) -> str:
+		return f"<{self.__class__.__name__} {self.start} every {self.step} ({len(self)}) @ {self.rate} {self.mode}>"
@@ -0,0 +1,267 @@
+"""Contains the `TimecodeRangeSet` class, which represents a set of frames as sorted, non-overlapping ranges"""
+
+import bisect, heapq, typing
+from . import Timecode, TimecodeRange
+from .modes import Timebase
+
+class TimecodeRangeSet:
+	"""A set of frames, stored as sorted, non-overlapping `TimecodeRange`s
+
+	Overlapping and adjacent ranges are coalesced as they are added, so that lookups are binary searches over the
+	range boundaries.  All ranges must share the same counting mode and rate.
+	"""
+
+	__slots__ = ("_timebase", "_starts", "_ends")
+
+	def __init__(self, ranges:typing.Iterable[TimecodeRange]=()):
+
+		self._timebase:typing.Optional[Timebase] = None
+		self._starts:typing.List[int] = []
+		self._ends:typing.List[int] = []
+
+		for tc_range in ranges:
+			self.add(tc_range)
+
+	@classmethod
+	def _from_bounds(cls, starts:typing.List[int], ends:typing.List[int], timebase:typing.Optional[Timebase]) -> "TimecodeRangeSet":
+		"""Create a set directly from already-coalesced range boundaries"""
+
+		range_set = cls.__new__(cls)
+		range_set._timebase = timebase
+		range_set._starts = starts
+		range_set._ends = ends
+		return range_set
+
+	def _check_timebase(self, timebase:Timebase, adopt:bool=False):
+		"""Make sure a timebase is compatible with this set (see `TimecodeRange._get_common_timebase()`)
+
+		An empty set has nothing to be compatible with.  It takes on the timebase if ``adopt`` is set, which only
+		methods adding to the set should do.
+		"""
+
+		if self._timebase is None or not self._starts:
+			if adopt:
+				self._timebase = timebase
+		elif timebase is not self._timebase:
+			TimecodeRange._get_common_timebase(Timecode._from_validated(0, self._timebase), Timecode._from_validated(0, timebase))
+
+	def _bounds_of(self, other:typing.Union[TimecodeRange, Timecode, int, str], adopt:bool=False) -> typing.Tuple[int, int]:
+		"""Get the frame boundaries of a range or single frame, checking (or adopting) the timebase along the way"""
+
+		if isinstance(other, TimecodeRange):
+			self._check_timebase(other.timebase, adopt)
+			return (other._start, other._end)
+
+		if not isinstance(other, Timecode):
+			other = Timecode(other, mode=self.timebase.mode, rate=self.timebase.rate)
+
+		self._check_timebase(other.timebase, adopt)
+		return (other.frame_number, other.frame_number + 1)
+
+	@property
+	def timebase(self) -> Timebase:
+		"""The (shared) counting mode and rate of the ranges in this set"""
+		return self._timebase or Timecode.DEFAULT_MODE.get_timebase()
+
+	@property
+	def duration(self) -> Timecode:
+		"""The total number of frames in this set"""
+		return Timecode._from_validated(sum(end - start for start, end in zip(self._starts, self._ends)), self.timebase)
+
+	# Modifying the set
+
+	def add(self, tc_range:TimecodeRange):
+		"""Add a range to the set, coalescing it with any overlapping or adjacent ranges"""
+
+		start, end = self._bounds_of(tc_range, adopt=True)
+		if start >= end:
+			return
+
+		# Ranges touching or overlapping the new range will be merged into it
+		first = bisect.bisect_left(self._ends, start)
+		last  = bisect.bisect_right(self._starts, end)
+
+		if first < last:
+			start = min(start, self._starts[first])
+			end   = max(end, self._ends[last-1])
+
+		self._starts[first:last] = [start]
+		self._ends[first:last]   = [end]
+
+	def discard(self, tc_range:TimecodeRange):
+		"""Remove a range of frames from the set"""
+
+		start, end = self._bounds_of(tc_range)
+		if start >= end:
+			return
+
+		first = bisect.bisect_right(self._ends, start)
+		last  = bisect.bisect_left(self._starts, end)
+
+		if first >= last:
+			return
+
+		# Keep whatever hangs off either side of the removed range
+		new_starts, new_ends = [], []
+		if self._starts[first] < start:
+			new_starts.append(self._starts[first])
+			new_ends.append(start)
+		if self._ends[last-1] > end:
+			new_starts.append(end)
+			new_ends.append(self._ends[last-1])
+
+		self._starts[first:last] = new_starts
+		self._ends[first:last]   = new_ends
+
+	def copy(self) -> "TimecodeRangeSet":
+		"""A shallow copy of this set"""
+		return self._from_bounds(self._starts[:], self._ends[:], self._timebase)
+
+	# Queries
+
+	def overlapping(self, tc_range:TimecodeRange) -> typing.List[TimecodeRange]:
+		"""The ranges in this set which share at least one frame with the given range"""
+
+		start, end = self._bounds_of(tc_range)
+		if start >= end:
+			return []
+
+		first = bisect.bisect_right(self._ends, start)
+		last  = bisect.bisect_left(self._starts, end)
+
+		return [self._make_range(idx) for idx in range(first, last)]
+
+	def overlaps(self, tc_range:TimecodeRange) -> bool:
+		"""Does the given range share at least one frame with this set"""
+
+		start, end = self._bounds_of(tc_range)
+		first = bisect.bisect_right(self._ends, start)
+		return first < len(self._starts) and self._starts[first] < end and start < end
+
+	def gaps(self, within:typing.Optional[TimecodeRange]=None) -> "TimecodeRangeSet":
+		"""The frames missing between the ranges in this set (optionally including the edges of a given range)"""
+
+		if within is None:
+			return self._from_bounds(self._ends[:-1], self._starts[1:], self._timebase)
+
+		start, end = self._bounds_of(within)
+		timebase = self._timebase if self._starts or not isinstance(within, TimecodeRange) else within.timebase
+		if start >= end:
+			return self._from_bounds([], [], timebase)
+
+		return self._from_bounds([start], [end], timebase) - self
+
+	@classmethod
+	def find_overlaps(cls, ranges:typing.Sequence[TimecodeRange]) -> typing.List[typing.Tuple[int, int]]:
+		"""Find every pair of overlapping ranges in a list, by index, in O(n log n + k)
+
+		Handy for checking an edit for overlapping events without comparing every event to every other event.
+		"""
+
+		# Same rules as always: one mode, one rate
+		TimecodeRange._get_common_timebase(*(r.start for r in ranges))
+		bounds = [(r._start, r._end, idx) for idx, r in enumerate(ranges)]
+
+		overlaps = []
+		active = []	# Heap of (end, index) for ranges which have started but not ended
+
+		for start, end, idx in sorted(bounds):
+			while active and active[0][0] <= start:
+				heapq.heappop(active)
+			if start < end:
+				overlaps.extend((min(other, idx), max(other, idx)) for _, other in active)
+				heapq.heappush(active, (end, idx))
+
+		return overlaps
+
+	def _make_range(self, idx:int) -> TimecodeRange:
+		return TimecodeRange._from_validated(self._starts[idx], self._ends[idx] - self._starts[idx], self.timebase)
+
+	# Set operations
+
+	def _other_bounds(self, other:typing.Union["TimecodeRangeSet", TimecodeRange], adopt:bool=False) -> typing.Tuple[typing.List[int], typing.List[int]]:
+		"""Get the (coalesced) boundaries of another set or range, checking (or adopting) the timebase along the way"""
+
+		if isinstance(other, TimecodeRange):
+			other = self.__class__([other])
+		elif not isinstance(other, self.__class__):
+			raise TypeError(f"Cannot combine {self.__class__.__name__} with {other.__class__.__name__}")
+
+		if other._starts:
+			self._check_timebase(other._timebase, adopt)
+
+		return other._starts, other._ends
+
+	def union(self, other:typing.Union["TimecodeRangeSet", TimecodeRange]) -> "TimecodeRangeSet":
+		"""Frames in either set"""
+
+		result = self.copy()
+		for start, end in zip(*result._other_bounds(other, adopt=True)):
+			result.add(TimecodeRange._from_validated(start, end - start, result.timebase))
+		return result
+
+	def intersection(self, other:typing.Union["TimecodeRangeSet", TimecodeRange]) -> "TimecodeRangeSet":
+		"""Frames in both sets"""
+
+		other_starts, other_ends = self._other_bounds(other)
+		starts, ends = [], []
+
+		# Walk both sorted lists together
+		idx_self = idx_other = 0
+		while idx_self < len(self._starts) and idx_other < len(other_starts):
+			start = max(self._starts[idx_self], other_starts[idx_other])
+			end = min(self._ends[idx_self], other_ends[idx_other])
+			if start < end:
+				starts.append(start)
+				ends.append(end)
+			if self._ends[idx_self] < other_ends[idx_other]:
+				idx_self += 1
+			else:
+				idx_other += 1
+
+		return self._from_bounds(starts, ends, self._timebase)
+
+	def difference(self, other:typing.Union["TimecodeRangeSet", TimecodeRange]) -> "TimecodeRangeSet":
+		"""Frames in this set, but not the other"""
+
+		result = self.copy()
+		for start, end in zip(*result._other_bounds(other)):
+			result.discard(TimecodeRange._from_validated(start, end - start, result.timebase))
+		return result
+
+	__or__  = union
+	__and__ = intersection
+	__sub__ = difference
+
+	# Container stuff
+
+	def __contains__(self, other:typing.Union[TimecodeRange, Timecode, int, str]) -> bool:
+
+		if isinstance(other, Timecode) and self._starts and other.timebase is not self._timebase:
+			return False
+		if isinstance(other, TimecodeRange) and self._starts and other.timebase is not self._timebase:
+			return False
+
+		start, end = self._bounds_of(other)
+		idx = bisect.bisect_right(self._starts, start) - 1
+		return idx >= 0 and self._ends[idx] >= end
+
+	def __iter__(self) -> typing.Iterator[TimecodeRange]:
+		return (self._make_range(idx) for idx in range(len(self._starts)))
+
+	def __len__(self) -> int:
+		return len(self._starts)
+
+	def __bool__(self) -> bool:
+		return bool(self._starts)
+
+	def __eq__(self, other) -> bool:
+		if not isinstance(other, self.__class__):
+			return NotImplemented
+		return self._starts == other._starts and self._ends == other._ends and (not self or self._timebase is other._timebase)
+
+	__hash__ = None
+
+	def __repr__(self) -> str:
+		ranges = ", ".join(f"{r.start} - {r.end}" for r in self)
+		return f"<{self.__class__.__name__} [{ranges}] ({len(self)}) @ {self.timebase.rate} {self.timebase.mode}>"
@@ -0,0 +1,384 @@
+"""Contains the `Timeline` class, which maps record timecodes to source timecodes (and back) across an edit"""
+
+import array, bisect, fractions, typing
+from . import Timecode, TimecodeRange
+from .modes import Timebase
+from .timecodeindex import _EndsTree
+
+class TimelineEvent(typing.NamedTuple):
+	"""An event on a `Timeline`"""
+
+	source:TimecodeRange
+	"""The source frames from the first to the last one the event shows"""
+
+	record:TimecodeRange
+	"""Where the event sits on the timeline"""
+
+	speed:fractions.Fraction
+	"""Source frames played per record frame (negative when playing backwards)"""
+
+	reel:typing.Optional[str]
+	"""The source reel (or clip) name, if known"""
+
+class MappedFrames(typing.NamedTuple):
+	"""Frame numbers mapped in bulk from one side of a `Timeline` to the other"""
+
+	positions:typing.Union[array.array, typing.Any]
+	"""The position of the event each frame was mapped through, or ``-1`` if there wasn't one"""
+
+	frame_numbers:typing.Union[array.array, typing.Any]
+	"""The mapped frame numbers (``0`` where there was no event)"""
+
+class Timeline:
+	"""A sequence of events, each playing a source range at a record range, for mapping between the two
+
+	Events are kept in packed arrays sorted by record start, so a record timecode is mapped to its source in a binary
+	search.  Record ranges may not overlap.  Mapping source timecodes back to the record uses a second index over the
+	source ranges, built when it's first needed after the timeline changes.
+
+	Edits aren't free: inserting or removing an event moves every later one along the arrays (and with ``ripple``,
+	shifts their record ranges) in ``O(n)``, and the next source lookup rebuilds the source index in ``O(n log n)``.
+	Make a run of edits before mapping source timecodes, rather than interleaving them.
+
+	>>> from timecode import ingest
+	>>> timeline = Timeline.from_edl(ingest.read_edl("reel1.edl"))
+	>>> timeline.record_to_source(Timecode("01:00:10:00"))
+	<Timecode 14:22:03:17 @ 30 NDF>
+	"""
+
+	__slots__ = ("_record_timebase", "_source_timebase", "_record_starts", "_record_ends", "_source_starts", "_speed_numerators", "_speed_denominators", "_reels", "_source_index")
+
+	def __init__(self, events:typing.Iterable[typing.Tuple[TimecodeRange, TimecodeRange]]=()):
+
+		self._record_timebase:typing.Optional[Timebase] = None
+		self._source_timebase:typing.Optional[Timebase] = None
+
+		self._record_starts = array.array("q")
+		self._record_ends = array.array("q")
+		self._source_starts = array.array("q")	# The source frame playing at the record start
+		self._speed_numerators = array.array("q")
+		self._speed_denominators = array.array("q")
+		self._reels:typing.List[typing.Optional[str]] = []
+
+		self._source_index = None
+
+		for source, record in events:
+			self.insert(source, record)
+
+	@classmethod
+	def from_edl(cls, events:typing.Iterable["ingest.EdlEvent"]) -> "Timeline":
+		"""Create a timeline from EDL events (see `ingest.read_edl()`), keeping the reel names
+
+		EDLs may switch between drop-frame and non-drop-frame part way through.  Events are counted in the mode of the
+		first one; at the same rate, that only changes their labels.
+		"""
+
+		timeline = cls()
+		for event in events:
+			source, record = event.source, event.record
+			if timeline._record_starts:
+				if source.timebase is not timeline._source_timebase and source.rate == timeline._source_timebase.rate:
+					source = source.resample(mode=timeline._source_timebase.mode)
+				if record.timebase is not timeline._record_timebase and record.rate == timeline._record_timebase.rate:
+					record = record.resample(mode=timeline._record_timebase.mode)
+			timeline.insert(source, record, reel=event.reel)
+		return timeline
+
+	@property
+	def record_timebase(self) -> Timebase:
+		"""The counting mode and rate of the record side"""
+		return self._record_timebase or Timecode.DEFAULT_MODE.get_timebase()
+
+	@property
+	def source_timebase(self) -> Timebase:
+		"""The counting mode and rate of the source side"""
+		return self._source_timebase or Timecode.DEFAULT_MODE.get_timebase()
+
+	def _check_timebases(self, source:TimecodeRange, record:TimecodeRange):
+		"""Adopt the timebases if this timeline is empty, or otherwise make sure they match"""
+
+		if not self._record_starts:
+			self._source_timebase = source.timebase
+			self._record_timebase = record.timebase
+		elif source.timebase is not self._source_timebase:
+			raise ValueError(f"Expected a source range at {self._source_timebase.rate} {self._source_timebase.mode} (got {source.rate} {source.mode})")
+		elif record.timebase is not self._record_timebase:
+			raise ValueError(f"Expected a record range at {self._record_timebase.rate} {self._record_timebase.mode} (got {record.rate} {record.mode})")
+
+	def _frame_number_of(self, timecode:typing.Union[Timecode, str, int], timebase:Timebase) -> int:
+		"""Get the frame number of a query, checking its timebase"""
+
+		if isinstance(timecode, Timecode):
+			if timecode.timebase is not timebase:
+				raise ValueError(f"Expected a timecode at {timebase.rate} {timebase.mode} (got {timecode.rate} {timecode.mode})")
+			return timecode.frame_number
+		elif isinstance(timecode, int):
+			return timecode
+		return Timecode(timecode, mode=timebase.mode, rate=timebase.rate).frame_number
+
+	# Events
+
+	def _source_offset(self, idx:int, record_offset:int) -> int:
+		"""How far from its first source frame an event has played after some record frames
+
+		Partial source frames are rounded towards the first one, whichever way the event plays, so a backwards event
+		never reads past the end of its source.
+		"""
+
+		numerator, denominator = self._speed_numerators[idx], self._speed_denominators[idx]
+		if numerator > 0:
+			return record_offset * numerator // denominator
+		return -(record_offset * -numerator // denominator)
+
+	def _source_extent(self, idx:int) -> typing.Tuple[int, int]:
+		"""The source frames between the first and last ones an event shows, as ``(start, end)``"""
+
+		duration = self._record_ends[idx] - self._record_starts[idx]
+		source_start = self._source_starts[idx]
+
+		if duration <= 0:
+			return source_start, source_start
+
+		last = source_start + self._source_offset(idx, duration - 1)
+		return (source_start, last + 1) if last >= source_start else (last, source_start + 1)
+
+	def _make_event(self, idx:int) -> TimelineEvent:
+		source_start, source_end = self._source_extent(idx)
+		record_start = self._record_starts[idx]
+		return TimelineEvent(
+			TimecodeRange._from_validated(source_start, source_end - source_start, self._source_timebase),
+			TimecodeRange._from_validated(record_start, self._record_ends[idx] - record_start, self._record_timebase),
+			fractions.Fraction(self._speed_numerators[idx], self._speed_denominators[idx]),
+			self._reels[idx],
+		)
+
+	def insert(self, source:TimecodeRange, record:TimecodeRange, *, speed:typing.Union[fractions.Fraction, int, None]=None, reel:typing.Optional[str]=None, ripple:bool=False) -> int:
+		"""Add an event, returning its position
+
+		The ``speed`` defaults to the source duration over the record duration, so a source range longer than its
+		record range plays faster.  A negative ``speed`` plays backwards, starting from the last frame of the source.
+
+		With ``ripple``, every event from the record start onwards is pushed later to make room; otherwise the record
+		range must fit in a gap.  Either way, an event can't be inserted part way into another.
+		"""
+
+		self._check_timebases(source, record)
+
+		record_start, record_end = record._start, record._end
+		duration = record_end - record_start
+
+		if speed is None:
+			speed = fractions.Fraction(len(source), duration) if duration else fractions.Fraction(1)
+		speed = fractions.Fraction(speed)
+		if speed == 0:
+			raise ValueError("Speed must not be zero")
+
+		source_start = source._start if speed > 0 else source._end - 1
+
+		starts, ends = self._record_starts, self._record_ends
+		idx = bisect.bisect_left(starts, record_start)
+
+		if idx > 0 and ends[idx - 1] > record_start:
+			raise ValueError(f"{record} starts part way into the event at {self._make_event(idx - 1).record}")
+
+		if ripple:
+			starts[idx:] = array.array("q", [x + duration for x in starts[idx:]])
+			ends[idx:] = array.array("q", [x + duration for x in ends[idx:]])
+		elif idx < len(starts) and starts[idx] < record_end:
+			raise ValueError(f"{record} overlaps the event at {self._make_event(idx).record}")
+
+		starts.insert(idx, record_start)
+		ends.insert(idx, record_end)
+		self._source_starts.insert(idx, source_start)
+		self._speed_numerators.insert(idx, speed.numerator)
+		self._speed_denominators.insert(idx, speed.denominator)
+		self._reels.insert(idx, reel)
+
+		self._source_index = None
+		return idx
+
+	def remove(self, timecode:typing.Union[Timecode, str, int], *, ripple:bool=False) -> TimelineEvent:
+		"""Take out the event playing at a record timecode, returning it
+
+		With ``ripple``, every later event is pulled earlier to close the gap.
+		"""
+
+		idx = self._position_at(self._frame_number_of(timecode, self.record_timebase))
+		if idx < 0:
+			raise ValueError(f"There is no event at {timecode}")
+		return self.pop(idx, ripple=ripple)
+
+	def pop(self, idx:int=-1, *, ripple:bool=False) -> TimelineEvent:
+		"""Take out the event at a position, returning it (see `remove()`)"""
+
+		idx = range(len(self))[idx]
+		event = self._make_event(idx)
+
+		starts, ends = self._record_starts, self._record_ends
+		duration = ends[idx] - starts[idx]
+
+		for column in (starts, ends, self._source_starts, self._speed_numerators, self._speed_denominators, self._reels):
+			del column[idx]
+
+		if ripple:
+			starts[idx:] = array.array("q", [x - duration for x in starts[idx:]])
+			ends[idx:] = array.array("q", [x - duration for x in ends[idx:]])
+
+		self._source_index = None
+		return event
+
+	# Record to source
+
+	def _position_at(self, frame_number:int) -> int:
+		"""The position of the event playing at a record frame, or ``-1``"""
+
+		idx = bisect.bisect_right(self._record_starts, frame_number) - 1
+		return idx if idx >= 0 and self._record_ends[idx] > frame_number else -1
+
+	def _to_source(self, idx:int, frame_number:int) -> int:
+		return self._source_starts[idx] + self._source_offset(idx, frame_number - self._record_starts[idx])
+
+	def find(self, timecode:typing.Union[Timecode, str, int]) -> typing.Optional[TimelineEvent]:
+		"""The event playing at a record timecode, or `None` in a gap"""
+
+		idx = self._position_at(self._frame_number_of(timecode, self.record_timebase))
+		return self._make_event(idx) if idx >= 0 else None
+
+	def record_to_source(self, timecode:typing.Union[Timecode, str, int]) -> typing.Optional[Timecode]:
+		"""The source timecode playing at a record timecode, or `None` in a gap"""
+
+		frame_number = self._frame_number_of(timecode, self.record_timebase)
+		idx = self._position_at(frame_number)
+		return Timecode._from_validated(self._to_source(idx, frame_number), self._source_timebase) if idx >= 0 else None
+
+	def record_to_source_many(self, timecodes:typing.Iterable[typing.Union[Timecode, str, int]]) -> MappedFrames:
+		"""Map many record timecodes to source frame numbers
+
+		NumPy arrays of frame numbers are mapped in one vectorized search, and return NumPy arrays.  Anything else
+		returns ``array('q')``s.
+		"""
+
+		if hasattr(timecodes, "dtype"):
+			return self._record_to_source_vectorized(timecodes)
+
+		position_at = self._position_at
+		to_source = self._to_source
+		frame_number_of = self._frame_number_of
+		timebase = self.record_timebase
+
+		positions, frame_numbers = array.array("q"), array.array("q")
+		for timecode in timecodes:
+			frame_number = frame_number_of(timecode, timebase)
+			idx = position_at(frame_number)
+			positions.append(idx)
+			frame_numbers.append(to_source(idx, frame_number) if idx >= 0 else 0)
+
+		return MappedFrames(positions, frame_numbers)
+
+	def _record_to_source_vectorized(self, frame_numbers) -> MappedFrames:
+		import numpy
+
+		frame_numbers = numpy.asarray(frame_numbers, dtype=numpy.int64)
+
+		if not self._record_starts:
+			return MappedFrames(numpy.full(frame_numbers.shape, -1, dtype=numpy.int64), numpy.zeros(frame_numbers.shape, dtype=numpy.int64))
+
+		starts = numpy.frombuffer(self._record_starts, dtype=numpy.int64)
+		ends = numpy.frombuffer(self._record_ends, dtype=numpy.int64)
+
+		positions = numpy.searchsorted(starts, frame_numbers, side="right") - 1
+		clipped = numpy.clip(positions, 0, None)
+		found = (positions >= 0) & (ends[clipped] > frame_numbers)
+
+		# Rounded towards the first source frame either way, as in `_source_offset()`
+		numerators = numpy.frombuffer(self._speed_numerators, dtype=numpy.int64)[clipped]
+		offsets = (frame_numbers - starts[clipped]) * numpy.abs(numerators) // numpy.frombuffer(self._speed_denominators, dtype=numpy.int64)[clipped] * numpy.sign(numerators)
+		mapped = numpy.frombuffer(self._source_starts, dtype=numpy.int64)[clipped] + offsets
+
+		return MappedFrames(numpy.where(found, positions, -1), numpy.where(found, mapped, 0))
+
+	# Source to record
+
+	def _get_source_index(self) -> typing.Tuple[array.array, _EndsTree, array.array]:
+		"""Source extents sorted by start, a tree of how far they reach (see `TimecodeIndex`), and their event positions"""
+
+		if self._source_index is None:
+			extents = sorted((*self._source_extent(idx), idx) for idx in range(len(self)))
+			starts = array.array("q", (start for start, _, _ in extents))
+			self._source_index = (
+				starts,
+				_EndsTree(starts, array.array("q", (end for _, end, _ in extents))),
+				array.array("q", (idx for _, _, idx in extents)),
+			)
+		return self._source_index
+
+	def _positions_playing(self, frame_number:int, reel:typing.Optional[str]) -> typing.List[int]:
+		"""Positions of the events which pass over a source frame, in record order"""
+
+		starts, ends_tree, order = self._get_source_index()
+		reels = self._reels
+
+		positions = [order[idx] for idx in ends_tree.all_reaching(bisect.bisect_right(starts, frame_number), frame_number)]
+		if reel is not None:
+			positions = [idx for idx in positions if reels[idx] == reel]
+
+		positions.sort()
+		return positions
+
+	def _to_record(self, idx:int, frame_number:int) -> int:
+		"""The first record frame of an event showing a source frame (or the next one, if it's skipped over)"""
+
+		offset = frame_number - self._source_starts[idx]
+		numerator, denominator = self._speed_numerators[idx], self._speed_denominators[idx]
+
+		# The first record frame whose source offset reaches this far, in whichever direction the event plays
+		if numerator > 0:
+			return self._record_starts[idx] - (-offset * denominator // numerator)
+		return self._record_starts[idx] + max(-(offset * denominator // -numerator), 0)
+
+	def source_to_record(self, timecode:typing.Union[Timecode, str, int], *, reel:typing.Optional[str]=None) -> typing.List[Timecode]:
+		"""Every record timecode where a source timecode plays (from the given reel, if any), in record order
+
+		When a source frame is held for several record frames, the first one is given.  When a speed-up skips over it,
+		the record frame just after is given.
+		"""
+
+		frame_number = self._frame_number_of(timecode, self.source_timebase)
+		from_validated = Timecode._from_validated
+		return [from_validated(self._to_record(idx, frame_number), self._record_timebase) for idx in self._positions_playing(frame_number, reel)]
+
+	def source_to_record_many(self, timecodes:typing.Iterable[typing.Union[Timecode, str, int]], *, reel:typing.Optional[str]=None) -> MappedFrames:
+		"""Map many source timecodes to the first record frame number where each plays (see `source_to_record()`)"""
+
+		positions_playing = self._positions_playing
+		to_record = self._to_record
+		frame_number_of = self._frame_number_of
+		timebase = self.source_timebase
+
+		positions, frame_numbers = array.array("q"), array.array("q")
+		for timecode in timecodes:
+			frame_number = frame_number_of(timecode, timebase)
+			playing = positions_playing(frame_number, reel)
+			positions.append(playing[0] if playing else -1)
+			frame_numbers.append(to_record(playing[0], frame_number) if playing else 0)
+
+		return MappedFrames(positions, frame_numbers)
+
+	# Container stuff
+
+	def __len__(self) -> int:
+		return len(self._record_starts)
+
+	def __iter__(self) -> typing.Iterator[TimelineEvent]:
+		return (self._make_event(idx) for idx in range(len(self)))
+
+	def __getitem__(self, idx:int) -> TimelineEvent:
+		"""An event by its position in record order"""
+		return self._make_event(range(len(self))[idx])
+
+	def __repr__(self) -> str:
+		if not self._record_starts:
+			return f"<{self.__class__.__name__} (0) @ {self.record_timebase.rate} {self.record_timebase.mode}>"
+		first = Timecode._from_validated(self._record_starts[0], self._record_timebase)
+		last = Timecode._from_validated(self._record_ends[-1], self._record_timebase)
+		return f"<{self.__class__.__name__} {first} - {last} ({len(self)}) @ {self.record_timebase.rate} {self.record_timebase.mode}>"